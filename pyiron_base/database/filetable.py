@@ -7,9 +7,11 @@ File based database interface
 
 import datetime
 from collections.abc import Iterable
+from contextlib import closing
 import numpy as np
 import os
 import pandas
+import sqlite3
 from pyfileindex import PyFileIndex
 from pyiron_base.interfaces.singleton import Singleton
 from pyiron_base.database.generic import IsDatabase
@@ -53,8 +55,14 @@ class FileTable(IsDatabase, metaclass=Singleton):
         self._job_table = None
         self._project = os.path.abspath(project)
         self._columns = list(table_columns.keys())
+        self._extract_cache = {}
+        self._extract_cache_modified = False
         self.force_reset()
 
+    @property
+    def _cache_file_name(self):
+        return os.path.join(self._project, ".pyiron_filetable.db")
+
     def add_item_dict(self, par_dict):
         """
         Create a new database item
@@ -121,7 +129,14 @@ class FileTable(IsDatabase, metaclass=Singleton):
         self._fileindex = PyFileIndex(
             path=self._project, filter_function=filter_function
         )
+        self._load_extract_cache()
         df = pandas.DataFrame(self.init_table(fileindex=self._fileindex.dataframe))
+        self._extract_cache = {
+            path: self._extract_cache[path]
+            for path in self._fileindex.dataframe.path.values
+            if path in self._extract_cache.keys()
+        }
+        self._write_extract_cache()
         if len(df) != 0:
             df.id = df.id.astype(int)
             self._job_table = df[np.array(self._columns)]
@@ -160,6 +175,32 @@ class FileTable(IsDatabase, metaclass=Singleton):
                 ].id.values
             return sorted(id_lst)
 
+    def get_child_status_counts(self, master_id):
+        """
+        Count the child jobs of a master job grouped by their status.
+
+        Args:
+            master_id (int): job ID of the master job
+
+        Returns:
+            dict: number of child jobs for each status {status: count}
+        """
+        self.update()
+        df_master = self._job_table[self._job_table.id == int(master_id)]
+        if len(df_master) == 0:
+            return {}
+        working_directory = (df_master["project"] + df_master["job"] + "_hdf5/").values[
+            0
+        ]
+        return {
+            status: int(count)
+            for status, count in self._job_table[
+                self._job_table.project == working_directory
+            ]
+            .status.value_counts()
+            .items()
+        }
+
     def get_item_by_id(self, item_id):
         """
         Get item from database by searching for a specific item Id.
@@ -406,7 +447,7 @@ class FileTable(IsDatabase, metaclass=Singleton):
         job_lst = []
         for path, mtime in zip(fileindex.path, fileindex.mtime):
             try:  # Ignore HDF5 files which are not created by pyiron
-                job_dict = self.get_extract(path, mtime)
+                job_dict = self._get_extract_cached(path, mtime)
             except (ValueError, OSError):
                 pass
             else:
@@ -506,6 +547,7 @@ class FileTable(IsDatabase, metaclass=Singleton):
                     )
                 else:
                     self._job_table = df
+            self._write_extract_cache()
 
     @staticmethod
     def get_extract(path, mtime):
@@ -532,6 +574,87 @@ class FileTable(IsDatabase, metaclass=Singleton):
         del return_dict["masterid"]
         return return_dict
 
+    def _get_extract_cached(self, path, mtime):
+        """
+        Get the job information of an HDF5 file, the HDF5 file is only read when it was modified since the last time
+        it was read.
+
+        Args:
+            path (str): path of the HDF5 file
+            mtime (float): modification time of the HDF5 file
+
+        Returns:
+            dict: job information, see :meth:`.get_extract`
+
+        Raises:
+            ValueError: if the HDF5 file was not created by pyiron
+        """
+        if path in self._extract_cache.keys() and self._extract_cache[path][0] == mtime:
+            job_dict = self._extract_cache[path][1]
+        else:
+            try:
+                job_dict = self.get_extract(path, mtime)
+            except (ValueError, OSError):
+                job_dict = None
+            self._extract_cache[path] = (mtime, job_dict)
+            self._extract_cache_modified = True
+        if job_dict is None:
+            raise ValueError("{} is not a pyiron HDF5 file.".format(path))
+        return job_dict.copy()
+
+    def _load_extract_cache(self):
+        """
+        Load the job information extracted from the HDF5 files in a previous session from the cache file in the project
+        directory.
+        """
+        self._extract_cache = {}
+        self._extract_cache_modified = False
+        if not os.path.exists(self._cache_file_name):
+            return
+        try:
+            with closing(sqlite3.connect(self._cache_file_name)) as conn:
+                df = pandas.read_sql(
+                    "SELECT * FROM filetable",
+                    conn,
+                    parse_dates=["timestart", "timestop"],
+                )
+        except (sqlite3.Error, pandas.errors.DatabaseError):
+            return
+        for job_dict in df.to_dict(orient="records"):
+            path, mtime = job_dict.pop("path"), job_dict.pop("mtime")
+            if job_dict["job"] is None:
+                self._extract_cache[path] = (mtime, None)
+            else:
+                self._extract_cache[path] = (mtime, job_dict)
+
+    def _write_extract_cache(self):
+        """
+        Store the job information extracted from the HDF5 files together with their modification times in the cache
+        file in the project directory, so the next session only has to read the modified HDF5 files.
+        """
+        if not self._extract_cache_modified:
+            return
+        columns = [c for c in table_columns.keys() if c not in ["id", "masterid"]]
+        df = pandas.DataFrame(
+            [
+                dict(
+                    {"path": path, "mtime": mtime},
+                    **(job_dict if job_dict is not None else {}),
+                )
+                for path, (mtime, job_dict) in self._extract_cache.items()
+            ],
+            columns=["path", "mtime"] + columns,
+        )
+        try:
+            with closing(sqlite3.connect(self._cache_file_name)) as conn:
+                df.to_sql("filetable", conn, if_exists="replace", index=False)
+        except (
+            OSError,
+            sqlite3.Error,
+        ):  # the cache is optional, e.g. for read-only projects
+            return
+        self._extract_cache_modified = False
+
     def _get_job_status_from_hdf5(self, job_id):
         db_entry = self.get_item_by_id(job_id)
         job_name = db_entry["subjob"][1:]
@@ -548,19 +671,27 @@ class FileTable(IsDatabase, metaclass=Singleton):
         recursive=True,
         columns=None,
         element_lst=None,
+        filter_dict=None,
+        sort_by=None,
+        limit=None,
+        offset=None,
     ):
         self.update()
         if project_path is None:
             project_path = self._project
-        if len(self._job_table) != 0:
+        df = self._job_table
+        if len(df) != 0:
             if recursive:
-                return self._job_table[
-                    self._job_table.project.str.contains(project_path)
-                ]
+                df = df[df.project.str.contains(project_path)]
             else:
-                return self._job_table[self._job_table.project == project_path]
-        else:
-            return self._job_table
+                df = df[df.project == project_path]
+        return self._get_filtered_sorted_job_table(
+            df=df,
+            filter_dict=filter_dict,
+            sort_by=sort_by,
+            limit=limit,
+            offset=offset,
+        )
 
     def _get_table_headings(self, table_name=None):
         """
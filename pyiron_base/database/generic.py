@@ -21,6 +21,8 @@ from sqlalchemy import (
     Table,
     text,
     and_,
+    bindparam,
+    func,
     or_,
 )
 from sqlalchemy.pool import NullPool
@@ -80,9 +82,43 @@ class IsDatabase(ABC):
         recursive=True,
         columns=None,
         element_lst=None,
+        filter_dict=None,
+        sort_by=None,
+        limit=None,
+        offset=None,
     ):
+        """
+        Get the job table filtered by the column values in filter_dict, see _get_filtered_job_table(). If limit or
+        offset are given, only the corresponding rows of the table sorted by sort_by are returned.
+        """
         pass
 
+    @classmethod
+    def _get_filtered_sorted_job_table(
+        cls, df, filter_dict=None, sort_by=None, limit=None, offset=None
+    ):
+        """
+        Apply the filters, sorting and limits of _get_job_table() on a pandas.DataFrame
+
+        Args:
+            df (pandas.DataFrame): DataFrame to be filtered
+            filter_dict (dict/None): filters with keys matching the project database column name
+            sort_by (str/None): Sort by a specific column
+            limit (int/None): maximum number of rows
+            offset (int/None): number of rows to skip
+
+        Returns:
+            pandas.DataFrame: filtered DataFrame
+        """
+        if filter_dict is not None:
+            df = cls._get_filtered_job_table(df, **filter_dict)
+        if limit is None and offset is None:
+            return df
+        if sort_by is not None:
+            df = df.sort_values(by=sort_by)
+        start = offset if offset is not None else 0
+        return df.iloc[start : start + limit if limit is not None else None]
+
     @staticmethod
     def _get_filtered_job_table(
         df: pandas.DataFrame, **kwargs: dict
@@ -120,11 +156,11 @@ class IsDatabase(ABC):
             if val is None:
                 update = df[key].isnull()
             elif str(val).startswith("*") and str(val).endswith("*"):
-                update = df[key].str.contains(str(val).replace("*", ""))
+                update = df[key].str.contains(str(val).replace("*", ""), na=False)
             elif str(val).endswith("*"):
-                update = df[key].str.startswith(str(val).replace("*", ""))
+                update = df[key].str.startswith(str(val).replace("*", ""), na=False)
             elif str(val).startswith("*"):
-                update = df[key].str.endswith(str(val).replace("*", ""))
+                update = df[key].str.endswith(str(val).replace("*", ""), na=False)
             else:
                 update = df[key] == val
             if invert:
@@ -145,6 +181,8 @@ class IsDatabase(ABC):
         full_table=False,
         element_lst=None,
         job_name_contains="",
+        limit=None,
+        offset=None,
         **kwargs,
     ):
         """
@@ -165,6 +203,8 @@ class IsDatabase(ABC):
             full_table (bool): Whether to show the entire pandas table
             element_lst (list): list of elements required in the chemical formular - by default None
             job_name_contains (str): (deprecated) A string which should be contained in every job_name
+            limit (int): maximum number of jobs to return, the jobs are selected after sorting - by default all jobs
+            offset (int): number of jobs to skip before the first job returned - by default 0
             **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
                             (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
                             instances of any character
@@ -201,19 +241,22 @@ class IsDatabase(ABC):
             pandas.reset_option("display.max_rows")
             pandas.reset_option("display.max_columns")
         pandas.set_option("display.max_colwidth", max_colwidth)
+        if job_name_contains != "":
+            warnings.warn(
+                "`job_name_contains` is deprecated - use `job='*term*'` instead"
+            )
+            kwargs["job"] = "*{}*".format(job_name_contains)
         df = self._get_job_table(
             user=user,
             sql_query=sql_query,
             project_path=project_path,
             recursive=recursive,
             columns=columns,
+            filter_dict=kwargs,
+            sort_by=sort_by,
+            limit=limit,
+            offset=offset,
         )
-        if job_name_contains != "":
-            warnings.warn(
-                "`job_name_contains` is deprecated - use `job='*term*'` instead"
-            )
-            kwargs["job"] = "*{}*".format(job_name_contains)
-        df = self._get_filtered_job_table(df, **kwargs)
         if sort_by is not None:
             return df.sort_values(by=sort_by)
         return df
@@ -244,6 +287,60 @@ class IsDatabase(ABC):
         for i_id in item_ids:
             self._item_update(par_dict=par_dict, item_id=i_id)
 
+    def add_items(self, par_dict_lst):
+        """
+        Create multiple database items.
+
+        Args:
+            par_dict_lst (list): list of dictionaries with the item values and column names as keys, see
+                                 add_item_dict()
+
+        Returns:
+            list: database IDs of the created items in the order of par_dict_lst
+        """
+        return [self.add_item_dict(par_dict=par_dict) for par_dict in par_dict_lst]
+
+    def items_update(self, item_lst):
+        """
+        Modify multiple items in the database, each with its own values.
+
+        Args:
+            item_lst (list): list of (item_id, par_dict) tuples, with par_dict the dictionary of the parameters to be
+                             modified, where the key is the column name
+        """
+        for item_id, par_dict in item_lst:
+            self._item_update(par_dict=par_dict, item_id=item_id)
+
+    def set_job_status_many(self, status_dict):
+        """
+        Set the status of multiple jobs, which do not necessarily share the same status.
+
+        Args:
+            status_dict (dict): job status for each job id {job_id: status}
+        """
+        job_id_dict = {}
+        for job_id, status in status_dict.items():
+            job_id_dict.setdefault(status, []).append(job_id)
+        for status, job_id_lst in job_id_dict.items():
+            self.set_job_status(status=status, job_id=job_id_lst)
+
+    def get_child_status_counts(self, master_id):
+        """
+        Count the child jobs of a master job grouped by their status.
+
+        Args:
+            master_id (int): job ID of the master job
+
+        Returns:
+            dict: number of child jobs for each status {status: count}
+        """
+        status_dict = {}
+        for item in self.get_items_dict(
+            {"masterid": str(master_id)}, return_all_columns=True
+        ):
+            status_dict[item["status"]] = status_dict.get(item["status"], 0) + 1
+        return status_dict
+
     def set_job_status(self, status, job_id):
         """
         Set status of a job or multiple jobs if job_id is iterable.
@@ -537,6 +634,11 @@ class DatabaseAccess(IsDatabase):
         job=None,
         sub_job_name="%",
         element_lst=None,
+        clause_lst=None,
+        columns=None,
+        sort_by=None,
+        limit=None,
+        offset=None,
     ):
         """
         Internal function to access the database from the project directly.
@@ -549,6 +651,11 @@ class DatabaseAccess(IsDatabase):
             job (str): job_name - by default None
             sub_job_name (str): path inside the HDF5 file - "%" by default to accept any path
             element_lst (list): list of elements required in the chemical formular - by default None
+            clause_lst (list): additional sqlalchemy where clauses - by default None
+            columns (list): columns to select - by default None to select all columns
+            sort_by (str): column to sort by before applying limit and offset - by default None
+            limit (int): maximum number of items - by default None
+            offset (int): number of items to skip - by default None
 
         Returns:
             list: the function returns a list of dicts like get_items_sql, but it does not format datetime:
@@ -615,7 +722,14 @@ class DatabaseAccess(IsDatabase):
             dict_clause["element_lst"] = element_lst
 
         logger.debug("sql_query: %s", str(dict_clause))
-        return self.get_items_dict(dict_clause)
+        return self._get_items_dict(
+            item_dict=dict_clause,
+            clause_lst=clause_lst,
+            columns=columns,
+            sort_by=sort_by,
+            limit=limit,
+            offset=offset,
+        )
 
     def _get_job_table(
         self,
@@ -625,15 +739,96 @@ class DatabaseAccess(IsDatabase):
         recursive=True,
         columns=None,
         element_lst=None,
+        filter_dict=None,
+        sort_by=None,
+        limit=None,
+        offset=None,
     ):
+        if filter_dict is None:
+            filter_dict = {}
+        for key in filter_dict.keys():
+            if key not in self.simulation_table.c.keys():
+                raise ValueError(
+                    f"Column name {key} does not exist in the project database!"
+                )
+        clause_lst, is_exact = self._get_filter_clauses(filter_dict=filter_dict)
+        query_columns = None
+        if columns is not None:
+            query_columns = list(columns)
+            for key in list(filter_dict.keys()) + [sort_by]:
+                if key is not None and key not in query_columns:
+                    query_columns.append(key)
+        # limit and offset can only be applied by the database, when the database applies the filters exactly
+        sql_limit = is_exact and (limit is not None or offset is not None)
         job_dict = self._job_dict(
             sql_query=sql_query,
             user=user,
             project_path=project_path,
             recursive=recursive,
             element_lst=element_lst,
+            clause_lst=clause_lst,
+            columns=[c for c in query_columns if c in self.simulation_table.c.keys()]
+            if query_columns is not None
+            else None,
+            sort_by=sort_by if sql_limit else None,
+            limit=limit if sql_limit else None,
+            offset=offset if sql_limit else None,
         )
-        return pandas.DataFrame(job_dict, columns=columns)
+        df = pandas.DataFrame(job_dict, columns=query_columns)
+        if not is_exact:
+            df = self._get_filtered_sorted_job_table(
+                df=df,
+                filter_dict=filter_dict,
+                sort_by=sort_by,
+                limit=limit,
+                offset=offset,
+            )
+        if columns is not None:
+            df = df[list(columns)]
+        return df
+
+    def _get_filter_clauses(self, filter_dict):
+        """
+        Translate the filters of job_table() to sqlalchemy where clauses, see _get_filtered_job_table() for the syntax.
+
+        Wildcard filters are translated to LIKE, which is case insensitive in SQLite, so for databases other than
+        PostgreSQL they only pre-select the jobs and the exact filter is applied on the resulting DataFrame. For the
+        same reason inverted wildcard filters are not translated at all.
+
+        Args:
+            filter_dict (dict): filters with keys matching the project database column name
+
+        Returns:
+            list, bool: list of where clauses and whether they are equivalent to the filters
+        """
+        clause_lst, is_exact = [], True
+        for key, val in filter_dict.items():
+            column = self.simulation_table.c[key]
+            invert = False
+            if isinstance(val, str) and val[0] == "!":
+                invert = True
+                val = val[1:]
+            if val is None:
+                clause_lst.append(column.is_not(None) if invert else column.is_(None))
+            elif str(val).startswith("*") or str(val).endswith("*"):
+                if invert:
+                    is_exact = False
+                    continue
+                val_str = str(val).replace("*", "")
+                is_exact = is_exact and self._engine.dialect.name == "postgresql"
+                if str(val).startswith("*") and str(val).endswith("*"):
+                    clause_lst.append(column.contains(val_str, autoescape=True))
+                    # pandas interprets the contains filter as regular expression
+                    is_exact = is_exact and re.escape(val_str) == val_str
+                elif str(val).endswith("*"):
+                    clause_lst.append(column.startswith(val_str, autoescape=True))
+                else:
+                    clause_lst.append(column.endswith(val_str, autoescape=True))
+            elif invert:
+                clause_lst.append(or_(column != val, column.is_(None)))
+            else:
+                clause_lst.append(column == val)
+        return clause_lst, is_exact
 
     # Internal functions
     def __del__(self):
@@ -920,6 +1115,59 @@ class DatabaseAccess(IsDatabase):
         else:
             raise PermissionError("Not avilable in viewer mode.")
 
+    def add_items(self, par_dict_lst):
+        """
+        Create multiple database items in a single transaction.
+
+        Args:
+            par_dict_lst (list): list of dictionaries with the item values and column names as keys, see
+                                 add_item_dict()
+
+        Returns:
+            list: database IDs of the created items in the order of par_dict_lst
+        """
+        if self._view_mode:
+            raise PermissionError("Not avilable in viewer mode.")
+        if len(par_dict_lst) == 0:
+            return []
+        par_dict_lst = [
+            dict(
+                (key.lower(), value)
+                for key, value in self._check_chem_formula_length(par_dict).items()
+            )
+            for par_dict in par_dict_lst
+        ]
+        # executemany requires the same columns for all items, missing columns are NULL anyway
+        column_lst = set().union(*par_dict_lst)
+        par_dict_lst = [
+            {key: par_dict.get(key, None) for key in column_lst}
+            for par_dict in par_dict_lst
+        ]
+        try:
+            if (
+                self._engine.dialect.insert_executemany_returning_sort_by_parameter_order
+            ):
+                result = self.conn.execute(
+                    self.simulation_table.insert().returning(
+                        self.simulation_table.c["id"], sort_by_parameter_order=True
+                    ),
+                    par_dict_lst,
+                )
+                id_lst = [row[0] for row in result.fetchall()]
+            else:
+                id_lst = [
+                    self.conn.execute(
+                        self.simulation_table.insert().values(**par_dict)
+                    ).inserted_primary_key[-1]
+                    for par_dict in par_dict_lst
+                ]
+            self.conn.commit()
+        except Exception as except_msg:
+            raise ValueError("Error occurred: " + str(except_msg))
+        if not self._keep_connection:
+            self.conn.close()
+        return id_lst
+
     def __get_items(self, col_name, var):
         """
         Get multiple items from the database
@@ -1011,6 +1259,70 @@ class DatabaseAccess(IsDatabase):
         else:
             raise PermissionError("Not avilable in viewer mode.")
 
+    def _items_update(self, par_dict, item_ids):
+        """
+        Modify multiple items in the database with the same values in a single statement.
+
+        Args:
+            par_dict (dict): Dictionary of the parameters to be modified, where the key is the column name.
+            item_ids (list): Database Item IDs
+        """
+        item_ids = [int(item_id) for item_id in item_ids]
+        par_dict = dict((key.lower(), value) for key, value in par_dict.items())
+        query = (
+            self.simulation_table.update()
+            .where(self.simulation_table.c["id"].in_(item_ids))
+            .values(**par_dict)
+        )
+        self._execute_update([(query, None)])
+
+    def items_update(self, item_lst):
+        """
+        Modify multiple items in the database, each with its own values, in a single transaction.
+
+        Args:
+            item_lst (list): list of (item_id, par_dict) tuples, with par_dict the dictionary of the parameters to be
+                             modified, where the key is the column name
+        """
+        # executemany requires the same columns for all items
+        column_dict = {}
+        for item_id, par_dict in item_lst:
+            par_dict = dict((key.lower(), value) for key, value in par_dict.items())
+            par_dict["_item_id"] = int(item_id)
+            column_dict.setdefault(tuple(sorted(par_dict.keys())), []).append(par_dict)
+        query = self.simulation_table.update().where(
+            self.simulation_table.c["id"] == bindparam("_item_id")
+        )
+        self._execute_update([(query, par_lst) for par_lst in column_dict.values()])
+
+    def _execute_update(self, query_lst):
+        """
+        Execute a list of update statements in a single transaction.
+
+        Args:
+            query_lst (list): list of (query, parameters) tuples, parameters is a list of dictionaries for executemany
+                              or None
+        """
+        if self._view_mode:
+            raise PermissionError("Not avilable in viewer mode.")
+
+        def _execute():
+            for query, parameters in query_lst:
+                self.conn.execute(query, parameters)
+            self.conn.commit()
+
+        try:
+            _execute()
+        except (OperationalError, DatabaseError):
+            if not self._sql_lite:
+                self.conn = AutorestoredConnection(self._engine)
+            else:
+                self.conn = self._engine.connect()
+                self.conn.connection.create_function("like", 2, self.regexp)
+            _execute()
+        if not self._keep_connection:
+            self.conn.close()
+
     def delete_item(self, item_id):
         """
         Delete Item from database
@@ -1151,6 +1463,33 @@ class DatabaseAccess(IsDatabase):
         """
         if not isinstance(item_dict, dict):
             raise TypeError("Wrong DataType! Only Dicts are usable!")
+        return self._get_items_dict(
+            item_dict=item_dict, columns=None if return_all_columns else ["id"]
+        )
+
+    def _get_items_dict(
+        self,
+        item_dict,
+        clause_lst=None,
+        columns=None,
+        sort_by=None,
+        limit=None,
+        offset=None,
+    ):
+        """
+        Get list of jobs which fulfills the query in the dictionary, see get_items_dict()
+
+        Args:
+            item_dict (dict): query in the syntax of get_items_dict()
+            clause_lst (list): additional sqlalchemy where clauses - by default None
+            columns (list): columns to select - by default None to select all columns
+            sort_by (str): column to sort by, in ascending order with NULL values last - by default None
+            limit (int): maximum number of items - by default None
+            offset (int): number of items to skip - by default None
+
+        Returns:
+            list: list of dicts with the selected columns for each item
+        """
         and_statement = []  # list for the whole sqlalchemy statement
         # here we go through all keys and values of item_dict
         for key, value in item_dict.items():
@@ -1175,12 +1514,22 @@ class DatabaseAccess(IsDatabase):
                     part_of_statement = [self.simulation_table.c[str(key)].like(value)]
             # here all statements are wrapped together for the and statement
             and_statement += part_of_statement
-        if return_all_columns:
-            query = select(self.simulation_table).where(and_(*and_statement))
+        if clause_lst is not None:
+            and_statement += clause_lst
+        if columns is None:
+            query = select(self.simulation_table)
         else:
-            query = select(self.simulation_table.columns["id"]).where(
-                and_(*and_statement)
+            query = select(*[self.simulation_table.c[column] for column in columns])
+        query = query.where(and_(*and_statement))
+        if sort_by is not None:
+            query = query.order_by(
+                self.simulation_table.c[sort_by].asc().nulls_last(),
+                self.simulation_table.c["id"],
             )
+        if limit is not None:
+            query = query.limit(limit)
+        if offset is not None:
+            query = query.offset(offset)
         try:
             result = self.conn.execute(query)
         except (OperationalError, DatabaseError):
@@ -1196,6 +1545,38 @@ class DatabaseAccess(IsDatabase):
             self.conn.close()
         return [dict(zip(col._mapping.keys(), col._mapping.values())) for col in row]
 
+    def get_child_status_counts(self, master_id):
+        """
+        Count the child jobs of a master job grouped by their status in a single query.
+
+        Args:
+            master_id (int): job ID of the master job
+
+        Returns:
+            dict: number of child jobs for each status {status: count}
+        """
+        query = (
+            select(
+                self.simulation_table.c["status"],
+                func.count(self.simulation_table.c["id"]),
+            )
+            .where(self.simulation_table.c["masterid"] == int(master_id))
+            .group_by(self.simulation_table.c["status"])
+        )
+        try:
+            result = self.conn.execute(query)
+        except (OperationalError, DatabaseError):
+            if not self._sql_lite:
+                self.conn = AutorestoredConnection(self._engine)
+            else:
+                self.conn = self._engine.connect()
+                self.conn.connection.create_function("like", 2, self.regexp)
+            result = self.conn.execute(query)
+        row = result.fetchall()
+        if not self._keep_connection:
+            self.conn.close()
+        return {status: count for status, count in row}
+
     def get_job_status(self, job_id):
         try:
             return self.get_item_by_id(item_id=job_id)["status"]
@@ -33,7 +33,7 @@ def get_historical_table(table_name, metadata, extend_existing=True):
         metadata,
         Column("id", Integer, primary_key=True, autoincrement=True),
         Column("parentid", Integer),
-        Column("masterid", Integer),
+        Column("masterid", Integer, index=True),
         Column("projectpath", String(50)),
         Column("project", String(255)),
         Column("job", String(50)),
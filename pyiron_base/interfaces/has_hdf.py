@@ -23,7 +23,7 @@ class _WithHDF:
     __slots__ = ("_hdf", "_group_name")
 
     def __init__(self, hdf, group_name=None):
-        if group_name in hdf.list_nodes():
+        if group_name is not None and group_name in hdf.list_nodes():
             raise ValueError(f"{group_name} is a node and not a group!")
         self._hdf = hdf
         self._group_name = group_name
@@ -6,6 +6,7 @@ import codecs
 from datetime import datetime
 import dill as pickle
 import json
+import multiprocessing
 import numpy as np
 import os
 import pandas
@@ -45,6 +46,92 @@ def get_job_id(job):
     return {"job_id": job.job_id}
 
 
+class HDFColumn(object):
+    """
+    Table function which reads a single dataset from the HDF5 file of each job, see :meth:`FunctionContainer.from_hdf`.
+
+    Args:
+        key (str): column name
+        path (str): path of the dataset relative to the job in the HDF5 file, e.g. "output/energy_tot"
+        reduce (str/None): reduce an array to a single value, one of "first", "last", "min", "max", "mean", "sum" and
+                           "len" - by default None to keep the full dataset
+    """
+
+    _reduce_functions = {
+        "first": lambda value: value[0],
+        "last": lambda value: value[-1],
+        "min": np.min,
+        "max": np.max,
+        "mean": np.mean,
+        "sum": np.sum,
+        "len": len,
+    }
+
+    def __init__(self, key, path, reduce=None):
+        if reduce is not None and reduce not in self._reduce_functions.keys():
+            raise ValueError(
+                "Unknown reduce {}, use one of {}.".format(
+                    reduce, list(self._reduce_functions.keys())
+                )
+            )
+        self.__name__ = key
+        self.key = key
+        self.path = path
+        self.reduce = reduce
+
+    def __call__(self, job):
+        """
+        Args:
+            job (JobCore/FileHDFio): job or the HDF5 group of the job
+
+        Returns:
+            dict: {key: value}, value is None if the dataset does not exist
+        """
+        try:
+            value = job[self.path]
+        except ValueError:
+            value = None
+        if value is not None and self.reduce is not None:
+            value = self._reduce_functions[self.reduce](value)
+        return {self.key: value}
+
+
+def _analyse_job_chunk(args):
+    """
+    Inspect, filter and analyse a chunk of jobs for :meth:`PyironTable._iterate_over_job_id_lst_in_pool`, this
+    function is executed in the worker processes of the pool.
+
+    Args:
+        args (tuple): the table settings serialized with dill and the list of job ids of the chunk
+
+    Returns:
+        list of dict: the merged dicts from all functions for each job which passed the filter
+    """
+    settings, job_id_lst = args
+    (
+        project_class,
+        project_path,
+        convert_to_object,
+        filter_function,
+        function_lst,
+        job_status_list,
+    ) = pickle.loads(settings)
+    table = PyironTable(project=project_class(project_path))
+    table.convert_to_object = convert_to_object
+    table.filter_function = filter_function
+    diff_dict_lst = []
+    for job_id in job_id_lst:
+        if job_status_list is None:
+            job = table._project.inspect(job_id)
+        else:
+            job = table._inspect_and_filter_job(
+                job_id=job_id, job_status_list=job_status_list
+            )
+        if job is not None:
+            diff_dict_lst.append(table._analyse_job(job, function_lst=function_lst))
+    return diff_dict_lst
+
+
 class FunctionContainer(object):
     """
     Class which is able to append, store and retreive a set of functions.
@@ -93,6 +180,26 @@ class FunctionContainer(object):
     def __getitem__(self, key):
         return self._user_function_dict[key]
 
+    def from_hdf(self, key, path, reduce=None):
+        """
+        Add a column which reads a dataset from the HDF5 file of each job.
+
+        In contrast to general functions these columns do not require to load the jobs, so as long as all columns are
+        defined this way and no filter_function is set, the table reads each HDF5 file once without creating any job
+        objects.
+
+        Example:
+
+        >>> table.add.from_hdf("energy", "output/generic/energy_tot", reduce="last")
+
+        Args:
+            key (str): column name
+            path (str): path of the dataset relative to the job in the HDF5 file
+            reduce (str/None): reduce an array to a single value, one of "first", "last", "min", "max", "mean", "sum"
+                               and "len" - by default None to keep the full dataset
+        """
+        self._user_function_dict[key] = HDFColumn(key=key, path=path, reduce=reduce)
+
     def __getattr__(self, name):
         if name in list(self._system_function_dict.keys()):
             self._system_function_dict[name] = True
@@ -141,6 +248,7 @@ class PyironTable:
         self._project = project
         self._df = pandas.DataFrame({})
         self.convert_to_object = False
+        self.cores = 1
         self._name = name
         self._db_filter_function = always_true_pandas
         self._filter_function = always_true
@@ -264,23 +372,52 @@ class PyironTable:
                     for funct in self.add._system_function_lst
                     if funct.__name__ in new_system_functions
                 ]
-                df_new_keys = self._iterate_over_job_lst(
-                    job_lst=map(self._project.inspect, self._get_job_ids()),
-                    function_lst=function_lst,
-                )
+                if self._is_hdf_only(function_lst=function_lst):
+                    df_new_keys = self._iterate_over_job_table_from_hdf(
+                        job_table=self._get_filtered_job_table_from_project()
+                        .set_index("id")
+                        .loc[self._get_job_ids()]
+                        .reset_index(),
+                        function_lst=function_lst,
+                    )
+                elif self.cores > 1:
+                    df_new_keys = self._iterate_over_job_id_lst_in_pool(
+                        job_id_lst=self._get_job_ids(), function_lst=function_lst
+                    )
+                else:
+                    df_new_keys = self._iterate_over_job_lst(
+                        job_lst=map(self._project.inspect, self._get_job_ids()),
+                        function_lst=function_lst,
+                    )
                 if len(df_new_keys) > 0:
                     self._df = pandas.concat([self._df, df_new_keys], axis="columns")
 
-        new_jobs = self._collect_job_update_lst(
-            job_status_list=job_status_list,
-            job_stored_ids=self._get_job_ids() if not enforce_update else None,
-        )
-        if len(new_jobs) > 0:
-            df_new_ids = self._iterate_over_job_lst(
-                job_lst=new_jobs, function_lst=self.add._function_lst
+        job_stored_ids = self._get_job_ids() if not enforce_update else None
+        if self._is_hdf_only(function_lst=self.add._function_lst):
+            job_table = self._get_filtered_job_table_from_project()
+            if job_stored_ids is not None:
+                job_table = job_table[~job_table.id.isin(job_stored_ids)]
+            df_new_ids = self._iterate_over_job_table_from_hdf(
+                job_table=job_table[job_table.status.isin(job_status_list)],
+                function_lst=self.add._function_lst,
+            )
+        elif self.cores > 1:
+            df_new_ids = self._iterate_over_job_id_lst_in_pool(
+                job_id_lst=self._get_job_id_update_lst(job_stored_ids=job_stored_ids),
+                function_lst=self.add._function_lst,
+                job_status_list=job_status_list,
+            )
+        else:
+            new_jobs = self._collect_job_update_lst(
+                job_status_list=job_status_list, job_stored_ids=job_stored_ids
             )
-            if len(df_new_ids) > 0:
-                self._df = pandas.concat([self._df, df_new_ids], ignore_index=True)
+            df_new_ids = pandas.DataFrame({})
+            if len(new_jobs) > 0:
+                df_new_ids = self._iterate_over_job_lst(
+                    job_lst=new_jobs, function_lst=self.add._function_lst
+                )
+        if len(df_new_ids) > 0:
+            self._df = pandas.concat([self._df, df_new_ids], ignore_index=True)
 
     def get_dataframe(self):
         return self._df
@@ -328,10 +465,15 @@ class PyironTable:
         else:
             return np.array([])
 
-    def _get_filtered_job_ids_from_project(self, recursive=True):
-        project_table = self._project.job_table(recursive=recursive)
+    def _get_filtered_job_table_from_project(self, recursive=True):
+        project_table = self._project.job_table(recursive=recursive, all_columns=True)
         filter_funct = self.db_filter_function
-        return project_table[filter_funct(project_table)]["id"].tolist()
+        return project_table[filter_funct(project_table)]
+
+    def _get_filtered_job_ids_from_project(self, recursive=True):
+        return self._get_filtered_job_table_from_project(recursive=recursive)[
+            "id"
+        ].tolist()
 
     @staticmethod
     def _apply_function_on_job(funct, job):
@@ -361,16 +503,127 @@ class PyironTable:
         Returns:
             list of dict: a list of the merged dicts from all functions for each job
         """
-        diff_dict_lst = []
-        for job_inspect in tqdm(job_lst, desc="Processing jobs"):
-            if self.convert_to_object:
-                job = job_inspect.to_object()
-            else:
-                job = job_inspect
-            diff_dict = self._apply_list_of_functions_on_job(
-                job=job, function_lst=function_lst
+        diff_dict_lst = [
+            self._analyse_job(job_inspect, function_lst=function_lst)
+            for job_inspect in tqdm(job_lst, desc="Processing jobs")
+        ]
+        self.refill_dict(diff_dict_lst)
+        return pandas.DataFrame(diff_dict_lst)
+
+    def _is_hdf_only(self, function_lst):
+        """
+        Check if the functions can be evaluated on the HDF5 files directly, without loading the jobs.
+
+        Args:
+            function_lst (list of functions): functions to apply on jobs
+
+        Returns:
+            bool: True if all functions are :class:`HDFColumn` or :func:`get_job_id` and no job filter is required
+        """
+        return (
+            not self.convert_to_object
+            and self.filter_function is always_true
+            and all(
+                isinstance(funct, HDFColumn) or funct is get_job_id
+                for funct in function_lst
+            )
+        )
+
+    def _iterate_over_job_table_from_hdf(self, job_table, function_lst):
+        """
+        Apply :class:`HDFColumn` functions by reading the HDF5 files of the jobs directly. Jobs sharing one HDF5 file
+        are read with a single file handle.
+
+        Args:
+            job_table (pandas.DataFrame): database entries of the jobs to analyze
+            function_lst (list of functions): :class:`HDFColumn` objects and :func:`get_job_id`
+
+        Returns:
+            pandas.DataFrame: table with one row for each job
+        """
+        diff_dict_lst = [{} for _ in range(len(job_table))]
+        file_dict = {}
+        for i, (job_id, project_path, project, sub_job) in enumerate(
+            zip(
+                job_table["id"].values,
+                job_table["projectpath"].values,
+                job_table["project"].values,
+                job_table["subjob"].values,
             )
-            diff_dict_lst.append(diff_dict)
+        ):
+            if project_path is None:
+                project_path = ""
+            file_name = project_path + project + sub_job.split("/")[1] + ".h5"
+            file_dict.setdefault(file_name, []).append((i, job_id, sub_job))
+        for file_name, job_lst in tqdm(file_dict.items(), desc="Reading HDF5 files"):
+            hdf = FileHDFio(file_name=file_name)
+            file_exists = os.path.exists(file_name)
+            with hdf.session(mode="r"):
+                for i, job_id, sub_job in job_lst:
+                    job_hdf = hdf.open(sub_job[1:])
+                    for funct in function_lst:
+                        if funct is get_job_id:
+                            diff_dict_lst[i]["job_id"] = job_id
+                        elif file_exists:
+                            diff_dict_lst[i].update(
+                                self._apply_function_on_job(funct, job_hdf)
+                            )
+        self.refill_dict(diff_dict_lst)
+        return pandas.DataFrame(diff_dict_lst)
+
+    def _analyse_job(self, job_inspect, function_lst):
+        if self.convert_to_object:
+            job = job_inspect.to_object()
+        else:
+            job = job_inspect
+        return self._apply_list_of_functions_on_job(job=job, function_lst=function_lst)
+
+    def _iterate_over_job_id_lst_in_pool(
+        self, job_id_lst, function_lst, job_status_list=None
+    ):
+        """
+        Apply functions to jobs using a pool of :attr:`.cores` processes.
+
+        The job ids are split in chunks, each chunk is inspected and analysed in a separate process and the results are
+        merged in the order of the job ids. Like in :meth:`._iterate_over_job_lst` functions that raise an error are set
+        to `None`.
+
+        Args:
+            job_id_lst (list of int): ids of the jobs to analyze
+            function_lst (list of functions): all functions to apply on jobs.  Must return a dictionary.
+            job_status_list (list of str/None): only consider jobs with these statuses which pass the
+                :attr:`.filter_function`, like :meth:`._collect_job_update_lst` - None to analyze all jobs
+
+        Returns:
+            pandas.DataFrame: table with one row for each analyzed job
+        """
+        job_id_lst = list(job_id_lst)
+        if len(job_id_lst) == 0:
+            return pandas.DataFrame({})
+        settings = pickle.dumps(
+            (
+                self._project.__class__,
+                self._project.path,
+                self.convert_to_object,
+                self.filter_function,
+                function_lst,
+                job_status_list,
+            )
+        )
+        # several chunks per process to balance the load between the processes
+        chunk_size = max(1, len(job_id_lst) // (4 * self.cores))
+        chunk_lst = [
+            (settings, job_id_lst[i : i + chunk_size])
+            for i in range(0, len(job_id_lst), chunk_size)
+        ]
+        diff_dict_lst = []
+        with multiprocessing.Pool(self.cores) as pool:
+            for chunk_diff_dict_lst in tqdm(
+                pool.imap(_analyse_job_chunk, chunk_lst),
+                total=len(chunk_lst),
+                desc="Processing jobs",
+            ):
+                diff_dict_lst += chunk_diff_dict_lst
         self.refill_dict(diff_dict_lst)
         return pandas.DataFrame(diff_dict_lst)
 
@@ -410,30 +663,38 @@ class PyironTable:
         Returns:
             list: List of JobCore objects
         """
+        job_update_lst = []
+        for job_id in tqdm(
+            self._get_job_id_update_lst(job_stored_ids=job_stored_ids),
+            desc="Loading and filtering jobs",
+        ):
+            job = self._inspect_and_filter_job(
+                job_id=job_id, job_status_list=job_status_list
+            )
+            if job is not None:
+                job_update_lst.append(job)
+        return job_update_lst
+
+    def _get_job_id_update_lst(self, job_stored_ids=None):
         if job_stored_ids is not None:
-            job_id_lst = [
+            return [
                 job_id
                 for job_id in self._get_filtered_job_ids_from_project()
                 if job_id not in job_stored_ids
             ]
         else:
-            job_id_lst = self._get_filtered_job_ids_from_project()
+            return self._get_filtered_job_ids_from_project()
 
-        job_update_lst = []
-        for job_id in tqdm(job_id_lst, desc="Loading and filtering jobs"):
-            try:
-                job = self._project.inspect(job_id)
-            except (
-                IndexError
-            ):  # In case the job was deleted while the pyiron table is running
-                job = None
-            if (
-                job is not None
-                and job.status in job_status_list
-                and self.filter_function(job)
-            ):
-                job_update_lst.append(job)
-        return job_update_lst
+    def _inspect_and_filter_job(self, job_id, job_status_list):
+        try:
+            job = self._project.inspect(job_id)
+        except (
+            IndexError
+        ):  # In case the job was deleted while the pyiron table is running
+            return None
+        if job.status in job_status_list and self.filter_function(job):
+            return job
+        return None
 
     def _repr_html_(self):
         """
@@ -598,6 +859,10 @@ class TableJob(GenericJob):
         >>>     return job["output/generic/energy_pot"][-1]
 
         >>> table.add["energy"] = get_energy
+
+        Datasets which are only read from the HDF5 file can be added without loading the jobs:
+
+        >>> table.add.from_hdf("energy", "output/generic/energy_pot", reduce="last")
         """
         return self._pyiron_table.add
 
@@ -762,6 +1027,7 @@ class TableJob(GenericJob):
             job_status_list = self.job_status
         if self.job_id is not None:
             self.project.db.item_update({"timestart": datetime.now()}, self.job_id)
+        self._pyiron_table.cores = self.server.cores
         with self.project_hdf5.open("input") as hdf5_input:
             self._pyiron_table.create_table(
                 file=hdf5_input,
@@ -6,6 +6,7 @@ The JobCore the most fundamental pyiron job class.
 """
 
 import copy
+import h5py
 import math
 import os
 import posixpath
@@ -13,7 +14,8 @@ import shutil
 import warnings
 
 from pyiron_base.interfaces.has_groups import HasGroups
-from pyiron_base.storage.hdfio import ProjectHDFio
+from pyiron_base.storage.hdfio import ProjectHDFio, open_hdf5
+from pyiron_base.storage.h5io_codec import read_from_store
 from pyiron_base.jobs.job.util import (
     _get_project_for_copy,
     _copy_database_entry,
@@ -129,6 +131,7 @@ class JobCore(HasGroups):
         self._import_directory = None
         self._database_property = DatabaseProperties()
         self._hdf5_content = HDF5Content(project_hdf5=self._hdf5)
+        self._metadata_cache = JobMetadataCache()
 
     @property
     def content(self):
@@ -605,9 +608,7 @@ class JobCore(HasGroups):
         Returns:
             list: list of file names
         """
-        if os.path.isdir(self.working_directory):
-            return os.listdir(self.working_directory)
-        return []
+        return self._metadata_cache.list_files(working_directory=self.working_directory)
 
     def list_childs(self):
         """
@@ -905,6 +906,12 @@ class JobCore(HasGroups):
             with open(file_name) as f:
                 return f.readlines()
 
+        node_type = self._metadata_cache.get_node_type(
+            project_hdf5=self._hdf5, item=item
+        )
+        if node_type is not None:
+            return self._get_item_from_node_tree(item=item, node_type=node_type)
+
         # first try to access HDF5 directly to make the common case fast
         try:
             group = self._hdf5[item]
@@ -951,6 +958,50 @@ class JobCore(HasGroups):
                 # looking for
                 pass
 
+        return self._get_item_from_child(name_lst=name_lst)
+
+    def _get_item_from_node_tree(self, item, node_type):
+        """
+        Internal function to get an item with the cached HDF5 node tree, see __getitem__().
+
+        Args:
+            item (str): relative path to the data
+            node_type (str): type of the item in the node tree, see JobMetadataCache.get_node_type()
+
+        Returns:
+            dict, list, float, int, :class:`.DataContainer`, None: data or data object
+        """
+        if node_type == "container":
+            return self._hdf5[item].to_object(lazy=True)
+        elif node_type != "missing":
+            return self._hdf5[item]
+        name_lst = item.split("/")
+        for i in range(1, len(name_lst)):
+            container_path = "/".join(name_lst[:-i])
+            if (
+                self._metadata_cache.get_node_type(
+                    project_hdf5=self._hdf5, item=container_path
+                )
+                == "container"
+            ):
+                try:
+                    return self._hdf5[container_path].to_object(lazy=True)[
+                        "/".join(name_lst[-1:])
+                    ]
+                except (ValueError, IndexError, KeyError):
+                    pass
+        return self._get_item_from_child(name_lst=name_lst)
+
+    def _get_item_from_child(self, name_lst):
+        """
+        Internal function to get an item from the HDF5 file of a child job, see __getitem__().
+
+        Args:
+            name_lst (list): path to the data split at "/"
+
+        Returns:
+            dict, list, float, int, None: data or data object
+        """
         item_obj = name_lst[0]
         if item_obj in self._list_ext_childs():
             # ToDo: Murn['strain_0.9'] - sucht im HDF5 file, dort gibt es aber die entsprechenden Gruppen noch nicht.
@@ -1011,14 +1062,16 @@ class JobCore(HasGroups):
         childs = self.list_childs()
         return list(set(childs) - set(nodes))
 
-    def compress(self, files_to_compress=None):
+    def compress(self, files_to_compress=None, codec="bz2"):
         """
         Compress the output files of a job object.
 
         Args:
             files_to_compress (list):
+            codec (str): compression codec, one of "bz2", "gzip", "xz" or "zstd" (requires the zstandard package)
+                - default="bz2"
         """
-        _job_compress(job=self, files_to_compress=files_to_compress)
+        _job_compress(job=self, files_to_compress=files_to_compress, codec=codec)
 
     def decompress(self):
         """
@@ -1057,6 +1110,102 @@ class JobCore(HasGroups):
         return _job_is_archived(job=self)
 
 
+class JobMetadataCache(object):
+    """
+    Cache of the working directory listing and the HDF5 node tree of a job, which are invalidated when the
+    modification time of the working directory or the size or modification time of the HDF5 file change.
+    """
+
+    def __init__(self):
+        self._file_lst = None
+        self._node_tree = None
+
+    def list_files(self, working_directory):
+        """
+        List files inside the working directory
+
+        Args:
+            working_directory (str): working directory of the job
+
+        Returns:
+            list: list of file names
+        """
+        try:
+            mtime = os.stat(working_directory).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self._file_lst = None
+            return []
+        key = (working_directory, mtime)
+        if self._file_lst is None or self._file_lst[0] != key:
+            self._file_lst = (key, os.listdir(working_directory))
+        return list(self._file_lst[1])
+
+    def get_node_type(self, project_hdf5, item):
+        """
+        Get the type of a node in the HDF5 group of the job.
+
+        Args:
+            project_hdf5 (ProjectHDFio): HDF5 group of the job
+            item (str): relative path inside the HDF5 group
+
+        Returns:
+            str/None: "group", "container" for groups containing a DataContainer, "dataset" or "missing" if the node
+                does not exist - None if the item can not be resolved with the cache
+        """
+        if not isinstance(item, str) or any(
+            name in ["", ".", ".."] for name in item.split("/")
+        ):
+            return None
+        node_tree = self._get_node_tree(project_hdf5=project_hdf5)
+        if node_tree is None:
+            return None
+        return node_tree.get(item, "missing")
+
+    def _get_node_tree(self, project_hdf5):
+        if project_hdf5._session is not None and project_hdf5._session.is_active:
+            return None
+        try:
+            stat = os.stat(project_hdf5.file_name)
+        except FileNotFoundError:
+            self._node_tree = None
+            return None
+        key = (
+            project_hdf5.file_name,
+            project_hdf5.h5_path,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        if self._node_tree is None or self._node_tree[0] != key:
+            self._node_tree = (key, self._read_node_tree(project_hdf5=project_hdf5))
+        return self._node_tree[1]
+
+    @staticmethod
+    def _read_node_tree(project_hdf5):
+        node_tree = {}
+
+        def visit(name, node):
+            if isinstance(node, h5py.Dataset):
+                node_tree[name] = "dataset"
+            elif "NAME" in node and _read_name(node) == "DataContainer":
+                node_tree[name] = "container"
+            else:
+                node_tree[name] = "group"
+
+        def _read_name(node):
+            try:
+                return read_from_store(store=node, title="NAME")
+            except Exception:
+                return None
+
+        try:
+            with open_hdf5(project_hdf5.file_name, mode="r") as store:
+                if project_hdf5.h5_path in store:
+                    store[project_hdf5.h5_path].visititems(visit)
+        except OSError:
+            return None
+        return node_tree
+
+
 class DatabaseProperties(object):
     """
     Access the database entry of the job
@@ -22,6 +22,106 @@ __status__ = "production"
 __date__ = "Sep 1, 2017"
 
 
+class ResourceIndex:
+    """
+    Process-wide index of the run scripts in the resource directories.
+
+    Every job creates an Executable, which used to list the resource directories each time. The index caches the
+    listing of each directory together with its modification time, so a directory is only listed again after a run
+    script was added or removed. Changes which do not update the modification time of the directory - e.g. on network
+    file systems with attribute caching - can be picked up with :meth:`refresh`.
+    """
+
+    def __init__(self):
+        self._directories = {}
+        self._executables = {}
+
+    def exists(self, path):
+        """
+        Check if a resource directory exists.
+
+        Args:
+            path (str): path of the resource directory
+
+        Returns:
+            bool: [True/False]
+        """
+        return self._get_mtime(path) is not None
+
+    def list_directory(self, path):
+        """
+        List the files in a resource directory, from the index if the directory did not change since.
+
+        Args:
+            path (str): path of the resource directory
+
+        Returns:
+            tuple/None: file names in the directory, None if the directory does not exist
+        """
+        mtime = self._get_mtime(path)
+        if mtime is None:
+            return None
+        cached = self._directories.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            file_lst = tuple(os.listdir(path))
+        except OSError:
+            return None
+        self._directories[path] = (mtime, file_lst)
+        return file_lst
+
+    def get_executables(self, path_bin, codename, extension):
+        """
+        Get the run scripts of a code in the resource directories.
+
+        Args:
+            path_bin (list): resource directories to search, the first directory takes precedence for each version
+            codename (str): name of the code
+            extension (str): file extension of the run scripts
+
+        Returns:
+            dict: absolute path of the run script for each version
+        """
+        key = (tuple(path_bin), codename, extension)
+        mtimes = tuple(self._get_mtime(path) for path in path_bin)
+        cached = self._executables.get(key)
+        if cached is None or cached[0] != mtimes:
+            prefix = "run_" + codename + "_"
+            executable_dict = {}
+            for path in path_bin:
+                for executable in self.list_directory(path) or ():
+                    version = executable[len(prefix) : -len(extension)]
+                    if (
+                        executable.startswith(prefix)
+                        and executable.endswith(extension)
+                        and version not in executable_dict.keys()
+                    ):
+                        executable_dict[version] = os.path.join(
+                            path, executable
+                        ).replace("\\", "/")
+            cached = (mtimes, executable_dict)
+            self._executables[key] = cached
+        return cached[1].copy()
+
+    def refresh(self):
+        """
+        Drop the index, so all resource directories are listed again.
+        """
+        self._directories.clear()
+        self._executables.clear()
+
+    @staticmethod
+    def _get_mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+
+resource_index = ResourceIndex()
+
+
 class Executable(HasStorage):
     def __init__(
         self,
@@ -61,14 +161,14 @@ class Executable(HasStorage):
             self.path_bin = [
                 exe_path
                 for exe_path in (code_path_lst + backwards_compatible_path_lst)
-                if os.path.exists(exe_path)
+                if resource_index.exists(exe_path)
             ]
         else:  # Backwards compatibility
             self.storage.name = codename.lower()
             self.path_bin = [
                 os.path.join(path, self.storage.name)
                 for path in path_binary_codes
-                if os.path.exists(os.path.join(path, self.storage.name))
+                if resource_index.exists(os.path.join(path, self.storage.name))
             ]
         if overwrite_nt_flag:
             self.storage.operation_system_nt = False
@@ -269,28 +369,9 @@ class Executable(HasStorage):
             extension = ".bat"
         else:
             extension = ".sh"
-        try:
-            executable_dict = {}
-            for path in self.path_bin:
-                for executable in os.listdir(path):
-                    if (
-                        executable.startswith("run_" + self.storage.name + "_")
-                        & executable.endswith(extension)
-                        and executable[
-                            len("run_" + self.storage.name) + 1 : -len(extension)
-                        ]
-                        not in executable_dict.keys()
-                    ):
-                        executable_dict[
-                            executable[
-                                len("run_" + self.storage.name) + 1 : -len(extension)
-                            ]
-                        ] = os.path.join(path, executable).replace("\\", "/")
-            return executable_dict
-        except (
-            OSError
-        ):  # No executable exists - This is the case for GenericJob and other abstract job classes.
-            return dict()
+        return resource_index.get_executables(
+            path_bin=self.path_bin, codename=self.storage.name, extension=extension
+        )
 
     def _executable_select(self):
         """
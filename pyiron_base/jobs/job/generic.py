@@ -778,7 +778,7 @@ class GenericJob(JobCore):
                         "parentid": None,
                     }
                 )
-            _ = [self.project.db.add_item_dict(d) for d in db_dict_lst]
+            _ = self.project.db.add_items(db_dict_lst)
         self.status.string = self.project_hdf5["status"]
         if self.master_id is not None:
             self._reload_update_master(project=self.project, master_id=self.master_id)
@@ -1070,7 +1070,8 @@ class GenericJob(JobCore):
         Returns:
             (int): Job ID stored in the database
         """
-        self.to_hdf()
+        with self.project_hdf5.session(mode="a"):
+            self.to_hdf()
         if not state.database.database_is_disabled:
             job_id = self.project.db.add_item_dict(self.db_entry())
             self._job_id = job_id
@@ -201,24 +201,15 @@ class InteractiveBase(GenericJob):
     @staticmethod
     def _extend_hdf(h5, path, key, data):
         """
+        Append the data to the dataset path/key, see :meth:`.FileHDFio.extend`.
 
         Args:
-            h5:
-            path:
-            key:
-            data:
-
-        Returns:
-
+            h5 (ProjectHDFio): HDF5 group object
+            path (str): HDF5 group of the dataset
+            key (str): name of the dataset
+            data (list/numpy.ndarray): new data, one entry per step
         """
-        if path in h5.list_groups() and key in h5[path].list_nodes():
-            current_hdf = h5[path + "/" + key]
-            if isinstance(data, list):
-                entry = current_hdf.tolist() + data
-            else:
-                entry = current_hdf.tolist() + data.tolist()
-            data = np.array(entry)
-        h5[path + "/" + key] = data
+        h5.extend(path + "/" + key, data)
 
     @staticmethod
     def _include_last_step(array, step=1, include_last=False):
@@ -258,7 +249,7 @@ class InteractiveBase(GenericJob):
         Returns:
 
         """
-        with self.project_hdf5.open("output") as h5:
+        with self.project_hdf5.session(), self.project_hdf5.open("output") as h5:
             for key in self.interactive_cache.keys():
                 if len(self.interactive_cache[key]) == 0:
                     continue
@@ -12,7 +12,12 @@ import stat
 import shutil
 from typing import Optional, Union
 from pyiron_base.utils.instance import static_isinstance
-from pyiron_base.utils.safetar import safe_extract
+from pyiron_base.utils.safetar import safe_extract, is_within_directory
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 __author__ = "Jan Janssen"
 __copyright__ = (
@@ -26,6 +31,16 @@ __status__ = "production"
 __date__ = "Nov 28, 2020"
 
 
+# file extension of the working directory archive for each compression codec
+_compression_extensions = {
+    "bz2": ".tar.bz2",
+    "gzip": ".tar.gz",
+    "xz": ".tar.xz",
+    "zstd": ".tar.zst",
+}
+_tarfile_modes = {"bz2": "bz2", "gzip": "gz", "xz": "xz"}
+
+
 def _copy_database_entry(new_job_core, job_copied_id):
     """
     Copy database entry from previous job
@@ -188,11 +203,14 @@ def _rename_job(job, new_job_name):
     if os.path.exists(old_working_directory):
         shutil.move(old_working_directory, job.working_directory)
         os.rmdir("/".join(old_working_directory.split("/")[:-1]))
-    if os.path.exists(os.path.join(job.working_directory, old_job_name + ".tar.bz2")):
-        os.rename(
-            os.path.join(job.working_directory, old_job_name + ".tar.bz2"),
-            os.path.join(job.working_directory, job.job_name + ".tar.bz2"),
-        )
+    for extension in _compression_extensions.values():
+        if os.path.exists(
+            os.path.join(job.working_directory, old_job_name + extension)
+        ):
+            os.rename(
+                os.path.join(job.working_directory, old_job_name + extension),
+                os.path.join(job.working_directory, job.job_name + extension),
+            )
 
 
 def _is_valid_job_name(job_name):
@@ -261,36 +279,22 @@ def _kill_child(job):
                     job_process.kill()
 
 
-def _job_compress(job, files_to_compress=None):
+def _job_compress(job, files_to_compress=None, codec="bz2"):
     """
     Compress the output files of a job object.
 
     Args:
         job (JobCore): job object to compress
         files_to_compress (list): list of files to compress
+        codec (str): compression codec, one of "bz2", "gzip", "xz" or "zstd" - default="bz2"
     """
     if not _job_is_compressed(job):
-        if files_to_compress is None:
-            files_to_compress = list(job.list_files())
-        cwd = os.getcwd()
-        try:
-            os.chdir(job.working_directory)
-            with tarfile.open(
-                os.path.join(job.working_directory, job.job_name + ".tar.bz2"),
-                "w:bz2",
-            ) as tar:
-                for name in files_to_compress:
-                    if "tar" not in name and not stat.S_ISFIFO(os.stat(name).st_mode):
-                        tar.add(name)
-            for name in files_to_compress:
-                if "tar" not in name:
-                    fullname = os.path.join(job.working_directory, name)
-                    if os.path.isfile(fullname):
-                        os.remove(fullname)
-                    elif os.path.isdir(fullname):
-                        shutil.rmtree(fullname)
-        finally:
-            os.chdir(cwd)
+        _compress_working_directory(
+            working_directory=job.working_directory,
+            job_name=job.job_name,
+            files_to_compress=files_to_compress,
+            codec=codec,
+        )
     else:
         print("The files are already compressed!")
 
@@ -303,10 +307,9 @@ def _job_decompress(job):
         job (JobCore): job object to decompress
     """
     try:
-        tar_file_name = os.path.join(job.working_directory, job.job_name + ".tar.bz2")
-        with tarfile.open(tar_file_name, "r:bz2") as tar:
-            safe_extract(tar, job.working_directory)
-        os.remove(tar_file_name)
+        _decompress_working_directory(
+            working_directory=job.working_directory, job_name=job.job_name
+        )
     except IOError:
         pass
 
@@ -321,13 +324,134 @@ def _job_is_compressed(job):
     Returns:
         bool: [True/False]
     """
-    compressed_name = job.job_name + ".tar.bz2"
+    compressed_names = [
+        job.job_name + extension for extension in _compression_extensions.values()
+    ]
     for name in job.list_files():
-        if compressed_name in name:
+        if any(compressed_name in name for compressed_name in compressed_names):
             return True
     return False
 
 
+def _compress_working_directory(
+    working_directory, job_name, files_to_compress=None, codec="bz2"
+):
+    """
+    Compress the files in the working directory of a job to the archive job_name + extension of the codec. Unlike
+    changing into the working directory, this only works with absolute paths, so it is safe to run in parallel.
+
+    Args:
+        working_directory (str): working directory of the job
+        job_name (str): name of the job
+        files_to_compress (list): list of files to compress - default all files in the working directory
+        codec (str): compression codec, one of "bz2", "gzip", "xz" or "zstd" - default="bz2"
+    """
+    if codec not in _compression_extensions.keys():
+        raise ValueError(
+            f"Unknown compression codec {codec}, choose one of "
+            f"{list(_compression_extensions.keys())}."
+        )
+    if codec == "zstd" and zstandard is None:
+        raise ImportError("The zstd codec requires the zstandard package.")
+    if files_to_compress is None:
+        files_to_compress = os.listdir(working_directory)
+    files_to_compress = [name for name in files_to_compress if "tar" not in name]
+    tar_file_name = os.path.join(
+        working_directory, job_name + _compression_extensions[codec]
+    )
+    if codec == "zstd":
+        with zstandard.open(tar_file_name, "wb") as f, tarfile.open(
+            fileobj=f, mode="w|"
+        ) as tar:
+            _add_files_to_tar(tar, working_directory, files_to_compress)
+    else:
+        with tarfile.open(tar_file_name, "w:" + _tarfile_modes[codec]) as tar:
+            _add_files_to_tar(tar, working_directory, files_to_compress)
+    for name in files_to_compress:
+        fullname = os.path.join(working_directory, name)
+        if os.path.isfile(fullname):
+            os.remove(fullname)
+        elif os.path.isdir(fullname):
+            shutil.rmtree(fullname)
+
+
+def _add_files_to_tar(tar, working_directory, files_to_compress):
+    for name in files_to_compress:
+        fullname = os.path.join(working_directory, name)
+        if not stat.S_ISFIFO(os.stat(fullname).st_mode):
+            tar.add(fullname, arcname=name)
+
+
+def _decompress_working_directory(working_directory, job_name):
+    """
+    Decompress the archive of a job in its working directory, independent of the codec it was compressed with.
+
+    Args:
+        working_directory (str): working directory of the job
+        job_name (str): name of the job
+    """
+    for codec, extension in _compression_extensions.items():
+        tar_file_name = os.path.join(working_directory, job_name + extension)
+        if os.path.isfile(tar_file_name):
+            if codec == "zstd":
+                with zstandard.open(tar_file_name, "rb") as f, tarfile.open(
+                    fileobj=f, mode="r|"
+                ) as tar:
+                    # stream archives can not be read twice, so check each member before extracting it
+                    for member in tar:
+                        if not is_within_directory(
+                            working_directory,
+                            os.path.join(working_directory, member.name),
+                        ):
+                            raise Exception("Attempted Path Traversal in Tar File")
+                        tar.extract(member, working_directory)
+            else:
+                with tarfile.open(tar_file_name, "r:" + _tarfile_modes[codec]) as tar:
+                    safe_extract(tar, working_directory)
+            os.remove(tar_file_name)
+            break
+
+
+def _compress_working_directory_lst(working_directory_lst, codec="bz2"):
+    """
+    Compress the working directories of multiple jobs, used as task of a multiprocessing.Pool.
+
+    Args:
+        working_directory_lst (list): list of working directories
+        codec (str): compression codec
+    """
+    for working_directory in working_directory_lst:
+        job_name = os.path.basename(working_directory)
+        if os.path.isdir(working_directory) and not _is_compressed_directory(
+            working_directory, job_name
+        ):
+            _compress_working_directory(
+                working_directory=working_directory, job_name=job_name, codec=codec
+            )
+
+
+def _decompress_working_directory_lst(working_directory_lst):
+    """
+    Decompress the working directories of multiple jobs, used as task of a multiprocessing.Pool.
+
+    Args:
+        working_directory_lst (list): list of working directories
+    """
+    for working_directory in working_directory_lst:
+        if os.path.isdir(working_directory):
+            _decompress_working_directory(
+                working_directory=working_directory,
+                job_name=os.path.basename(working_directory),
+            )
+
+
+def _is_compressed_directory(working_directory, job_name):
+    return any(
+        os.path.isfile(os.path.join(working_directory, job_name + extension))
+        for extension in _compression_extensions.values()
+    )
+
+
 def _job_archive(job):
     """
     Compress HDF5 file of the job object to tar-archive
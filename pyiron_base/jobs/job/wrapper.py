@@ -7,6 +7,8 @@ The job wrapper is called from the run_job.py script, it restores the job from h
 
 import os
 import logging
+import subprocess
+import sys
 from pyiron_base.project.generic import Project
 from pyiron_base.state import state
 from pyiron_base.database.filetable import (
@@ -169,3 +171,142 @@ def job_wrapper_function(
     else:
         raise ValueError("Either job_id or file_path have to be not None.")
     job.run()
+
+
+def job_wrapper_subprocess_function(
+    working_directory, job_id=None, file_path=None, submit_on_remote=False, debug=False
+):
+    """
+    Execute a job in a new python interpreter by calling the pyiron_base.cli wrapper in a subprocess.
+
+    Args:
+        working_directory (str): directory where the HDF5 file of the job is located
+        job_id (int/ None): job id
+        file_path (str): path to the HDF5 file
+        submit_on_remote (bool): submit to queuing system on remote host
+        debug (bool): enable debug mode
+
+    Returns:
+        int: return code of the subprocess
+    """
+    if job_id is not None:
+        executable = [
+            "python",
+            "-m",
+            "pyiron_base.cli",
+            "wrapper",
+            "-p",
+            working_directory,
+            "-j",
+            str(job_id),
+        ]
+    elif file_path is not None:
+        executable = [
+            "python",
+            "-m",
+            "pyiron_base.cli",
+            "wrapper",
+            "-p",
+            working_directory,
+            "-f",
+            file_path,
+        ]
+    else:
+        raise ValueError("Either job_id or file_path have to be not None.")
+    if submit_on_remote:
+        executable.append("--submit")
+    if debug:
+        executable.append("--debug")
+    try:
+        return subprocess.run(
+            executable,
+            cwd=working_directory,
+            shell=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).returncode
+    except subprocess.CalledProcessError as e:
+        return e.returncode
+
+
+def job_wrapper_fork_function(
+    working_directory, job_id=None, file_path=None, submit_on_remote=False, debug=False
+):
+    """
+    Execute a job in a child process forked from the current python interpreter. In contrast to
+    :func:`job_wrapper_subprocess_function` the child starts with pyiron and its dependencies already imported, while
+    a crash of the job still only terminates the child process. On operating systems without fork() the job is
+    executed in a subprocess instead.
+
+    Args:
+        working_directory (str): directory where the HDF5 file of the job is located
+        job_id (int/ None): job id
+        file_path (str): path to the HDF5 file
+        submit_on_remote (bool): submit to queuing system on remote host
+        debug (bool): enable debug mode
+
+    Returns:
+        int: exit code of the child process
+    """
+    if not hasattr(os, "fork"):
+        return job_wrapper_subprocess_function(
+            working_directory=working_directory,
+            job_id=job_id,
+            file_path=file_path,
+            submit_on_remote=submit_on_remote,
+            debug=debug,
+        )
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 1
+        try:
+            _redirect_output_to_devnull()
+            os.chdir(working_directory)
+            job_wrapper_function(
+                working_directory=working_directory,
+                job_id=job_id,
+                file_path=file_path,
+                submit_on_remote=submit_on_remote,
+                debug=debug,
+            )
+            exit_code = 0
+        finally:
+            # never return to the caller in the child process
+            os._exit(exit_code)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def job_wrapper_job_function(job, hdf_session=False):
+    """
+    Execute an already loaded job, this is the target of processes forked from the python interpreter which prepared
+    the job. In contrast to :func:`job_wrapper_function` the job is not restored from the HDF5 file and the database.
+
+    Args:
+        job (GenericJob): saved job including its input files
+        hdf_session (bool): keep the HDF5 file of the job open while it is executed, so the results are written with a
+                            single file handle - only valid when no other process accesses the HDF5 file
+    """
+    _redirect_output_to_devnull()
+    os.chdir(job.project.path)
+    # the forked process must not share the database connection with the parent process
+    state.database.close_connection()
+    state.database.connection_timeout = 0
+    state.database.open_connection()
+    job.status.database = job.project.db
+    if hdf_session:
+        with job.project_hdf5.session(mode="a"):
+            job.run_static()
+    else:
+        job.run_static()
+
+
+def _redirect_output_to_devnull():
+    """
+    Like a subprocess, a forked child process does not write to the terminal of the parent process.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    sys.stdout = sys.stderr = os.fdopen(devnull, "w")
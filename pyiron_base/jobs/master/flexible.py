@@ -69,12 +69,7 @@ class FlexibleMaster(GenericMaster):
         return self.check_all_childs_finished()
 
     def check_all_childs_finished(self):
-        return set(
-            [
-                self.project.db.get_job_status(job_id=child_id)
-                for child_id in self.child_ids
-            ]
-        ) < set(job_status_finished_lst)
+        return set(self.get_child_status_counts().keys()) < set(job_status_finished_lst)
 
     def run_static(self):
         """
@@ -301,6 +301,25 @@ class GenericMaster(GenericJob):
             ]
         )
 
+    def get_child_status_counts(self):
+        """
+        Count the child jobs grouped by their status, with a single database query unless a custom child ID function
+        is set.
+
+        Returns:
+            dict: number of child jobs for each status {status: count}
+        """
+        if self._child_id_func is not None:
+            status_dict = {}
+            for child_id in self.child_ids:
+                status = self.project.db.get_job_status(job_id=child_id)
+                status_dict[status] = status_dict.get(status, 0) + 1
+            return status_dict
+        elif self.job_id is None:
+            return {}
+        else:
+            return self.project.db.get_child_status_counts(master_id=self.job_id)
+
     def __len__(self):
         """
         Length of the GenericMaster equal the number of childs appended.
@@ -320,17 +339,11 @@ class GenericMaster(GenericJob):
         Returns:
             dict, list, float, int: data or data object
         """
-        child_id_lst = self.child_ids
-        child_name_lst = [
-            self.project.db.get_item_by_id(child_id)["job"]
-            for child_id in self.child_ids
-        ]
+        child_name_dict = self._get_child_name_dict()
         if isinstance(item, int):
-            total_lst = self._job_name_lst + child_name_lst
+            total_lst = self._job_name_lst + list(child_name_dict.keys())
             item = total_lst[item]
-        return self._get_item_when_str(
-            item=item, child_id_lst=child_id_lst, child_name_lst=child_name_lst
-        )
+        return self._get_item_when_str(item=item, child_name_dict=child_name_dict)
 
     def __getattr__(self, item):
         """
@@ -441,22 +454,30 @@ class GenericMaster(GenericJob):
             self._child_id_func_str = child_id_func_str
             self._child_id_func = get_function_from_string(child_id_func_str)
 
-    def _get_item_when_str(self, item, child_id_lst, child_name_lst):
+    def _get_child_name_dict(self):
+        """
+        Get the job IDs of the child jobs by their job name
+
+        Returns:
+            dict: {child job name: child ID} ordered by the child ID
+        """
+        return {job_name: child_id for child_id, job_name in self.child_names.items()}
+
+    def _get_item_when_str(self, item, child_name_dict):
         """
         Helper function for __get_item__ when item is type string
 
         Args:
             item (str):
-            child_id_lst (list): a list containing all child job ids
-            child_name_lst (list): a list containing the names of all child jobs
+            child_name_dict (dict): the job IDs of all child jobs by their job name, see _get_child_name_dict()
 
         Returns:
             anything
         """
         name_lst = item.split("/")
         item_obj = name_lst[0]
-        if item_obj in child_name_lst:
-            child_id = child_id_lst[child_name_lst.index(item_obj)]
+        if item_obj in child_name_dict:
+            child_id = child_name_dict[item_obj]
             if len(name_lst) > 1:
                 return self.project.inspect(child_id)["/".join(name_lst[1:])]
             else:
@@ -145,13 +145,7 @@ class ListMaster(GenericMaster):
         if not self.submission_status.finished:
             return False
         else:
-            status_set = set(
-                [
-                    self._hdf5.db.get_item_by_id(child_id)["status"]
-                    for child_id in self.child_ids
-                ]
-            )
-            # status_set = set([job.get_status() for job in self.iter_jobs(convert_to_object=False)])
+            status_set = set(self.get_child_status_counts().keys())
             if "finished" in status_set:
                 return len(status_set) == 1
             else:
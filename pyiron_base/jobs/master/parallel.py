@@ -6,19 +6,29 @@ The parallel master class is a metajob consisting of a list of jobs which are ex
 """
 
 from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 
 import numpy as np
 import pandas
 import multiprocessing
+import multiprocessing.connection
 import importlib
 from pyiron_base.jobs.job.generic import GenericJob
 from pyiron_base.jobs.job.core import _doc_str_job_core_args
 from pyiron_base.jobs.master.generic import GenericMaster, _doc_str_generic_master_attr
 from pyiron_base.jobs.master.submissionstatus import SubmissionStatus
 from pyiron_base.jobs.job.extension.jobstatus import JobStatus
+from pyiron_base.jobs.job.util import (
+    _copy_restart_files,
+    _job_store_before_copy,
+)
+from pyiron_base.storage.helper_functions import write_hdf5
 from pyiron_base.state import state
-from pyiron_base.jobs.job.wrapper import job_wrapper_function
+from pyiron_base.jobs.job.wrapper import (
+    job_wrapper_fork_function,
+    job_wrapper_job_function,
+)
 from pyiron_base.utils.deprecate import deprecate
 
 __author__ = "Joerg Neugebauer, Jan Janssen"
@@ -70,6 +80,9 @@ class ParallelMaster(GenericMaster):
         self._ref_job = None
         self._output = GenericOutput()
         self._job_generator = None
+        self._child_id_dict = None
+        self._child_index = {}
+        self._ref_job_stored = False
         self.submission_status = SubmissionStatus(db=project.db, job_id=self.job_id)
         self.refresh_submission_status()
 
@@ -246,6 +259,33 @@ class ParallelMaster(GenericMaster):
         self.submission_status = SubmissionStatus(
             db=self._hdf5.project.db, job_id=self.job_id
         )
+        if not reloaded and self.job_id is not None:
+            # the copied child jobs received new job IDs
+            self._child_index = {}
+            self._get_child_index()
+            self._store_child_index()
+
+    def to_hdf(self, hdf=None, group_name=None):
+        """
+        Store the ParallelMaster in an HDF5 file
+
+        Args:
+            hdf (ProjectHDFio): HDF5 group object - optional
+            group_name (str): HDF5 subgroup name - optional
+        """
+        super(ParallelMaster, self).to_hdf(hdf=hdf, group_name=group_name)
+        self._store_child_index()
+
+    def from_hdf(self, hdf=None, group_name=None):
+        """
+        Restore the ParallelMaster from an HDF5 file
+
+        Args:
+            hdf (ProjectHDFio): HDF5 group object - optional
+            group_name (str): HDF5 subgroup name - optional
+        """
+        super(ParallelMaster, self).from_hdf(hdf=hdf, group_name=group_name)
+        self._child_index = self.project_hdf5.get("child_index", {})
 
     def is_finished(self):
         """
@@ -256,11 +296,16 @@ class ParallelMaster(GenericMaster):
         """
         if self.status.finished:
             return True
-        if len(self.child_ids) < len(self._job_generator):
+        status_dict = self.get_child_status_counts()
+        if sum(status_dict.values()) < len(self._job_generator):
             return False
-        return set(
-            [self.project.db.get_job_status(child_id) for child_id in self.child_ids]
-        ) < {"finished", "busy", "refresh", "aborted", "not_converged"}
+        return set(status_dict.keys()) < {
+            "finished",
+            "busy",
+            "refresh",
+            "aborted",
+            "not_converged",
+        }
 
     def iter_jobs(self, convert_to_object=True):
         """
@@ -272,22 +317,44 @@ class ParallelMaster(GenericMaster):
         Returns:
             yield: Yield of GenericJob or JobCore
         """
-        project_working_directory = self.project.open(self.job_name + "_hdf5")
-        for job_id in self._get_jobs_sorted():
-            yield project_working_directory.load(
-                job_id, convert_to_object=convert_to_object
+        child_index = self._get_child_index()
+        for job_name in self._get_jobs_sorted():
+            yield self.project.load(
+                child_index[job_name][0], convert_to_object=convert_to_object
             )
 
     def _get_jobs_sorted(self):
-        job_names = self.child_names.values()
-        return [
-            j
-            for j in [
-                self._job_generator.job_name(p)
-                for p in self._job_generator.parameter_list
-            ]
-            if j in job_names
-        ]
+        """
+        Get the names of the child jobs created by the job generator, in the order of the parameter list.
+
+        Returns:
+            list: child job names
+        """
+        child_index = self._get_child_index()
+        return sorted(
+            [
+                job_name
+                for job_name, (_, parameter_index) in child_index.items()
+                if parameter_index is not None
+            ],
+            key=lambda job_name: child_index[job_name][1],
+        )
+
+    def _get_child_name_dict(self):
+        """
+        Get the job IDs of the child jobs by their job name from the child index
+
+        Returns:
+            dict: {child job name: child ID} ordered by the child ID
+        """
+        if self._child_id_func is not None:
+            return super()._get_child_name_dict()
+        return {
+            job_name: job_id
+            for job_name, (job_id, _) in sorted(
+                self._get_child_index().items(), key=lambda item: item[1][0]
+            )
+        }
 
     def __len__(self):
         """
@@ -332,6 +399,8 @@ class ParallelMaster(GenericMaster):
             "{}, status: {}, finished".format(self.job_info_str, self.status)
         )
         self.collect_output()
+        self._get_child_index()
+        self._store_child_index()
 
         job_id = self.get_job_id()
         db_dict = {}
@@ -423,14 +492,15 @@ class ParallelMaster(GenericMaster):
         Args:
             job (GenericJob): child job to be started
         """
-        while job is not None:
-            self._logger.debug("create job: %s %s", job.job_info_str, job.master_id)
-            if not job.status.finished:
-                job.run()
-                self._logger.info(
-                    "{}: submitted job {}".format(self.job_name, job.job_name)
-                )
-            job = next(self._job_generator, None)
+        with self._create_child_jobs_batch():
+            while job is not None:
+                self._logger.debug("create job: %s %s", job.job_info_str, job.master_id)
+                if not job.status.finished:
+                    job.run()
+                    self._logger.info(
+                        "{}: submitted job {}".format(self.job_name, job.job_name)
+                    )
+                job = next(self._job_generator, None)
         self.submission_status.submitted_jobs = self.submission_status.total_jobs
         self.status.suspended = True
         if self.is_finished():
@@ -487,16 +557,49 @@ class ParallelMaster(GenericMaster):
         Args:
             job (GenericJob): child job to be started
         """
-        pool = multiprocessing.Pool(self.server.cores)
+        child_lst = []
+        with self._create_child_jobs_batch():
+            for i, p in enumerate(self._job_generator.parameter_list):
+                if hasattr(self._job_generator, "job_name"):
+                    job = self.create_child_job(
+                        self._job_generator.job_name(parameter=p)
+                    )
+                else:
+                    job = self.create_child_job(self.ref_job.job_name + "_" + str(i))
+                self._add_child_to_index(job=job, parameter_index=i)
+                job = self._job_generator.modify_job(job=job, parameter=p)
+                job.server.run_mode.modal = True
+                child_lst.append(job)
+        if (
+            "fork" in multiprocessing.get_all_start_methods()
+            and not state.database.database_is_disabled
+            and not (
+                state.queue_adapter is not None and state.queue_adapter.remote_flag
+            )
+        ):
+            self._run_child_jobs_pipelined(child_lst=child_lst)
+        else:
+            self._run_child_jobs_pool(child_lst=child_lst)
+        if state.database.database_is_disabled:
+            self.project.db.update()
+        self.status.collect = True
+        self.run()  # self.run_if_collect()
+
+    def _run_child_jobs_pool(self, child_lst):
+        """
+        Save all child jobs and write their input, afterwards execute them in a pool of processes, each child job is
+        reloaded from the database or the HDF5 file.
+
+        Args:
+            child_lst (list): list of child jobs
+        """
+        # existing child jobs are only updated, new ones are added to the database at once
+        for job in child_lst:
+            if job.job_id is not None:
+                job.to_hdf()
+        self._save_child_jobs(job_lst=[job for job in child_lst if job.job_id is None])
         job_lst = []
-        for i, p in enumerate(self._job_generator.parameter_list):
-            if hasattr(self._job_generator, "job_name"):
-                job = self.create_child_job(self._job_generator.job_name(parameter=p))
-            else:
-                job = self.create_child_job(self.ref_job.job_name + "_" + str(i))
-            job = self._job_generator.modify_job(job=job, parameter=p)
-            job.server.run_mode.modal = True
-            job.save()
+        for job in child_lst:
             job.project_hdf5.create_working_directory()
             job.write_input()
             if state.database.database_is_disabled or (
@@ -513,11 +616,55 @@ class ParallelMaster(GenericMaster):
                 )
             else:
                 job_lst.append((job.project.path, job.job_id, None, False, False))
-        pool.starmap(job_wrapper_function, job_lst)
-        if state.database.database_is_disabled:
-            self.project.db.update()
-        self.status.collect = True
-        self.run()  # self.run_if_collect()
+        # the pool processes are forked from the master, so the children start without importing pyiron again, while
+        # each child runs in its own process forked from the pool process.
+        with multiprocessing.Pool(self.server.cores) as pool:
+            pool.starmap(job_wrapper_fork_function, job_lst)
+
+    def _run_child_jobs_pipelined(self, child_lst):
+        """
+        Execute the child jobs in processes forked from the ParallelMaster while the next child jobs are still
+        prepared. The database entries of the new child jobs are added at once, afterwards each child job is written to
+        its HDF5 file and its input is written, before it is started in its own process as soon as one of the
+        server.cores processes is available. The child process inherits the prepared job, so it is not reloaded from
+        the database or the HDF5 file. If the child jobs have their own HDF5 files, each child process writes its
+        results with a single file handle.
+
+        Args:
+            child_lst (list): list of child jobs
+        """
+        is_new_lst = [job.job_id is None for job in child_lst]
+        self._add_child_jobs_to_database(
+            job_lst=[job for job, is_new in zip(child_lst, is_new_lst) if is_new]
+        )
+        context = multiprocessing.get_context("fork")
+        process_lst = []
+        try:
+            for job, is_new in zip(child_lst, is_new_lst):
+                with job.project_hdf5.session(mode="a"):
+                    job.to_hdf()
+                    if is_new:
+                        job.project_hdf5["job_id"] = job.job_id
+                if is_new:
+                    self._write_child_job_input(job=job)
+                job.project_hdf5.create_working_directory()
+                job.write_input()
+                while len(process_lst) >= self.server.cores:
+                    multiprocessing.connection.wait(
+                        [process.sentinel for process in process_lst]
+                    )
+                    process_lst = [
+                        process for process in process_lst if process.is_alive()
+                    ]
+                process = context.Process(
+                    target=job_wrapper_job_function,
+                    kwargs={"job": job, "hdf_session": self.server.new_hdf},
+                )
+                process.start()
+                process_lst.append(process)
+        finally:
+            for process in process_lst:
+                process.join()
 
     def run_static(self):
         """
@@ -645,7 +792,9 @@ class ParallelMaster(GenericMaster):
             GenericJob: next job
         """
         project = self.child_project
-        if not self.server.new_hdf:
+        if self._child_id_dict is not None:
+            job_id = self._child_id_dict.get(job_name, None)
+        elif not self.server.new_hdf:
             where_dict = {
                 "job": str(job_name),
                 "project": str(self.project_hdf5.project_path),
@@ -673,22 +822,27 @@ class ParallelMaster(GenericMaster):
             self._logger.debug("job - status: {}".format(ham.status))
             return ham
 
-        job = self.ref_job.copy()
+        job = self._copy_ref_job()
         job = self._load_all_child_jobs(job_to_load=job)
         job.project_hdf5 = self.child_hdf(job_name)
         if isinstance(job, GenericMaster):
             for sub_job in job._job_object_dict.values():
                 self._child_job_update_hdf(parent_job=job, child_job=sub_job)
+        master_id = self.get_job_id()
         self._logger.debug(
             "create_job:: {} {} {} {}".format(
                 self.project_hdf5.path,
                 self._name,
                 self.project_hdf5.h5_path,
-                str(self.get_job_id()),
+                str(master_id),
             )
         )
         job._name = job_name
-        job.master_id = self.get_job_id()
+        if self._child_id_dict is not None:
+            # the job does not exist in the database, so there is no need to query its job id
+            job._master_id = master_id
+        else:
+            job.master_id = master_id
         job.status.initialized = True
         if self.server.run_mode.non_modal and job.server.run_mode.modal:
             job.server.run_mode.non_modal = True
@@ -697,6 +851,208 @@ class ParallelMaster(GenericMaster):
         self._logger.info("{}: run job {}".format(self.job_name, job.job_name))
         return job
 
+    @contextmanager
+    def _create_child_jobs_batch(self):
+        """
+        Context manager to create many child jobs with create_child_job(): the existing child jobs are looked up in the
+        database with a single query and the reference job is stored only once, each child job is then restored from
+        the stored reference job rather than copying the reference job including storing it again.
+
+        The context is only valid as long as the reference job is not modified and every child job name is requested
+        only once, nested calls reuse the outer context.
+        """
+        if self._child_id_dict is not None:
+            yield
+            return
+        ref_job = self.ref_job
+        delete_file_after_copy = _job_store_before_copy(job=ref_job)
+        self._child_id_dict = self._get_child_job_ids()
+        self._ref_job_stored = True
+        try:
+            yield
+        finally:
+            self._child_id_dict = None
+            self._ref_job_stored = False
+            if delete_file_after_copy:
+                ref_job.project_hdf5.remove_file()
+
+    def _get_child_job_ids(self):
+        """
+        Get the job ids of all existing child jobs with a single database query.
+
+        Returns:
+            dict: job id for each job name
+        """
+        if not self.server.new_hdf:
+            h5_path = str(self.project_hdf5.h5_path)
+            response = self.project.db.get_items_dict(
+                {
+                    "project": str(self.project_hdf5.project_path),
+                    "subjob": h5_path + "/%",
+                },
+                return_all_columns=True,
+            )
+            response = [r for r in response if r["subjob"] == h5_path + "/" + r["job"]]
+        else:
+            response = self.project.db.get_items_dict(
+                {"project": str(self.child_project.project_path)},
+                return_all_columns=True,
+            )
+        # like create_child_job() the last job wins if a job name exists multiple times
+        return {r["job"]: r["id"] for r in sorted(response, key=lambda r: r["id"])}
+
+    def _add_child_to_index(self, job, parameter_index):
+        """
+        Add a child job to the child index, the job ID of a new child job is added once it is saved.
+
+        Args:
+            job (GenericJob): child job
+            parameter_index (int): index of the parameter of the child job in the parameter list of the job generator
+        """
+        self._child_index[job.job_name] = [job.job_id, parameter_index]
+
+    def _get_child_index(self):
+        """
+        Get the child index, which maps the name of each child job to its job ID and to the index of its parameter in
+        the parameter list of the job generator. The index is stored in the HDF5 file of the ParallelMaster, it is only
+        updated from the database when it is empty or contains child jobs which were not saved before. The file based
+        database does not provide persistent job IDs, so in this case the index is always updated.
+
+        Returns:
+            dict: {child job name: [child ID, parameter index]}
+        """
+        if (
+            state.database.database_is_disabled
+            or len(self._child_index) == 0
+            or any(job_id is None for job_id, _ in self._child_index.values())
+        ):
+            self._update_child_index()
+        return self._child_index
+
+    def _update_child_index(self):
+        """
+        Update the child index with the job IDs of all existing child jobs from a single database query, parameter
+        indices which are not yet known are taken from the job generator.
+        """
+        parameter_index_dict = None
+        child_index = {}
+        for job_name, job_id in self._get_child_job_ids().items():
+            if job_name in self._child_index:
+                parameter_index = self._child_index[job_name][1]
+            else:
+                if parameter_index_dict is None:
+                    parameter_index_dict = self._get_parameter_index_dict()
+                parameter_index = parameter_index_dict.get(job_name, None)
+            child_index[job_name] = [job_id, parameter_index]
+        self._child_index = child_index
+
+    def _get_parameter_index_dict(self):
+        """
+        Get the index of the parameter in the parameter list of the job generator for each child job name.
+
+        Returns:
+            dict: {child job name: parameter index}
+        """
+        if self._job_generator is None:
+            return {}
+        return {
+            self._job_generator.job_name(p): i
+            for i, p in enumerate(self._job_generator.parameter_list)
+        }
+
+    def _store_child_index(self):
+        """
+        Store the saved child jobs of the child index in the HDF5 file of the ParallelMaster.
+        """
+        if state.database.database_is_disabled:
+            return
+        self.project_hdf5["child_index"] = {
+            job_name: [int(job_id), parameter_index]
+            for job_name, (job_id, parameter_index) in self._child_index.items()
+            if job_id is not None
+        }
+
+    def _copy_ref_job(self):
+        """
+        Copy the reference job, inside _create_child_jobs_batch() from the already stored reference job.
+
+        Returns:
+            GenericJob: copy of the reference job
+        """
+        ref_job = self.ref_job
+        if not self._ref_job_stored or type(ref_job).copy is not GenericJob.copy:
+            return ref_job.copy()
+        job = ref_job.__class__(
+            job_name=ref_job.job_name, project=ref_job.project_hdf5.open("..")
+        )
+        job.reset_job_id()
+        job.from_hdf()
+        return job
+
+    def _save_child_jobs(self, job_lst):
+        """
+        Save multiple new child jobs like GenericJob.save(), but add their database entries in a single transaction.
+
+        Args:
+            job_lst (list): list of GenericJob objects without job id
+        """
+        for job in job_lst:
+            with job.project_hdf5.session(mode="a"):
+                job.to_hdf()
+        self._add_child_jobs_to_database(job_lst=job_lst)
+        for job in job_lst:
+            if not state.database.database_is_disabled:
+                write_hdf5(
+                    job.project_hdf5.file_name,
+                    job.job_id,
+                    title=job.job_name + "/job_id",
+                    overwrite="update",
+                )
+            self._write_child_job_input(job=job)
+
+    def _add_child_jobs_to_database(self, job_lst):
+        """
+        Add the database entries of multiple new child jobs in a single transaction and set their status to created.
+
+        Args:
+            job_lst (list): list of GenericJob objects without job id
+        """
+        if not state.database.database_is_disabled:
+            db_entry_lst = [job.db_entry() for job in job_lst]
+            for db_entry in db_entry_lst:
+                db_entry["status"] = "created"
+            job_id_lst = self.project.db.add_items(par_dict_lst=db_entry_lst)
+            for job, job_id in zip(job_lst, job_id_lst):
+                job._job_id = job_id
+                if job.job_name in self._child_index:
+                    self._child_index[job.job_name][0] = job_id
+                job._status = JobStatus(
+                    initial_status="created", db=self.project.db, job_id=job_id
+                )
+            self._store_child_index()
+        else:
+            for job in job_lst:
+                job.status.created = True
+
+    def _write_child_job_input(self, job):
+        """
+        Write the input files of a new child job after it was saved, like GenericJob.save().
+
+        Args:
+            job (GenericJob): saved child job
+        """
+        if job._check_if_input_should_be_written():
+            job.project_hdf5.create_working_directory()
+            job.write_input()
+            _copy_restart_files(job=job)
+        job._calculate_predecessor()
+        print(
+            "The job "
+            + job.job_name
+            + " was saved and received the ID: "
+            + str(job.job_id if job.job_id is not None else job.job_name)
+        )
+
     def _db_server_entry(self):
         """
         connect all the info regarding the server into a single word that can be used e.g. as entry in a database
@@ -854,6 +1210,9 @@ class JobGenerator(object):
                 self.job_name(parameter=current_paramenter)
             )
             if job is not None:
+                self._master._add_child_to_index(
+                    job=job, parameter_index=self._childcounter
+                )
                 self._childcounter += 1
                 job = self.modify_job(job=job, parameter=current_paramenter)
                 return job
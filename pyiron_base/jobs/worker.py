@@ -10,8 +10,13 @@ import time
 from datetime import datetime
 from multiprocessing import Pool
 import numpy as np
+import pandas
 from pyiron_base.state import state
 from pyiron_base.jobs.job.template import PythonTemplateJob
+from pyiron_base.jobs.job.wrapper import (
+    job_wrapper_fork_function,
+    job_wrapper_subprocess_function,
+)
 
 
 __author__ = "Jan Janssen"
@@ -26,6 +31,9 @@ __status__ = "production"
 __date__ = "Nov 5, 2021"
 
 
+_MIN_SLEEP_INTERVAL = 0.1
+
+
 def worker_function(args):
     """
     The worker function is executed inside an aproc processing pool.
@@ -35,48 +43,24 @@ def worker_function(args):
 
     Arguments inside the argument list:
         working_directory (str): working directory of the job
-        job_id (int/ None): job ID
-        hdf5_file (str): path to the HDF5 file of the job
-        h5_path (str): path inside the HDF5 file to load the job
-        submit_on_remote (bool): submit to queuing system on remote host
-        debug (bool): enable debug mode [True/False] (optional)
+        job_link (int/ str): job ID or path to the HDF5 file of the job followed by the path inside the HDF5 file
+        executor (str): "subprocess" to execute the job in a new python interpreter or "fork" to execute it in a child
+            process forked from the worker process (optional, default "subprocess")
     """
-    import subprocess
-
-    working_directory, job_link = args
+    working_directory, job_link = args[:2]
+    executor = args[2] if len(args) > 2 else "subprocess"
     if isinstance(job_link, int) or str(job_link).isdigit():
-        executable = [
-            "python",
-            "-m",
-            "pyiron_base.cli",
-            "wrapper",
-            "-p",
-            working_directory,
-            "-j",
-            str(job_link),
-        ]
+        job_id, file_path = int(job_link), None
     else:
-        executable = [
-            "python",
-            "-m",
-            "pyiron_base.cli",
-            "wrapper",
-            "-p",
-            working_directory,
-            "-f",
-            job_link,
-        ]
-    try:
-        _ = subprocess.run(
-            executable,
-            cwd=working_directory,
-            shell=False,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            universal_newlines=True,
+        job_id, file_path = None, job_link
+    if executor == "fork":
+        job_wrapper_fork_function(
+            working_directory=working_directory, job_id=job_id, file_path=file_path
+        )
+    else:
+        job_wrapper_subprocess_function(
+            working_directory=working_directory, job_id=job_id, file_path=file_path
         )
-    except subprocess.CalledProcessError:
-        pass
 
 
 class WorkerJob(PythonTemplateJob):
@@ -101,6 +85,10 @@ class WorkerJob(PythonTemplateJob):
     >>> job_worker.input.cores_per_job = 2
     >>> job_worker.run()
 
+    By default each job is executed in a child process forked from one of the worker processes, which already imported
+    pyiron, so short python jobs do not pay for starting a new interpreter. Setting job_worker.executor = "subprocess"
+    before running the worker starts a new python interpreter for each job instead.
+
     The calculation are assinged to the worker by setting the run_mode to worker and
     assigning the job_id of the worker as master_id of each job. In this example a total
     of ten toyjobs are attached to the worker, with each toyjob using two cores.
@@ -136,8 +124,26 @@ class WorkerJob(PythonTemplateJob):
         self.input.child_runtime = 0
         self.input.queue_limit_factor = 2
         self.input.maxtasksperchild = 1
+        self.input.executor = "fork"
         self._python_only_job = True
 
+    @property
+    def executor(self):
+        """
+        str: "fork" to execute the jobs in child processes forked from the already initialised worker processes or
+            "subprocess" to start a new python interpreter for each job.
+        """
+        # workers created before the executor was introduced start a new interpreter for each job
+        return self.input.get("executor", "subprocess")
+
+    @executor.setter
+    def executor(self, executor):
+        if executor not in ["fork", "subprocess"]:
+            raise ValueError(
+                f"The executor has to be either 'fork' or 'subprocess', not {executor}."
+            )
+        self.input.executor = executor
+
     @property
     def project_to_watch(self):
         rel_path = os.path.relpath(self.input.project, self.project.path)
@@ -186,6 +192,34 @@ class WorkerJob(PythonTemplateJob):
         else:
             self.run_static_without_database()
 
+    @staticmethod
+    def _get_child_table(pr, master_id, status):
+        """
+        Get the jobs assigned to the worker with a given status. In contrast to pr.job_table() the filtering happens
+        in the database, so the cost of each query scales with the number of matching jobs rather than with the size
+        of the watched project.
+
+        Args:
+            pr (Project): project watched by the worker
+            master_id (int): job id of the worker
+            status (str): job status
+
+        Returns:
+            pandas.DataFrame: matching jobs with the columns id, projectpath, project and timestart
+        """
+        project_path = pr.project_path if pr.project_path != "./" else ""
+        item_dict = {
+            "masterid": master_id,
+            "status": status,
+            "project": project_path + "%",
+        }
+        if pr.user is not None:
+            item_dict["username"] = pr.user
+        return pandas.DataFrame(
+            pr.db.get_items_dict(item_dict=item_dict),
+            columns=["id", "projectpath", "project", "timestart"],
+        )
+
     def run_static_with_database(self):
         self.status.running = True
         master_id = self.job_id
@@ -195,38 +229,36 @@ class WorkerJob(PythonTemplateJob):
         active_job_ids, res_lst = [], []
         process = psutil.Process(os.getpid())
         number_tasks = int(self.server.cores / self.cores_per_job)
+        sleep_interval = min(_MIN_SLEEP_INTERVAL, self.input.sleep_interval)
         with Pool(
             processes=number_tasks, maxtasksperchild=self.input.maxtasksperchild
         ) as pool:
             while True:
                 # Check the database if there are more calculation to execute
-                df = pr.job_table()
-                df_sub = df[
-                    (df["status"] == "submitted")
-                    & (df["masterid"] == master_id)
-                    & (~df["id"].isin(active_job_ids))
-                ]
+                df_sub = self._get_child_table(
+                    pr=pr, master_id=master_id, status="submitted"
+                )
+                df_sub = df_sub[~df_sub["id"].isin(active_job_ids)]
                 if (
                     len(df_sub) > 0
                     and sum([i for r, i in res_lst if not r.ready()])
                     < number_tasks * self.input.queue_limit_factor
                 ):  # Check if there are jobs to execute
-                    path_lst = [
-                        [pp, p, job_id]
+                    job_lst = [
+                        [p, job_id, self.executor]
+                        if pp is None
+                        else [os.path.join(pp, p), job_id, self.executor]
                         for pp, p, job_id in zip(
                             df_sub["projectpath"].values,
                             df_sub["project"].values,
                             df_sub["id"].values,
                         )
-                        if job_id not in active_job_ids
-                    ]
-                    job_lst = [
-                        [p, job_id] if pp is None else [os.path.join(pp, p), job_id]
-                        for pp, p, job_id in path_lst
                     ]
                     active_job_ids += [j[1] for j in job_lst]
                     result = pool.map_async(worker_function, job_lst)
                     res_lst.append([result, len(job_lst)])
+                    # New jobs keep arriving, so poll again soon
+                    sleep_interval = min(_MIN_SLEEP_INTERVAL, self.input.sleep_interval)
                 elif self.status.collect or self.status.aborted or self.status.finished:
                     if self.status.collect:
                         while sum([i for r, i in res_lst if not r.ready()]) > 0:
@@ -236,14 +268,14 @@ class WorkerJob(PythonTemplateJob):
                     break  # The infinite loop can be stopped by setting the job status to collect.
                 else:  # The sleep interval can be set as part of the input
                     if self.input.child_runtime > 0:
-                        df_run = df[
-                            (df["status"] == "running") & (df["masterid"] == master_id)
-                        ]
+                        df_run = self._get_child_table(
+                            pr=pr, master_id=master_id, status="running"
+                        )
                         if len(df_run) > 0:
                             for job_id in df_run[
                                 (
                                     np.array(datetime.now(), dtype="datetime64[ns]")
-                                    - df_run.timestart.values
+                                    - df_run.timestart.values.astype("datetime64[ns]")
                                 ).astype("timedelta64[s]")
                                 > np.array(self.input.child_runtime).astype(
                                     "timedelta64[s]"
@@ -252,7 +284,9 @@ class WorkerJob(PythonTemplateJob):
                                 self.project.db.set_job_status(
                                     job_id=job_id, status="aborted"
                                 )
-                    time.sleep(self.input.sleep_interval)
+                    # Back off while the queue is idle or full, up to the sleep interval defined in the input
+                    time.sleep(sleep_interval)
+                    sleep_interval = min(2 * sleep_interval, self.input.sleep_interval)
 
                 # job submission
                 with open(log_file, "a") as f:
@@ -261,7 +295,7 @@ class WorkerJob(PythonTemplateJob):
                         + " "
                         + str(len(active_job_ids))
                         + " "
-                        + str(len(df))
+                        + str(sleep_interval)
                         + " "
                         + str(len(df_sub))
                         + " "
@@ -302,7 +336,9 @@ class WorkerJob(PythonTemplateJob):
                     < number_tasks * self.input.queue_limit_factor
                 ):
                     job_submit_lst = [
-                        self._get_working_directory_and_h5path(path=f) for f in file_lst
+                        self._get_working_directory_and_h5path(path=f)
+                        + (self.executor,)
+                        for f in file_lst
                     ]
                     file_memory_lst += file_lst
                     result = pool.map_async(worker_function, job_submit_lst)
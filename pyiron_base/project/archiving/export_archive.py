@@ -1,9 +1,14 @@
+from contextlib import contextmanager
+import gzip
 import os
 import numpy as np
+import shutil
 from shutil import copyfile
+import subprocess
 from pyfileindex import PyFileIndex
 import tarfile
 from shutil import rmtree
+from tqdm.auto import tqdm
 from pyiron_base.project.archiving.shared import getdir
 from pyiron_base.utils.instance import static_isinstance
 
@@ -59,16 +64,25 @@ def compress_dir(archive_directory):
 
 
 def copy_files_to_archive(
-    directory_to_transfer, archive_directory, compressed=True, copy_all_files=False
+    directory_to_transfer,
+    archive_directory,
+    compressed=True,
+    copy_all_files=False,
+    cores=1,
+    progress=True,
 ):
     """
     Create an archive of jobs in directory_to_transfer.
 
+    For a compressed archive the files are written directly to the tarball, without a temporary copy of the project.
+
     Args:
         directory_to_transfer (str): project directory with jobs to export
         archive_directory (str): name of the final archive; if no file ending is given .tar.gz is added automatically when needed
         compressed (bool): if True compress archive_directory as a tarball; default True
         copy_all_files (bool): if True include job output files in archive, otherwise just include .h5 files; default False
+        cores (int): number of threads to compress the archive with, requires pigz for more than one; default 1
+        progress (bool): if True show a progress bar; default True
     """
     if archive_directory[-7:] == ".tar.gz":
         archive_directory = archive_directory[:-7]
@@ -86,28 +100,73 @@ def copy_files_to_archive(
         pfi = PyFileIndex(path=directory_to_transfer)
     df_files = pfi.dataframe[~pfi.dataframe.is_directory]
 
-    # Create directories
-    dir_lst = generate_list_of_directories(
-        df_files=df_files,
-        directory_to_transfer=directory_to_transfer,
-        archive_directory=archive_directory,
-    )
-    # print(dir_lst)
-    for d in dir_lst:
-        os.makedirs(d, exist_ok=True)
-    # Copy files
     dir_name_transfer = getdir(path=directory_to_transfer)
-    for f in df_files.path.values:
-        copyfile(
-            f,
-            os.path.join(
-                archive_directory,
-                dir_name_transfer,
-                os.path.relpath(f, directory_to_transfer),
-            ),
-        )
+    file_lst = df_files.path.values
+    if progress:
+        file_lst = tqdm(file_lst, desc="Exporting files")
     if compressed:
-        compress_dir(archive_directory)
+        # the archive members keep the layout of the former temporary copy, relative to the working directory
+        arch_dir_rel = os.path.relpath(archive_directory, os.getcwd())
+        with _open_compressed_file(archive_directory + ".tar.gz", cores=cores) as f:
+            with tarfile.open(fileobj=f, mode="w|") as tar:
+                for file in file_lst:
+                    tar.add(
+                        file,
+                        arcname=os.path.join(
+                            arch_dir_rel,
+                            dir_name_transfer,
+                            os.path.relpath(file, directory_to_transfer),
+                        ),
+                    )
+    else:
+        # Create directories
+        dir_lst = generate_list_of_directories(
+            df_files=df_files,
+            directory_to_transfer=directory_to_transfer,
+            archive_directory=archive_directory,
+        )
+        # print(dir_lst)
+        for d in dir_lst:
+            os.makedirs(d, exist_ok=True)
+        # Copy files
+        for f in file_lst:
+            copyfile(
+                f,
+                os.path.join(
+                    archive_directory,
+                    dir_name_transfer,
+                    os.path.relpath(f, directory_to_transfer),
+                ),
+            )
+
+
+@contextmanager
+def _open_compressed_file(file_name, cores=1):
+    """
+    Open a gzip compressed file for writing, compressed by pigz with multiple threads if it is available.
+
+    Args:
+        file_name (str): name of the compressed file
+        cores (int): number of compression threads
+
+    Yields:
+        file: binary file object to write the uncompressed data to
+    """
+    pigz = shutil.which("pigz") if cores > 1 else None
+    if pigz is None:
+        with gzip.open(file_name, "wb") as f:
+            yield f
+    else:
+        with open(file_name, "wb") as f_out:
+            process = subprocess.Popen(
+                [pigz, "-p", str(cores), "-c"], stdin=subprocess.PIPE, stdout=f_out
+            )
+            try:
+                yield process.stdin
+            finally:
+                process.stdin.close()
+                if process.wait() != 0:
+                    raise RuntimeError(f"pigz failed to compress {file_name}.")
 
 
 def export_database(project_instance, directory_to_transfer, archive_directory):
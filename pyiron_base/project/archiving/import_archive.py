@@ -1,11 +1,12 @@
 import os
 import pandas
 import numpy as np
-from shutil import rmtree
 from distutils.dir_util import copy_tree
 import tarfile
+from tqdm.auto import tqdm
 from pyiron_base.project.archiving.shared import getdir
 from pyiron_base.utils.instance import static_isinstance
+from pyiron_base.utils.safetar import is_within_directory
 from pyiron_base.state import state
 
 
@@ -27,7 +28,36 @@ def extract_archive(archive_directory):
     tar.close()
 
 
-def import_jobs(project_instance, archive_directory, df, compressed=True):
+def extract_archive_to_project(archive_directory, destination, progress=True):
+    """
+    Extract the files of a compressed archive directly into the project directory, without a temporary copy of the
+    archive directory.
+
+    Args:
+        archive_directory (str): path of the archive relative to the working directory, without the .tar.gz extension
+        destination (str): project directory to extract the files to
+        progress (bool): if True show a progress bar; default True
+    """
+    prefix = os.path.normpath(archive_directory)
+    with tarfile.open(archive_directory + ".tar.gz", "r|gz") as tar:
+        member_iter = tar
+        if progress:
+            member_iter = tqdm(tar, desc="Importing files")
+        for member in member_iter:
+            member_path = os.path.relpath(os.path.normpath(member.name), prefix)
+            if member_path == "." or member_path.startswith(os.pardir):
+                continue
+            if not is_within_directory(
+                destination, os.path.join(destination, member_path)
+            ):
+                raise Exception("Attempted Path Traversal in Tar File")
+            member.name = member_path
+            tar.extract(member, destination)
+
+
+def import_jobs(
+    project_instance, archive_directory, df, compressed=True, progress=True
+):
     # Copy HDF5 files
     # if the archive_directory is a path(string)/name of the compressed file
     if static_isinstance(
@@ -48,18 +78,20 @@ def import_jobs(project_instance, archive_directory, df, compressed=True):
             does not have the correct format paths
             as string or pyiron Project objects are expected"""
         )
-    if compressed:
-        extract_archive(os.path.relpath(archive_directory, os.getcwd()))
-
     archive_name = getdir(path=archive_directory)
 
     # destination folder
     des = project_instance.path
-    # source folder; archive folder
-    src = os.path.abspath(archive_directory)
-    copy_tree(src, des)
     if compressed:
-        rmtree(src)
+        extract_archive_to_project(
+            os.path.relpath(archive_directory, os.getcwd()),
+            destination=des,
+            progress=progress,
+        )
+    else:
+        # source folder; archive folder
+        src = os.path.abspath(archive_directory)
+        copy_tree(src, des)
 
     # # Update Database
     pr_import = project_instance.open(os.curdir)
@@ -70,7 +102,7 @@ def import_jobs(project_instance, archive_directory, df, compressed=True):
     ]
     df["projectpath"] = len(df) * [pr_import.root_path]
     # Add jobs to database
-    job_id_lst = []
+    entry_lst = []
     for entry in df.dropna(axis=1).to_dict(orient="records"):
         if "id" in entry:
             del entry["id"]
@@ -84,16 +116,18 @@ def import_jobs(project_instance, archive_directory, df, compressed=True):
             entry["timestop"] = pandas.to_datetime(entry["timestop"])
         if "username" not in entry:
             entry["username"] = state.settings.login_user
-        job_id = pr_import.db.add_item_dict(par_dict=entry)
-        job_id_lst.append(job_id)
+        entry_lst.append(entry)
+    job_id_lst = pr_import.db.add_items(par_dict_lst=entry_lst)
 
     # Update parent and master ids
-    for job_id, masterid, parentid in zip(
-        job_id_lst,
-        update_id_lst(record_lst=df["masterid"].values, job_id_lst=job_id_lst),
-        update_id_lst(record_lst=df["parentid"].values, job_id_lst=job_id_lst),
-    ):
-        if masterid is not None or parentid is not None:
-            pr_import.db.item_update(
-                item_id=job_id, par_dict={"parentid": parentid, "masterid": masterid}
+    pr_import.db.items_update(
+        item_lst=[
+            (job_id, {"parentid": parentid, "masterid": masterid})
+            for job_id, masterid, parentid in zip(
+                job_id_lst,
+                update_id_lst(record_lst=df["masterid"].values, job_id_lst=job_id_lst),
+                update_id_lst(record_lst=df["parentid"].values, job_id_lst=job_id_lst),
             )
+            if masterid is not None or parentid is not None
+        ]
+    )
@@ -5,6 +5,8 @@
 The project object is the central import point of pyiron - all other objects can be created from this one
 """
 
+from functools import partial
+import multiprocessing
 import os
 import posixpath
 import shutil
@@ -31,7 +33,12 @@ from pyiron_base.database.jobtable import (
 from pyiron_base.storage.hdfio import ProjectHDFio
 from pyiron_base.storage.filedata import load_file
 from pyiron_base.utils.deprecate import deprecate
-from pyiron_base.jobs.job.util import _special_symbol_replacements, _get_safe_job_name
+from pyiron_base.jobs.job.util import (
+    _special_symbol_replacements,
+    _get_safe_job_name,
+    _compress_working_directory_lst,
+    _decompress_working_directory_lst,
+)
 from pyiron_base.interfaces.has_groups import HasGroups
 from pyiron_base.jobs.job.jobtype import JobType, JobTypeChoice, JobFactory
 from pyiron_base.jobs.job.extension.server.queuestatus import (
@@ -43,11 +50,14 @@ from pyiron_base.jobs.job.extension.server.queuestatus import (
     update_from_remote,
     queue_enable_reservation,
     queue_check_job_is_waiting_or_running,
+    QUEUE_SCRIPT_PREFIX,
 )
 from pyiron_base.project.external import Notebook
 from pyiron_base.project.data import ProjectData
 from pyiron_base.project.archiving import export_archive, import_archive
 from typing import Generator, Union, Dict
+from queue import Queue, Full as QueueFull
+from threading import Event, Thread
 
 __author__ = "Joerg Neugebauer, Jan Janssen"
 __copyright__ = (
@@ -557,11 +567,14 @@ class Project(ProjectPath, HasGroups):
         recursive: bool = True,
         convert_to_object: bool = True,
         progress: bool = True,
+        prefetch: int = 0,
         **kwargs: dict,
     ) -> Generator:
         """
         Iterate over the jobs within the current project and it is sub projects
 
+        The jobs are created from the rows of a single job table query rather than querying the database for each job.
+
         Args:
             path (str): HDF5 path inside each job object. (Default is None, which just uses the top level of the job's
                 HDF5 path.)
@@ -569,6 +582,8 @@ class Project(ProjectPath, HasGroups):
             convert_to_object (bool): load the full GenericJob object, else just return the HDF5 / JobCore object.
                                      (Default is True, convert everything to the full python object.)
             progress (bool): add an interactive progress bar to the iteration. (Default is True, show the bar.)
+            prefetch (int): number of jobs to load ahead in a background thread, while the current job is processed.
+                            (Default is 0, load the jobs only when they are requested.)
             **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
                             (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
                             instances of any character
@@ -581,26 +596,57 @@ class Project(ProjectPath, HasGroups):
             case, you may seriously wish to consider setting `convert_to_object=False` and access only the HDF5/JobCore
             representation of the jobs instead.
         """
-        job_id_lst = self.job_table(recursive=recursive, **kwargs)["id"]
+        db_entry_lst = _get_db_entries(
+            self.job_table(recursive=recursive, all_columns=True, **kwargs)
+        )
+        job_lst = (
+            self._load_from_db_entry(
+                db_entry=db_entry, path=path, convert_to_object=convert_to_object
+            )
+            for db_entry in db_entry_lst
+        )
+        if prefetch > 0:
+            job_lst = _prefetch(iterable=job_lst, size=prefetch)
         if progress:
-            job_id_lst = tqdm(job_id_lst)
-        for job_id in job_id_lst:
-            if path is not None:
-                yield self.load(job_id, convert_to_object=False)[path]
-            else:  # Backwards compatibility - in future the option convert_to_object should be removed
-                yield self.load(job_id, convert_to_object=convert_to_object)
+            job_lst = tqdm(job_lst, total=len(db_entry_lst))
+        yield from job_lst
 
-    def iter_output(self, recursive=True):
+    def _load_from_db_entry(self, db_entry, path=None, convert_to_object=True):
+        """
+        Load a job from its database entry, see iter_jobs()
+
+        Args:
+            db_entry (dict): database entry of the job
+            path (str): HDF5 path inside the job object
+            convert_to_object (bool): load the full GenericJob object, else just return the JobCore object
+
+        Returns:
+            GenericJob, JobCore, object: job or data at the HDF5 path inside the job
+        """
+        from pyiron_base.jobs.job.path import JobPath
+
+        job = JobPath.from_db_entry(db_entry)
+        if path is not None:
+            return job[path]
+        # Backwards compatibility - in future the option convert_to_object should be removed
+        if convert_to_object:
+            job = job.to_object()
+            job.reset_job_id(job_id=db_entry["id"])
+            job.set_input_to_read_only()
+        return job
+
+    def iter_output(self, recursive=True, prefetch=0):
         """
         Iterate over the output of jobs within the current project and it is sub projects
 
         Args:
             recursive (bool): search subprojects [True/False] - True by default
+            prefetch (int): number of jobs to load ahead in a background thread - 0 by default
 
         Returns:
             yield: Yield of GenericJob or JobCore
         """
-        return self.iter_jobs(path="output", recursive=recursive)
+        return self.iter_jobs(path="output", recursive=recursive, prefetch=prefetch)
 
     def iter_groups(self, progress: bool = True) -> Generator:
         """
@@ -1006,29 +1052,88 @@ class Project(ProjectPath, HasGroups):
 
         If `jobs` is not given, check for all jobs listed as running in the current project.
 
+        All jobs are compared to a single snapshot of the queuing system, jobs which are listed as running or
+        submitted in the database but are neither listed in the queuing system nor executed in the worker or
+        non_modal run mode are set to aborted.
+
         Args:
             *jobs (str, int): name of the job or job ID, any number of them
             by_status (iterable of str): if not jobs are given, select all jobs
                 with the given status in this project
         """
+        if self.db is None:
+            raise ValueError("Must have established database connection!")
+        df = self.job_table(all_columns=True)
         if len(jobs) == 0:
-            df = self.job_table()
-            jobs = df[df.status.isin(by_status)].id
-        if self.db is not None:
-            for job_specifier in jobs:
-                if isinstance(job_specifier, str):
-                    job_id = get_job_id(
-                        database=self.db,
-                        sql_query=self.sql_query,
-                        user=self.user,
-                        project_path=self.project_path,
-                        job_specifier=job_specifier,
-                    )
-                else:
-                    job_id = job_specifier
-                self.refresh_job_status_based_on_job_id(job_id)
+            df = df[df.status.isin(by_status)]
         else:
-            raise ValueError("Must have established database connection!")
+            job_id_lst = [
+                get_job_id(
+                    database=self.db,
+                    sql_query=self.sql_query,
+                    user=self.user,
+                    project_path=self.project_path,
+                    job_specifier=job_specifier,
+                )
+                if isinstance(job_specifier, str)
+                else job_specifier
+                for job_specifier in jobs
+            ]
+            job_id_lst = [job_id for job_id in job_id_lst if job_id]
+            df_external = pandas.DataFrame(
+                [
+                    self.db.get_item_by_id(job_id)
+                    for job_id in job_id_lst
+                    if job_id not in df.id.values
+                ],
+                columns=df.columns,
+            )
+            df = pandas.concat([df[df.id.isin(job_id_lst)], df_external])
+        self._refresh_job_status_from_queue(df=df)
+
+    def _refresh_job_status_from_queue(self, df):
+        """
+        Internal function to set the jobs which are running or submitted according to the job table but not listed in
+        the queuing system to aborted, see refresh_job_status().
+
+        The jobs are matched to the queuing system by the job name or the working directory, only for the remaining
+        jobs the HDF5 file is opened to check the run mode and the queuing system ID.
+
+        Args:
+            df (pandas.DataFrame): job table with all columns
+        """
+        df = df[df.status.isin(["running", "submitted"])]
+        if len(df) == 0:
+            return
+        if state.queue_adapter is not None:
+            df_queue = state.queue_adapter.get_status_of_my_jobs()
+            df_queue = df_queue[df_queue.status.isin(["pending", "running"])]
+        else:
+            df_queue = pandas.DataFrame(
+                {"jobid": [], "jobname": [], "working_directory": []}
+            )
+        working_directory = (
+            df.projectpath.fillna("") + df.project + df.job + "_hdf5/" + df.job
+        )
+        in_queue = (QUEUE_SCRIPT_PREFIX + df.id.astype(str)).isin(
+            df_queue.jobname
+        ) | working_directory.isin(df_queue.working_directory)
+        aborted_lst = []
+        for db_entry in _get_db_entries(df[~in_queue.values]):
+            server = self._load_from_db_entry(
+                db_entry=db_entry, path="server", convert_to_object=False
+            )
+            # a job can be in status running or submitted without being on the queue, if the run mode is worker or
+            # non_modal. Jobs without queuing system ID have never been submitted to the queuing system.
+            if (
+                server is not None
+                and server["run_mode"] not in ["worker", "non_modal"]
+                and server.get("qid", None) is not None
+                and server["qid"] not in df_queue.jobid.values
+            ):
+                aborted_lst.append(db_entry["id"])
+        if len(aborted_lst) > 0:
+            self.db.set_job_status(job_id=aborted_lst, status="aborted")
 
     @deprecate("use refresh_job_status()")
     def refresh_job_status_based_on_queue_status(self, job_specifier, status="running"):
@@ -1194,17 +1299,100 @@ class Project(ProjectPath, HasGroups):
     def remove_jobs_silently(self, recursive=False, progress=True):
         self.remove_jobs(recursive=recursive, progress=progress, silently=True)
 
-    def compress_jobs(self, recursive=False):
+    def compress_jobs(self, recursive=False, codec="bz2", cores=None):
         """
         Compress all finished jobs in the current project and in all subprojects if recursive=True is selected.
 
+        The working directories are taken from the job table and compressed by a pool of processes, so the jobs are
+        not loaded and job specific compress() methods are not called - use job.compress() for those.
+
         Args:
             recursive (bool): [True/False] compress all jobs in all subprojects - default=False
+            codec (str): compression codec, one of "bz2", "gzip", "xz" or "zstd" (requires the zstandard package)
+                - default="bz2"
+            cores (int/None): number of processes - default the number of CPUs
+        """
+        self._map_working_directories(
+            function=partial(_compress_working_directory_lst, codec=codec),
+            working_directory_lst=self._get_working_directories(
+                recursive=recursive, status="finished"
+            ),
+            cores=cores,
+        )
+
+    def decompress_jobs(self, recursive=False, cores=None):
         """
-        for job_id in self.get_job_ids(recursive=recursive):
-            job = self.inspect(job_id)
-            if job.status == "finished":
-                job.compress()
+        Decompress all compressed jobs in the current project and in all subprojects if recursive=True is selected,
+        independent of the codec they were compressed with.
+
+        Args:
+            recursive (bool): [True/False] decompress all jobs in all subprojects - default=False
+            cores (int/None): number of processes - default the number of CPUs
+        """
+        self._map_working_directories(
+            function=_decompress_working_directory_lst,
+            working_directory_lst=self._get_working_directories(recursive=recursive),
+            cores=cores,
+        )
+
+    def _get_working_directories(self, recursive=False, status=None):
+        """
+        Get the working directories of the jobs in the job table without loading the jobs.
+
+        Args:
+            recursive (bool): [True/False] include the jobs in all subprojects - default=False
+            status (str/None): only include jobs with this status - default all jobs
+
+        Returns:
+            list: absolute paths of the working directories
+        """
+        df = self.job_table(recursive=recursive)
+        if len(df) == 0:
+            return []
+        if status is not None:
+            df = df[df.status == status]
+        working_directory_lst = []
+        for project_path, project, subjob in zip(df.projectpath, df.project, df.subjob):
+            job_name = subjob[1:]
+            working_directory_lst.append(
+                os.path.join(
+                    project_path if project_path is not None else "",
+                    project,
+                    job_name + "_hdf5",
+                    job_name,
+                )
+            )
+        return working_directory_lst
+
+    @staticmethod
+    def _map_working_directories(function, working_directory_lst, cores=None):
+        """
+        Apply a function to chunks of working directories, in a multiprocessing.Pool for more than one core.
+
+        Args:
+            function (callable): function which takes a list of working directories
+            working_directory_lst (list): list of working directories
+            cores (int/None): number of processes - default the number of CPUs
+        """
+        if cores is None:
+            cores = os.cpu_count()
+        cores = min(cores, len(working_directory_lst))
+        if cores <= 1:
+            function(working_directory_lst)
+        else:
+            # several chunks per process to balance the load between the processes
+            chunk_size = max(1, len(working_directory_lst) // (4 * cores))
+            chunk_lst = [
+                working_directory_lst[i : i + chunk_size]
+                for i in range(0, len(working_directory_lst), chunk_size)
+            ]
+            with multiprocessing.Pool(cores) as pool:
+                for _ in tqdm(
+                    pool.imap_unordered(function, chunk_lst),
+                    total=len(chunk_lst),
+                    desc="Processing jobs",
+                ):
+                    pass
 
     def delete_output_files_jobs(self, recursive=False):
         """
@@ -1670,8 +1858,10 @@ class Project(ProjectPath, HasGroups):
                     {"project": self.project_path}, db_entry_in_old_format[0]["id"]
                 )
             elif db_entry_in_old_format:
-                for entry in db_entry_in_old_format:
-                    self.db.item_update({"project": self.project_path}, entry["id"])
+                self.db.item_update(
+                    {"project": self.project_path},
+                    [entry["id"] for entry in db_entry_in_old_format],
+                )
 
     def pack(
         self,
@@ -1679,6 +1869,8 @@ class Project(ProjectPath, HasGroups):
         csv_file_name="export.csv",
         compress=True,
         copy_all_files=False,
+        cores=1,
+        progress=True,
     ):
         """
         Export job table to a csv file and copy (and optionally compress) the project directory.
@@ -1688,6 +1880,8 @@ class Project(ProjectPath, HasGroups):
             csv_file_name (str): is the name of the csv file used to store the project table.
             compress (bool): if true, the function will compress the destination_path to a tar.gz file.
             copy_all_files (bool):
+            cores (int): number of threads to compress the archive with, more than one requires pigz - default=1
+            progress (bool): if True (default), show a progress bar
         """
         directory_to_transfer = os.path.basename(self.path[:-1])
         if destination_path == directory_to_transfer:
@@ -1699,13 +1893,17 @@ class Project(ProjectPath, HasGroups):
             destination_path,
             compressed=compress,
             copy_all_files=copy_all_files,
+            cores=cores,
+            progress=progress,
         )
         df = export_archive.export_database(
             self, directory_to_transfer, destination_path
         )
         df.to_csv(csv_file_name)
 
-    def unpack(self, origin_path, csv_file_name="export.csv", compress=True):
+    def unpack(
+        self, origin_path, csv_file_name="export.csv", compress=True, progress=True
+    ):
         """
         by this function, job table is imported from a given csv file,
         and also the content of project directory is copied from a given path
@@ -1715,11 +1913,16 @@ class Project(ProjectPath, HasGroups):
                             from which the project directory is copied.
             csv_file_name (str): the csv file from which the job_table is copied to the current project
             compress (bool): if True, it looks for a compressed file
+            progress (bool): if True (default), show a progress bar
         """
         csv_path = csv_file_name
         df = pandas.read_csv(csv_path, index_col=0)
         import_archive.import_jobs(
-            self, archive_directory=origin_path, df=df, compressed=compress
+            self,
+            archive_directory=origin_path,
+            df=df,
+            compressed=compress,
+            progress=progress,
         )
 
     @classmethod
@@ -1868,3 +2071,72 @@ class Creator:
         )
         table.analysis_project = self._project
         return table
+
+
+def _get_db_entries(df):
+    """
+    Convert the rows of a job table to database entries as returned by the database, with None for missing values.
+
+    Args:
+        df (pandas.DataFrame): job table with all columns
+
+    Returns:
+        list: list of dictionaries, one for each job
+    """
+    db_entry_lst = df.astype(object).where(df.notnull(), None).to_dict("records")
+    for db_entry in db_entry_lst:
+        for key in ["id", "masterid", "parentid"]:
+            if db_entry.get(key, None) is not None:
+                db_entry[key] = int(db_entry[key])
+    return db_entry_lst
+
+
+def _prefetch(iterable, size):
+    """
+    Iterate over an iterable while a background thread already computes up to size of the following items.
+
+    Exceptions raised while computing an item are raised by the generator when that item is requested.
+
+    Args:
+        iterable (iterable): iterable to consume in the background thread
+        size (int): maximum number of items computed ahead
+
+    Yields:
+        object: the items of the iterable
+    """
+    item_queue = Queue(maxsize=size)
+    stop_event = Event()
+    done = object()
+
+    def _put(item):
+        while not stop_event.is_set():
+            try:
+                item_queue.put(item, timeout=0.1)
+                return True
+            except QueueFull:
+                pass
+        return False
+
+    def _produce():
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+        except Exception as e:
+            _put((done, e))
+        else:
+            _put((done, None))
+
+    thread = Thread(target=_produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = item_queue.get()
+            if error is not None:
+                raise error
+            if item is done:
+                break
+            yield item
+    finally:
+        stop_event.set()
+        thread.join()
@@ -32,6 +32,10 @@ __date__ = "Jun 17, 2020"
 
 _internal_hdf_nodes = ["NAME", "TYPE", "OBJECT", "VERSION", "HDF_VERSION", "READ_ONLY"]
 
+# values of these types can not be changed in place, so if the same object is still in the container, it doesn't need
+# to be written to HDF again
+_immutable_types = (str, bytes, int, float, complex, bool, type(None), np.generic)
+
 
 def _normalize(key):
     if isinstance(key, str):
@@ -254,6 +258,8 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
         object.__setattr__(instance, "table_name", None)
         object.__setattr__(instance, "_read_only", False)
         object.__setattr__(instance, "_lazy", False)
+        # location the container was last read from or written to and the immutable values stored there by HDF name
+        object.__setattr__(instance, "_hdf_written", None)
 
         return instance
 
@@ -298,7 +304,7 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
                 if not isinstance(v, HDFStub):
                     return v
                 else:
-                    v = self._store[key] = v.load()
+                    v = self._store[key] = self._load_stub(v)
                     return v
             except IndexError:
                 raise IndexError("list index out of range") from None
@@ -309,7 +315,7 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
                 if not isinstance(v, HDFStub):
                     return v
                 else:
-                    v = self._store[self._indices[key]] = v.load()
+                    v = self._store[self._indices[key]] = self._load_stub(v)
                     return v
             except KeyError:
                 raise KeyError(repr(key)) from None
@@ -317,6 +323,21 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
         else:
             raise ValueError("{} is not a valid key, must be str or int".format(key))
 
+    def _load_stub(self, stub):
+        """
+        Load value from HDF and remember it, if it does not have to be written again.
+
+        Args:
+            stub (:class:`.HDFStub`): stub created by :meth:`._from_hdf`
+
+        Returns:
+            object: loaded value
+        """
+        value = stub.load()
+        if self._hdf_written is not None and isinstance(value, _immutable_types):
+            self._hdf_written[2][stub._group_name] = value
+        return value
+
     def __setitem__(self, key, val):
         if self.read_only:
             self._read_only_error()
@@ -783,15 +804,69 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
     def _get_hdf_group_name(self):
         return self.table_name
 
+    def _is_written(self, hdf, name, value, hdf_keys):
+        """
+        Check whether a value is already stored in HDF under the given name.
+
+        This is the case for values that were loaded lazily from this name and not accessed since and for immutable
+        values, which were read from or written to this name as the same object.
+
+        Args:
+            hdf (:class:`.ProjectHDFio`): HDF group to write to
+            name (str): name of the value in HDF
+            value (object): value in the container
+            hdf_keys (set of str): names of the nodes and groups in HDF
+
+        Returns:
+            bool: True if the value does not need to be written again
+        """
+        if name not in hdf_keys:
+            return False
+        if isinstance(value, HDFStub):
+            return (
+                value._group_name == name
+                and value._hdf.file_name == hdf.file_name
+                and value._hdf.h5_path == hdf.h5_path
+            )
+        written = self._hdf_written
+        return (
+            written is not None
+            and written[:2] == (hdf.file_name, hdf.h5_path)
+            and name in written[2]
+            and written[2][name] is value
+        )
+
     def _to_hdf(self, hdf):
+        # the key index of the group is listed once and values already stored in the file are not written again, see
+        # _is_written
+        with hdf.session():
+            self._write_hdf(hdf)
+
+    def _write_hdf(self, hdf):
         hdf["READ_ONLY"] = self.read_only
-        written_keys = _internal_hdf_nodes.copy()
-        for i, (k, v) in enumerate(self.items()):
+        hdf_keys = hdf.list_all()
+        hdf_nodes = set(hdf_keys["nodes"])
+        hdf_keys = hdf_nodes.union(hdf_keys["groups"])
+        written_keys = set(_internal_hdf_nodes)
+        items = []
+        for i, k in enumerate(self):
             if isinstance(k, str) and "__index_" in k:
                 raise ValueError("Key {} clashes with internal use!".format(k))
-
-            k = "{}__index_{}".format(k if isinstance(k, str) else "", i)
-            written_keys.append(k)
+            name = "{}__index_{}".format(k if isinstance(k, str) else "", i)
+            written_keys.add(name)
+            items.append((name, self._is_written(hdf, name, self._store[i], hdf_keys)))
+        # load everything that has to be written before writing anything, because values can be stored lazily under a
+        # name that is written to below
+        values = [
+            self._store[i] if done else self[i] for i, (_, done) in enumerate(items)
+        ]
+
+        written = {}
+        for (k, done), v in zip(items, values):
+            if isinstance(v, _immutable_types):
+                written[k] = v
+            if done:
+                continue
 
             # pandas objects also have a to_hdf method that is entirely unrelated to ours
             if hasattr(v, "to_hdf") and not isinstance(
@@ -799,7 +874,7 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
             ):
                 # if v will be written as a group, but a node of the same name k exists already in the file, h5py will
                 # complain, so delete it first
-                if k in hdf.list_nodes():
+                if k in hdf_nodes:
                     del hdf[k]
                 v.to_hdf(hdf=hdf, group_name=k)
             else:
@@ -812,12 +887,9 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
                         "Error saving {} (key {}): DataContainer doesn't support saving elements "
                         'of type "{}" to HDF!'.format(v, k, type(v))
                     ) from None
-        for n in hdf.list_nodes():
-            if n not in written_keys:
-                del hdf[n]
-        for g in hdf.list_groups():
-            if g not in written_keys:
-                del hdf[g]
+        for n in hdf_keys.difference(written_keys):
+            del hdf[n]
+        self._hdf_written = (hdf.file_name, hdf.h5_path, written)
 
     def _from_hdf(self, hdf, version=None):
         self.clear()
@@ -841,25 +913,37 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
                 else:
                     return i, k
 
-            items = []
-            for n in hdf.list_nodes():
-                if n in _internal_hdf_nodes:
-                    continue
-                items.append(
-                    (*normalize_key(n), hdf[n] if not self._lazy else HDFStub(hdf, n))
-                )
-            for g in hdf.list_groups():
-                items.append(
-                    (
-                        *normalize_key(g),
-                        hdf[g].to_object() if not self._lazy else HDFStub(hdf, g),
+            # list nodes and groups in one pass and only create stubs in lazy mode, values are then read on access
+            with hdf.session(mode="r"):
+                hdf_keys = hdf.list_all()
+                stub_hdf = hdf.copy()
+                items = []
+                written = {}
+                for n in hdf_keys["nodes"]:
+                    if n in _internal_hdf_nodes:
+                        continue
+                    if self._lazy:
+                        v = HDFStub(stub_hdf, n, is_node=True, copy_hdf=False)
+                    else:
+                        v = hdf[n]
+                        if isinstance(v, _immutable_types):
+                            written[n] = v
+                    items.append((*normalize_key(n), v))
+                for g in hdf_keys["groups"]:
+                    items.append(
+                        (
+                            *normalize_key(g),
+                            hdf.open(g).to_object()
+                            if not self._lazy
+                            else HDFStub(stub_hdf, g, is_node=False, copy_hdf=False),
+                        )
                     )
-                )
 
-            for _, k, v in sorted(items, key=lambda x: x[0]):
-                self[k] = v
+                for _, k, v in sorted(items, key=lambda x: x[0]):
+                    self[k] = v
 
-            self.read_only = bool(hdf.get("READ_ONLY", False))
+                self.read_only = bool(hdf.get("READ_ONLY", False))
+                self._hdf_written = (hdf.file_name, hdf.h5_path, written)
 
     def nodes(self):
         """
@@ -935,7 +1019,7 @@ class DataContainer(MutableMapping, HasGroups, HasHDF):
     def __init_subclass__(cls):
         # called whenever a subclass of DataContainer is defined, then register all subclasses with the same function
         # that the DataContainer is registered
-        HDFStub.register(cls, lambda h, g: h[g].to_object(lazy=True))
+        HDFStub.register(cls, lambda h, g: h.open(g).to_object(lazy=True))
 
 
-HDFStub.register(DataContainer, lambda h, g: h[g].to_object(lazy=True))
+HDFStub.register(DataContainer, lambda h, g: h.open(g).to_object(lazy=True))
@@ -19,12 +19,16 @@ __date__ = "Jul 16, 2020"
 
 
 import copy
+import itertools
+import posixpath
 import warnings
+from collections.abc import Mapping
 from typing import Callable, Iterable, List, Tuple, Any
 
 import numpy as np
 import h5py
-from pyiron_base.interfaces.has_hdf import HasHDF
+from pyiron_base.interfaces.has_hdf import HasHDF, _WithHDF
+from pyiron_base.storage.hdfio import open_hdf5
 
 
 def _ensure_str_array_size(array, strlen):
@@ -44,6 +48,108 @@ def _ensure_str_array_size(array, strlen):
         return array
 
 
+def _decode_str_array(array):
+    """
+    Decode an array of utf8 encoded bytes as written by :meth:`.FlattenedStorage._to_hdf`.
+
+    Args:
+        array (ndarray): array of dtype S
+    Returns:
+        ndarray: array of dtype <U
+    """
+    # itemsize of the bytes array is four bytes per character, so divide by four to get length of the orignal stored
+    # unicode string; np.dtype('U1').itemsize is just a platform agnostic way of knowing how wide a unicode charater is
+    # for numpy
+    return np.char.decode(array, "utf8").astype(
+        f"U{array.dtype.itemsize//np.dtype('U1').itemsize}"
+    )
+
+
+class _HDFArray:
+    """
+    Per element array that is kept in the HDF5 file and only read when it is accessed.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): path of the dataset inside the HDF5 file
+        shape (tuple of int): shape of the dataset
+        dtype (numpy.dtype): dtype of the dataset
+    """
+
+    def __init__(self, file_name, h5_path, shape, dtype):
+        self.file_name = file_name
+        self.h5_path = h5_path
+        self.shape = shape
+        self._is_str = dtype.char == "S"
+        if self._is_str:
+            self.dtype = np.dtype(f"U{dtype.itemsize//np.dtype('U1').itemsize}")
+        else:
+            self.dtype = dtype
+
+    def read(self, slices):
+        """
+        Read parts of the array, opening the HDF5 file only once.
+
+        Args:
+            slices (list of slice): parts of the array to read
+
+        Returns:
+            list of ndarray: one array per slice
+        """
+        with open_hdf5(self.file_name, mode="r") as store:
+            dataset = store[self.h5_path]
+            values = [dataset[s] for s in slices]
+        if self._is_str:
+            values = [_decode_str_array(v) for v in values]
+        return values
+
+    def load(self):
+        """
+        Read the full array.
+
+        Returns:
+            ndarray: the array
+        """
+        return self.read([slice(None)])[0]
+
+
+class _LazyArrayDict(dict):
+    """
+    Dictionary of arrays that reads :class:`._HDFArray` values into memory on first access.
+
+    Only item access via `[]`, :meth:`.get`, :meth:`.items` and :meth:`.values` loads the arrays, so any code that
+    modifies them always works on an in-memory copy.  :meth:`.get_raw` returns the values without loading them.
+    """
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, _HDFArray):
+            value = value.load()
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def get_raw(self, key):
+        """
+        Return the value for key without reading it from HDF.
+
+        Args:
+            key (str): name of the array
+
+        Returns:
+            ndarray/:class:`._HDFArray`: stored value
+        """
+        return super().__getitem__(key)
+
+
 class FlattenedStorage(HasHDF):
     """
     Efficient storage of ragged arrays in flattened arrays.
@@ -235,6 +341,8 @@ class FlattenedStorage(HasHDF):
         self.prev_chunk_index = 0
         self.prev_element_index = 0
         self._fill_values = {}
+        # maps chunk identifiers to the index of their first chunk, built lazily by find_chunk
+        self._identifier_index = None
 
         self._init_arrays()
 
@@ -256,7 +364,7 @@ class FlattenedStorage(HasHDF):
             self.add_chunk(chunk_length, **{k: c for k, c in zip(keys, chunk_list)})
 
     def _init_arrays(self):
-        self._per_element_arrays = {}
+        self._per_element_arrays = _LazyArrayDict()
 
         self._per_chunk_arrays = {
             "start_index": np.full(
@@ -291,16 +399,107 @@ class FlattenedStorage(HasHDF):
         Raises:
             KeyError: if identifier is not found in storage
         """
-        for i, name in enumerate(self._per_chunk_arrays["identifier"]):
-            if name == identifier:
-                return i
-        raise KeyError(f"No chunk named {identifier}")
+        index = self._get_identifier_index().get(identifier)
+        if index is None or self._per_chunk_arrays["identifier"][index] != identifier:
+            # the identifier array might have been changed in place, so check again with a fresh index
+            self._identifier_index = None
+            index = self._get_identifier_index().get(identifier)
+        if index is None:
+            raise KeyError(f"No chunk named {identifier}")
+        return index
+
+    def find_chunks(self, identifiers):
+        """
+        Return integer indices for multiple identifiers.
+
+        Args:
+            identifiers (list of str): names of chunks previously passed to :method:`.add_chunk`
+
+        Returns:
+            ndarray: integer indices for the chunks
+
+        Raises:
+            KeyError: if any identifier is not found in storage
+        """
+        identifiers = np.asarray(identifiers, dtype=str)
+        index = self._get_identifier_index()
+        indices = np.fromiter(
+            (index.get(i, -1) for i in identifiers.tolist()),
+            dtype=int,
+            count=len(identifiers),
+        )
+        if (indices < 0).any() or (
+            self._per_chunk_arrays["identifier"][indices] != identifiers
+        ).any():
+            return np.array([self.find_chunk(i) for i in identifiers], dtype=int)
+        return indices
+
+    def _get_identifier_index(self):
+        """
+        Return a dictionary from chunk identifiers to the index of the first chunk with that identifier.
+
+        Returns:
+            dict: identifier index
+        """
+        if self._identifier_index is None:
+            identifiers, first = np.unique(
+                self._per_chunk_arrays["identifier"][: self.num_chunks],
+                return_index=True,
+            )
+            self._identifier_index = dict(zip(identifiers.tolist(), first.tolist()))
+        return self._identifier_index
 
     def _get_per_element_slice(self, frame):
         start = self._per_chunk_arrays["start_index"][frame]
         end = start + self._per_chunk_arrays["length"][frame]
         return slice(start, end, 1)
 
+    def _get_hdf_array(self, name):
+        """
+        Return the per element array as :class:`._HDFArray`, if it was read lazily and has not been loaded yet.
+
+        Args:
+            name (str): name of the per element array
+
+        Returns:
+            :class:`._HDFArray`/None: lazy array or None if the array is in memory
+        """
+        array = self._peek_per_element_array(name)
+        return array if isinstance(array, _HDFArray) else None
+
+    def _peek_per_element_array(self, name):
+        """
+        Return the per element array without reading it from HDF.
+
+        Only shape and dtype are common to both return types.
+
+        Args:
+            name (str): name of the per element array
+
+        Returns:
+            ndarray/:class:`._HDFArray`: the array
+        """
+        # bypass _LazyArrayDict.__getitem__, which would load the array
+        return dict.__getitem__(self._per_element_arrays, name)
+
+    def _get_per_element_chunks(self, name, frames):
+        """
+        Return the values of a per element array for multiple chunks, reading lazy arrays with one file access.
+
+        Args:
+            name (str): name of the per element array
+            frames (list of int): chunk indices
+
+        Returns:
+            list of ndarray: values for each chunk
+        """
+        slices = [self._get_per_element_slice(frame) for frame in frames]
+        hdf_array = self._get_hdf_array(name)
+        if hdf_array is not None:
+            return hdf_array.read(slices)
+        array = self._per_element_arrays[name]
+        return [array[s] for s in slices]
+
     def _resize_elements(self, new):
         old_max = self._num_elements_alloc
         self._num_elements_alloc = new
@@ -318,6 +517,8 @@ class FlattenedStorage(HasHDF):
     def _resize_chunks(self, new):
         old_max = self._num_chunks_alloc
         self._num_chunks_alloc = new
+        if new < self.num_chunks:
+            self._identifier_index = None
         for k, a in self._per_chunk_arrays.items():
             new_shape = (new,) + a.shape[1:]
             try:
@@ -373,7 +574,7 @@ class FlattenedStorage(HasHDF):
             )
 
         if name in self._per_element_arrays:
-            a = self._per_element_arrays[name]
+            a = self._peek_per_element_array(name)
             if (
                 a.shape[1:] != shape
                 or not np.can_cast(dtype, a.dtype)
@@ -440,9 +641,7 @@ class FlattenedStorage(HasHDF):
             frame = self.find_chunk(frame)
         if name in self._per_element_arrays:
             if frame is not None:
-                return self._per_element_arrays[name][
-                    self._get_per_element_slice(frame)
-                ]
+                return self._get_per_element_chunks(name, [frame])[0]
             else:
                 return self._per_element_arrays[name][: self.num_elements]
         elif name in self._per_chunk_arrays:
@@ -471,8 +670,8 @@ class FlattenedStorage(HasHDF):
         # pre-allocated as dtype=object, then setting individual elements makes sure that element arrays retain their
         # dtype
         result = np.empty(len(self), dtype=object)
-        for i in range(len(self)):
-            result[i] = self.get_array(name, i)
+        for i, value in enumerate(self._get_per_element_chunks(name, range(len(self)))):
+            result[i] = value
         return result
 
     def get_array_filled(self, name: str) -> np.ndarray:
@@ -543,6 +742,8 @@ class FlattenedStorage(HasHDF):
                     self._per_chunk_arrays[name], strlen
                 )
             self._per_chunk_arrays[name][frame] = value
+            if name == "identifier":
+                self._identifier_index = None
         else:
             raise KeyError(f"no array named {name}")
 
@@ -575,7 +776,7 @@ class FlattenedStorage(HasHDF):
             dict: if array exists, keys corresponds to the shape, dtype and per arguments of :method:`.add_array`
         """
         if name in self._per_element_arrays:
-            a = self._per_element_arrays[name]
+            a = self._peek_per_element_array(name)
             per = "element"
         elif name in self._per_chunk_arrays:
             a = self._per_chunk_arrays[name]
@@ -601,6 +802,8 @@ class FlattenedStorage(HasHDF):
 
         If called on a subclass this correctly returns an instance of that subclass instead.
 
+        Per element arrays read with `lazy=True` in :meth:`.from_hdf` are only read for the selected chunks.
+
         Args:
             select (callable): function that takes this storage as the first argument and the chunk index to sample as
                                the second argument; if it returns True it will be part of the new storage.
@@ -612,26 +815,32 @@ class FlattenedStorage(HasHDF):
         for k, a in self._per_chunk_arrays.items():
             if k not in ("start_index", "length", "identifier"):
                 new.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="chunk")
-        for k, a in self._per_element_arrays.items():
-            new.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="element")
-        for i in range(len(self)):
-            if selector(self, i):
-                new.add_chunk(
-                    self.get_array("length", i),
-                    identifier=self.get_array("identifier", i),
-                )
-                for k in self._per_chunk_arrays:
-                    if k not in ("start_index", "length", "identifier"):
-                        new.set_array(k, len(new) - 1, self.get_array(k, i))
-                for k in self._per_element_arrays:
+        for k in self._per_element_arrays:
+            info = self.has_array(k)
+            new.add_array(k, shape=info["shape"], dtype=info["dtype"], per="element")
+        selected = [i for i in range(len(self)) if selector(self, i)]
+        element_values = {
+            k: self._get_per_element_chunks(k, selected)
+            for k in self._per_element_arrays
+        }
+        for j, i in enumerate(selected):
+            new.add_chunk(
+                self.get_array("length", i),
+                identifier=self.get_array("identifier", i),
+            )
+            for k in self._per_chunk_arrays:
+                if k not in ("start_index", "length", "identifier"):
                     new.set_array(k, len(new) - 1, self.get_array(k, i))
+            for k, values in element_values.items():
+                new.set_array(k, len(new) - 1, values[j])
         return new
 
     def split(self, array_names: Iterable[str]) -> "FlattenedStorage":
         """
         Return a new storage with only the selected arrays present.
 
-        Arrays are deep-copied from `self`.
+        Arrays are deep-copied from `self`, per element arrays read with `lazy=True` in :meth:`.from_hdf` stay in the
+        HDF5 file until they are accessed.
 
         Args:
             array_names (list of str): names of the arrays to present in new storage
@@ -644,20 +853,20 @@ class FlattenedStorage(HasHDF):
                 raise ValueError(f"Array name {k} not present in FlattenedStorage!")
 
         split = copy.copy(self)
-        for k in list(split._per_element_arrays):
-            if k not in array_names:
-                del split._per_element_arrays[k]
-            else:
-                split._per_element_arrays[k] = np.copy(split._per_element_arrays[k])
-        for k in list(split._per_chunk_arrays):
-            if k not in array_names and k not in (
-                "start_index",
-                "length",
-                "identifier",
-            ):
-                del split._per_chunk_arrays[k]
-            else:
-                split._per_chunk_arrays[k] = np.copy(split._per_chunk_arrays[k])
+        split._per_element_arrays = _LazyArrayDict()
+        for k in self._per_element_arrays:
+            if k in array_names:
+                hdf_array = self._get_hdf_array(k)
+                if hdf_array is not None:
+                    split._per_element_arrays[k] = hdf_array
+                else:
+                    split._per_element_arrays[k] = np.copy(self._per_element_arrays[k])
+        split._per_chunk_arrays = {}
+        for k, a in self._per_chunk_arrays.items():
+            if k in array_names or k in ("start_index", "length", "identifier"):
+                split._per_chunk_arrays[k] = np.copy(a)
+        split._fill_values = self._fill_values.copy()
+        split._identifier_index = None
         return split
 
     def join(
@@ -768,7 +977,8 @@ class FlattenedStorage(HasHDF):
 
         if new_elements > self.num_elements:
             self.num_elements = new_elements
-        if self.current_chunk_index + 1 > self.num_chunks:
+        new_chunk = self.current_chunk_index + 1 > self.num_chunks
+        if new_chunk:
             self.num_chunks += 1
 
         # len of chunk to index into the initialized arrays
@@ -782,19 +992,15 @@ class FlattenedStorage(HasHDF):
             self._per_chunk_arrays["identifier"], len(identifier)
         )
         self._per_chunk_arrays["identifier"][self.current_chunk_index] = identifier
+        if new_chunk and self._identifier_index is not None:
+            self._identifier_index.setdefault(identifier, self.current_chunk_index)
+        else:
+            self._identifier_index = None
 
         for k, a in arrays.items():
             a = np.asarray(a)
-            if k not in self._per_element_arrays and k not in self._per_chunk_arrays:
-                if len(a.shape) > 0 and a.shape[0] == n:
-                    self.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="element")
-                else:
-                    shape = a.shape
-                    # if the first axis was added by the caller to force to add a per chunk array, remove it again here
-                    if len(shape) > 0 and a.shape[0] == 1:
-                        shape = shape[1:]
-                    self.add_array(k, shape=shape, dtype=a.dtype, per="chunk")
-            # same as above: if the first axis was added by the caller to force to add a per chunk array, remove it
+            self._add_array_for_chunk(k, a, n)
+            # same as in _add_array_for_chunk: if the first axis was added by the caller to force to add a per chunk array, remove it
             # again here
             if k in self._per_chunk_arrays and len(a.shape) > 0 and a.shape[0] == 1:
                 a = a[0]
@@ -808,6 +1014,198 @@ class FlattenedStorage(HasHDF):
         self.current_element_index = i
         # return last_chunk_index, last_element_index
 
+    def _add_array_for_chunk(self, name, value, chunk_length):
+        """
+        Add an array to store the given value of a chunk, if it doesn't exist yet.
+
+        The array is added per element, if the first axis of the value matches the length of the chunk, and per chunk
+        otherwise, see :meth:`.add_chunk`.
+
+        Args:
+            name (str): name of the array
+            value (ndarray): value of the array for one chunk
+            chunk_length (int): length of the chunk
+        """
+        if name in self._per_element_arrays or name in self._per_chunk_arrays:
+            return
+        if len(value.shape) > 0 and value.shape[0] == chunk_length:
+            self.add_array(
+                name, shape=value.shape[1:], dtype=value.dtype, per="element"
+            )
+        else:
+            shape = value.shape
+            # if the first axis was added by the caller to force to add a per chunk array, remove it again here
+            if len(shape) > 0 and value.shape[0] == 1:
+                shape = shape[1:]
+            self.add_array(name, shape=shape, dtype=value.dtype, per="chunk")
+
+    def add_chunks(self, lengths, identifiers=None, batch_size=10000, **arrays):
+        """
+        Add many new chunks to the storage at once.
+
+        Per element arrays are given concatenated over all new chunks and per chunk arrays with one value per new chunk
+        along the first axis.
+
+        >>> container = FlattenedStorage()
+        >>> container.add_chunks([1, 2], identifiers=["A", "B"], energy=[1.0, 2.0], forces=np.zeros((3, 3)))
+        >>> container.get_array("energy", "B")
+        2.0
+        >>> container.get_array("forces", 1).shape
+        (2, 3)
+
+        If an array does not exist yet, it is added as per element array if the first axis matches the total number of
+        new elements, otherwise as per chunk array.  When all chunks are of length one, this is ambiguous and new
+        arrays are added per element; call :meth:`.add_array` first to add per chunk arrays in this case.
+
+        Instead of lengths an iterable of dictionaries may be passed, each with the keyword arguments of
+        :meth:`.add_chunk` for one chunk.  They are collected in batches of `batch_size` chunks, which are then added
+        at once.
+
+        >>> container.add_chunks({"chunk_length": 1, "energy": i, "forces": [[i, i, i]]} for i in range(3))
+        >>> container.get_array("energy")
+        array([1., 2., 0., 1., 2.])
+
+        Args:
+            lengths (list of int/iterable of dict): lengths of the new chunks or keyword arguments for
+                :meth:`.add_chunk` for each new chunk
+            identifiers (list of str, optional): human-readable names for the chunks, if None use the chunk indices as
+                strings
+            batch_size (int): number of chunks to collect before adding them, when `lengths` are dictionaries
+            **arrays: additional arrays to store for the chunks
+
+        Raises:
+            ValueError: if the given arrays or identifiers do not match the number of new chunks or elements
+        """
+        if not isinstance(lengths, np.ndarray):
+            chunks = iter(lengths)
+            first = next(chunks, None)
+            if isinstance(first, Mapping):
+                if identifiers is not None or len(arrays) > 0:
+                    raise ValueError(
+                        "identifiers and arrays must be given inside the chunk dictionaries!"
+                    )
+                chunks = itertools.chain([first], chunks)
+                while True:
+                    batch = list(itertools.islice(chunks, batch_size))
+                    if len(batch) == 0:
+                        break
+                    self._add_chunk_batch(batch)
+                return
+            lengths = [] if first is None else [first] + list(chunks)
+
+        lengths = np.asarray(lengths, dtype=int)
+        num_chunks = len(lengths)
+        num_elements = int(lengths.sum())
+        if identifiers is None:
+            identifiers = np.arange(
+                self.num_chunks, self.num_chunks + num_chunks
+            ).astype(str)
+        else:
+            identifiers = np.asarray(identifiers, dtype=str)
+            if len(identifiers) != num_chunks:
+                raise ValueError(
+                    f"Got {len(identifiers)} identifiers for {num_chunks} chunks!"
+                )
+        arrays = {k: np.asarray(a) for k, a in arrays.items()}
+        for k, a in arrays.items():
+            if k not in self._per_element_arrays and k not in self._per_chunk_arrays:
+                if a.ndim > 0 and a.shape[0] == num_elements:
+                    self.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="element")
+                elif a.ndim > 0 and a.shape[0] == num_chunks:
+                    self.add_array(k, shape=a.shape[1:], dtype=a.dtype, per="chunk")
+            if k in self._per_element_arrays:
+                expected = num_elements
+            else:
+                expected = num_chunks
+            if a.ndim == 0 or a.shape[0] != expected:
+                raise ValueError(
+                    f"Array {k} must have length {expected} along the first axis, not {a.shape[:1]}!"
+                )
+        if num_chunks == 0:
+            return
+
+        chunk_start = self.current_chunk_index
+        chunk_end = chunk_start + num_chunks
+        element_start = self.current_element_index
+        element_end = element_start + num_elements
+
+        if element_end > self._num_elements_alloc:
+            self._resize_elements(max(element_end, self._num_elements_alloc * 2))
+        if chunk_end > self._num_chunks_alloc:
+            self._resize_chunks(max(chunk_end, self._num_chunks_alloc * 2))
+
+        if element_end > self.num_elements:
+            self.num_elements = element_end
+        new_chunks = chunk_start >= self.num_chunks
+        if chunk_end > self.num_chunks:
+            self.num_chunks = chunk_end
+
+        start_index = element_start + np.cumsum(lengths) - lengths
+        self._per_chunk_arrays["start_index"][chunk_start:chunk_end] = start_index
+        self._per_chunk_arrays["length"][chunk_start:chunk_end] = lengths
+        self._per_chunk_arrays["identifier"] = _ensure_str_array_size(
+            self._per_chunk_arrays["identifier"],
+            identifiers.itemsize // np.dtype("U1").itemsize,
+        )
+        self._per_chunk_arrays["identifier"][chunk_start:chunk_end] = identifiers
+        if new_chunks and self._identifier_index is not None:
+            for i, identifier in enumerate(identifiers.tolist(), start=chunk_start):
+                self._identifier_index.setdefault(identifier, i)
+        else:
+            self._identifier_index = None
+
+        for k, a in arrays.items():
+            if k in self._per_element_arrays:
+                store, start, end = self._per_element_arrays, element_start, element_end
+            else:
+                store, start, end = self._per_chunk_arrays, chunk_start, chunk_end
+            if store[k].dtype.char == "U":
+                store[k] = _ensure_str_array_size(
+                    store[k], a.itemsize // np.dtype("U1").itemsize
+                )
+            store[k][start:end] = a
+
+        self.prev_chunk_index = chunk_end - 1
+        self.prev_element_index = int(start_index[-1])
+        self.current_chunk_index = chunk_end
+        self.current_element_index = element_end
+
+    def _add_chunk_batch(self, chunks):
+        """
+        Add chunks given as keyword arguments of :meth:`.add_chunk` with one call to :meth:`.add_chunks`.
+
+        Args:
+            chunks (list of dict): keyword arguments of :meth:`.add_chunk` for each chunk
+        """
+        keys = set(chunks[0])
+        if any(set(chunk) != keys for chunk in chunks):
+            # arrays not given for all chunks keep their fill values, leave this to add_chunk
+            for chunk in chunks:
+                self.add_chunk(**chunk)
+            return
+        lengths = [chunk["chunk_length"] for chunk in chunks]
+        identifiers = [
+            str(self.num_chunks + i)
+            if chunk.get("identifier") is None
+            else chunk["identifier"]
+            for i, chunk in enumerate(chunks)
+        ]
+        arrays = {}
+        for k in keys.difference(("chunk_length", "identifier")):
+            values = [np.asarray(chunk[k]) for chunk in chunks]
+            self._add_array_for_chunk(k, values[0], lengths[0])
+            if k in self._per_element_arrays:
+                shape = self._peek_per_element_array(k).shape[1:]
+                arrays[k] = np.concatenate(
+                    [np.broadcast_to(v, (n,) + shape) for v, n in zip(values, lengths)]
+                )
+            else:
+                # same as in add_chunk: strip the first axis, if it was added by the caller to force a per chunk array
+                arrays[k] = np.stack(
+                    [v[0] if v.ndim > 0 and v.shape[0] == 1 else v for v in values]
+                )
+        self.add_chunks(lengths, identifiers=identifiers, **arrays)
+
     def extend(self, other: "FlattenedStorage"):
         self._check_compatible_fill_values(other=other)
 
@@ -849,6 +1247,7 @@ class FlattenedStorage(HasHDF):
         self.num_elements = combined_num_elements
         self.num_chunks = combined_num_chunks
         self.current_chunk_index = self.num_chunks
+        self._identifier_index = None
         self.current_element_index = self.num_elements
 
     def _check_compatible_fill_values(self, other: "FlattenedStorage"):
@@ -908,21 +1307,52 @@ class FlattenedStorage(HasHDF):
 
         hdf["_fill_values"] = self._fill_values
 
-    def _from_hdf(self, hdf, version=None):
+    def from_hdf(self, hdf, group_name=None, lazy=False):
+        """
+        Read object from HDF.
+
+        If group_name is given descend into subgroup in hdf first.
+
+        With `lazy=True` only the per chunk arrays are read right away.  Per element arrays stay in the HDF5 file and
+        :meth:`.get_array` with a `frame`, :meth:`.sample` and :meth:`.split` only read the elements of the requested
+        chunks.  Any other access, e.g. modifying the array or fetching it without a `frame`, reads the full array
+        into memory.  The HDF5 file must not be changed while the storage is still in use.
+
+        Args:
+            hdf (:class:`.ProjectHDFio`): HDF group to read from
+            group_name (str, optional): name of subgroup
+            lazy (bool): read per element arrays only when they are accessed
+        """
+        group_name = (
+            group_name if group_name is not None else self._get_hdf_group_name()
+        )
+        with _WithHDF(hdf, group_name) as hdf:
+            version = hdf.get("HDF_VERSION", "0.1.0")
+            self._from_hdf(hdf, version=version, lazy=lazy)
+
+    def _from_hdf(self, hdf, version=None, lazy=False):
         def read_array(name, hdf):
             a = np.asarray(hdf[name])
             if a.dtype.char == "S":
                 # if saved as bytes, we wrote this as an encoded unicode string, so manually decode here
                 # TODO: string arrays with shape != () not handled
-                a = np.fromiter(
-                    (s.decode("utf8") for s in a),
-                    # itemsize of original a is four bytes per character, so divide by four to get
-                    # length of the orignal stored unicode string; np.dtype('U1').itemsize is just a
-                    # platform agnostic way of knowing how wide a unicode charater is for numpy
-                    dtype=f"U{a.dtype.itemsize//np.dtype('U1').itemsize}",
-                )
+                a = _decode_str_array(a)
             return a
 
+        def read_lazy_arrays(hdf):
+            arrays = {}
+            with open_hdf5(hdf.file_name, mode="r") as store:
+                for k in hdf.list_nodes():
+                    h5_path = posixpath.join(hdf.h5_path, k)
+                    dataset = store[h5_path]
+                    arrays[k] = _HDFArray(
+                        file_name=hdf.file_name,
+                        h5_path=h5_path,
+                        shape=dataset.shape,
+                        dtype=dataset.dtype,
+                    )
+            return arrays
+
         try:
             num_chunks = hdf["num_chunks"]
             num_elements = hdf["num_elements"]
@@ -931,6 +1361,7 @@ class FlattenedStorage(HasHDF):
             num_elements = hdf["num_atoms"]
 
         self._num_chunks_alloc = self.num_chunks = self.current_chunk_index = num_chunks
+        self._identifier_index = None
         self._num_elements_alloc = (
             self.num_elements
         ) = self.current_element_index = num_elements
@@ -945,8 +1376,13 @@ class FlattenedStorage(HasHDF):
                         self._per_chunk_arrays[k] = a
         elif version == "0.2.0" or "0.3.0":
             with hdf.open("element_arrays") as hdf_arrays:
-                for k in hdf_arrays.list_nodes():
-                    self._per_element_arrays[k] = read_array(k, hdf_arrays)
+                if lazy:
+                    self._per_element_arrays = _LazyArrayDict(
+                        read_lazy_arrays(hdf_arrays)
+                    )
+                else:
+                    for k in hdf_arrays.list_nodes():
+                        self._per_element_arrays[k] = read_array(k, hdf_arrays)
             with hdf.open("chunk_arrays") as hdf_arrays:
                 for k in hdf_arrays.list_nodes():
                     self._per_chunk_arrays[k] = read_array(k, hdf_arrays)
@@ -961,7 +1397,8 @@ class FlattenedStorage(HasHDF):
                     f"per-chunk array {k} read inconsistently from HDF: "
                     f"shape {a.shape[0]} does not match global allocation {self._num_chunks_alloc}!"
                 )
-        for k, a in self._per_element_arrays.items():
+        for k in self._per_element_arrays:
+            a = self._peek_per_element_array(k)
             if a.shape[0] != self._num_elements_alloc:
                 raise RuntimeError(
                     f"per-element array {k} read inconsistently from HDF: "
@@ -0,0 +1,251 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+"""
+Read and write the h5io data layout through an already opened h5py file.
+
+h5io only offers functions which take a file name and open the file on every call, so the layout is implemented here
+with public h5py calls. Data written here can be read by h5io and vice versa, which is checked in the tests against
+the h5io version pinned in setup.py. Types which are rarely used in pyiron - pandas objects, which h5io reads and
+writes through pytables, and sparse matrices - raise :class:`H5ioFallback`, the caller then has to close the h5py
+file and use h5io directly.
+"""
+
+import datetime
+import json
+
+import h5py
+import numpy as np
+
+__author__ = "Jan Janssen"
+__copyright__ = (
+    "Copyright 2023, Max-Planck-Institut für Eisenforschung GmbH - "
+    "Computational Materials Design (CM) Department"
+)
+__version__ = "1.0"
+__maintainer__ = "Jan Janssen"
+__email__ = "janssen@mpie.de"
+__status__ = "production"
+__date__ = "Oct 18, 2026"
+
+
+_PANDAS_TYPES = ("pd_dataframe", "pd_series")
+
+
+class H5ioFallback(Exception):
+    """
+    Raised for data which has to be read or written by h5io using the file name rather than an open file handle.
+    """
+
+
+def read_from_store(store, title):
+    """
+    Read an h5io object from an open HDF5 file, see :func:`h5io.read_hdf5`.
+
+    Args:
+        store (h5py.File): opened HDF5 file
+        title (str): path of the object inside the HDF5 file
+
+    Returns:
+        object: the loaded data
+
+    Raises:
+        ValueError: if there is no h5io object at title
+        H5ioFallback: if the object contains pandas objects or sparse matrices
+    """
+    if title not in store:
+        raise ValueError('no "%s" data found' % title)
+    node = store[title]
+    if isinstance(node, h5py.Group) and "TITLE" not in node.attrs:
+        raise ValueError('no "%s" data found' % title)
+    return _read_node(node)
+
+
+def write_to_store(store, data, title, compression=4, use_json=False):
+    """
+    Write an h5io object to an open HDF5 file, see :func:`h5io.write_hdf5` with overwrite="update" and
+    slash="error".
+
+    Args:
+        store (h5py.File): HDF5 file opened in a writable mode
+        data (object): data to write
+        title (str): path of the object inside the HDF5 file
+        compression (int): gzip compression level
+        use_json (bool): store small lists and dictionaries as json strings
+
+    Raises:
+        H5ioFallback: if the data contains pandas objects or sparse matrices, the partially written object is left in
+            the file and overwritten by h5io
+    """
+    comp_kw = dict()
+    if compression > 0:
+        comp_kw = dict(compression="gzip", compression_opts=compression)
+    if title in store:
+        del store[title]
+    _write_node(root=store, key=title, value=data, comp_kw=comp_kw, use_json=use_json)
+
+
+def get_title(node):
+    """
+    Get the h5io type of an HDF5 node.
+
+    Args:
+        node (h5py.Group/h5py.Dataset): HDF5 node
+
+    Returns:
+        str: h5io type, empty if the node is not an h5io object
+    """
+    title = node.attrs.get("TITLE", "")
+    if isinstance(title, bytes):
+        title = title.decode()
+    return title
+
+
+def _create_titled_group(root, key, title):
+    group = root.create_group(key)
+    group.attrs["TITLE"] = title
+    return group
+
+
+def _create_titled_dataset(root, key, title, data, comp_kw=None):
+    comp_kw = {} if comp_kw is None else comp_kw
+    dataset = root.create_dataset(key, data=data, **comp_kw)
+    dataset.attrs["TITLE"] = title
+    return dataset
+
+
+def _json_compatible(obj):
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return True
+    elif isinstance(obj, list):
+        return all([_json_compatible(item) for item in obj])
+    elif isinstance(obj, dict):
+        if any("/" in key for key in obj.keys()):
+            raise ValueError(
+                'Found a key with "/", this is not allowed if slash == error'
+            )
+        return all([_json_compatible(item) for item in obj.values()])
+    else:
+        return False
+
+
+def _write_node(root, key, value, comp_kw, use_json=False, is_title=True):
+    if not is_title and "/" in key:
+        raise ValueError('Found a key with "/", this is not allowed if slash == error')
+    if use_json and isinstance(value, (list, dict)) and _json_compatible(value):
+        value = np.frombuffer(json.dumps(value).encode("utf-8"), np.uint8)
+        _create_titled_dataset(root, key, "json", value, comp_kw)
+    elif isinstance(value, dict):
+        sub_root = _create_titled_group(root, key, "dict")
+        for sub_key, sub_value in value.items():
+            if not isinstance(sub_key, str):
+                raise TypeError("All dict keys must be strings")
+            _write_node(
+                root=sub_root,
+                key="key_{0}".format(sub_key),
+                value=sub_value,
+                comp_kw=comp_kw,
+                is_title=False,
+            )
+    elif isinstance(value, (list, tuple)):
+        title = "list" if isinstance(value, list) else "tuple"
+        sub_root = _create_titled_group(root, key, title)
+        for i, sub_value in enumerate(value):
+            _write_node(
+                root=sub_root,
+                key="idx_{0}".format(i),
+                value=sub_value,
+                comp_kw=comp_kw,
+                is_title=False,
+            )
+    elif value is None:
+        _create_titled_dataset(root, key, "None", [False])
+    elif isinstance(value, (int, float)):
+        title = "int" if isinstance(value, int) else "float"
+        _create_titled_dataset(root, key, title, np.atleast_1d(value))
+    elif isinstance(value, datetime.datetime):
+        value = np.frombuffer(value.isoformat().encode("utf-8"), np.uint8)
+        _create_titled_dataset(root, key, "datetime", value)
+    elif isinstance(value, datetime.timezone):
+        value = np.frombuffer(repr(value).encode("utf-8"), np.uint8)
+        _create_titled_dataset(root, key, "timezone", value)
+    elif isinstance(value, (np.integer, np.floating, np.bool_)):
+        title = "np_{0}".format(value.__class__.__name__)
+        _create_titled_dataset(root, key, title, np.atleast_1d(value))
+    elif isinstance(value, str):
+        value = np.frombuffer(value.encode("utf-8"), np.uint8)
+        _create_titled_dataset(root, key, "unicode", value, comp_kw)
+    elif isinstance(value, np.ndarray):
+        if not (
+            value.dtype == np.dtype("object")
+            and len(set([sub.dtype for sub in value])) == 1
+        ):
+            _create_titled_dataset(root, key, "ndarray", value)
+        else:
+            shapes = [np.shape(sub) for sub in value]
+            if not all([shapes[0][1:] == s[1:] for s in shapes]):
+                raise ValueError("shape does not match!")
+            sub_root = _create_titled_group(root, key, "multiarray")
+            _create_titled_dataset(
+                sub_root, "index", "ndarray", np.cumsum([s[0] for s in shapes])
+            )
+            _create_titled_dataset(
+                sub_root, "data", "ndarray", np.concatenate(list(value))
+            )
+    elif type(value).__module__.startswith(("pandas", "scipy.sparse")):
+        raise H5ioFallback(
+            "{} can only be written by h5io directly.".format(type(value))
+        )
+    else:
+        raise TypeError("unsupported type %s" % type(value))
+
+
+def _read_node(node):
+    title = get_title(node)
+    if isinstance(node, h5py.Group):
+        if title == "dict":
+            return {key[4:]: _read_node(sub_node) for key, sub_node in node.items()}
+        elif title in ["list", "tuple"]:
+            data = list()
+            i = 0
+            while True:
+                sub_node = node.get("idx_{0}".format(i), None)
+                if sub_node is None:
+                    break
+                data.append(_read_node(sub_node))
+                i += 1
+            return tuple(data) if title == "tuple" else data
+        elif title == "multiarray":
+            index = _read_node(node["index"])
+            data = _read_node(node["data"])
+            return np.array(np.split(data, index[:-1]), dtype=object)
+        elif title in _PANDAS_TYPES or title in ["csc_matrix", "csr_matrix"]:
+            raise H5ioFallback(
+                "{} at {} can only be read by h5io directly.".format(title, node.name)
+            )
+        else:
+            raise NotImplementedError("Unknown group type: {0}".format(title))
+    elif title == "ndarray":
+        return np.array(node)
+    elif title in ("int", "float"):
+        cast = int if title == "int" else float
+        return cast(np.array(node)[0])
+    elif title == "datetime":
+        return datetime.datetime.fromisoformat(
+            str(np.array(node).tobytes().decode("utf-8"))
+        )
+    elif title == "timezone":
+        return eval(
+            str(np.array(node).tobytes().decode("utf-8")), {"datetime": datetime}
+        )
+    elif title.startswith("np_"):
+        return getattr(np, title.split("_")[1])(np.array(node)[0])
+    elif title in ("unicode", "ascii", "str"):
+        decoder = "utf-8" if title == "unicode" else "ASCII"
+        return str(np.array(node).tobytes().decode(decoder))
+    elif title == "json":
+        return json.loads(str(np.array(node).tobytes().decode("utf-8")))
+    elif title == "None":
+        return None
+    else:
+        raise TypeError("Unknown node type: {0}".format(title))
@@ -5,6 +5,7 @@
 Classes to map the Python objects to HDF5 data structures
 """
 
+import contextlib
 import numbers
 import h5py
 import os
@@ -18,6 +19,13 @@ from typing import Union
 
 from pyiron_base.utils.deprecate import deprecate
 from pyiron_base.storage.helper_functions import read_hdf5, write_hdf5
+from pyiron_base.storage.h5io_codec import (
+    H5ioFallback,
+    get_title,
+    read_from_store,
+    write_to_store,
+)
+from pyiron_base.utils.error import retry
 from pyiron_base.interfaces.has_groups import HasGroups
 from pyiron_base.state import state
 from pyiron_base.jobs.dynamic import JOB_DYN_DICT, class_constructor
@@ -71,6 +79,234 @@ def open_hdf5(filename, mode="r", swmr=False):
         return h5py.File(filename, mode=mode, libver="latest", swmr=swmr)
 
 
+class _HDFSession:
+    """
+    Shared state of a :meth:`FileHDFio.session`, one h5py file handle which is opened on first access and reused by
+    all FileHDFio objects pointing to the same file until the session is closed.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        mode (str): mode to open the HDF5 file with
+    """
+
+    def __init__(self, file_name, mode="a"):
+        self.file_name = file_name
+        self.mode = mode
+        self.is_active = True
+        self._store = None
+
+    @property
+    def is_open(self):
+        return self._store is not None
+
+    @property
+    def store(self):
+        if self._store is None:
+            self._store = retry(
+                lambda: open_hdf5(self.file_name, mode=self.mode),
+                error=BlockingIOError,
+                msg=f"Two or more processes tried to access the file {self.file_name}.",
+                at_most=10,
+                delay=1,
+            )
+        return self._store
+
+    def release(self):
+        """
+        Close the file handle, it is opened again on the next access.
+        """
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def close(self):
+        self.release()
+        self.is_active = False
+
+
+_H5IO_TYPES = (
+    "dict",
+    "list",
+    "tuple",
+    "pd_dataframe",
+    "pd_series",
+    "multiarray",
+    "json",
+)
+
+
+def _is_h5io_object(group):
+    """
+    Check whether an HDF5 group is an h5io object (which has the same type as normal groups)
+
+    Args:
+        group (h5py.Group): HDF5 group
+
+    Returns:
+        bool: True if the group stores a single h5io object
+    """
+    return get_title(group) in _H5IO_TYPES
+
+
+def _to_extendable(value):
+    """
+    Convert data to a layout which can be extended in place along the first axis.
+
+    Args:
+        value (list, numpy.ndarray): data, one entry per step
+
+    Returns:
+        numpy.ndarray/tuple/None: the data as numeric array, a tuple of per step lengths and the concatenated data if
+            the steps only agree in their shape after the first dimension or None if neither is possible
+    """
+    if isinstance(value, np.ndarray) and value.dtype != np.dtype("O"):
+        if value.ndim > 0 and value.size > 0 and value.dtype.kind in "biufc":
+            return value
+        return None
+    if len(value) == 0:
+        return None
+    try:
+        steps = [np.asarray(v) for v in value]
+    except ValueError:
+        return None
+    if not all(s.dtype.kind in "biufc" for s in steps):
+        return None
+    shapes = set(s.shape for s in steps)
+    if len(shapes) == 1:
+        if steps[0].size == 0:
+            return None
+        return np.array(steps)
+    if any(s.ndim == 0 for s in steps) or len(set(s.shape[1:] for s in steps)) > 1:
+        return None
+    data = np.concatenate(steps)
+    if data.size == 0:
+        return None
+    return np.array([len(s) for s in steps]), data
+
+
+def _as_ragged(new):
+    """
+    Interpret a numeric array with at least two dimensions as ragged data with steps of equal length.
+
+    Args:
+        new (numpy.ndarray/tuple): output of :func:`_to_extendable`
+
+    Returns:
+        tuple/None: per step lengths and concatenated data
+    """
+    if isinstance(new, tuple):
+        return new
+    if new.ndim < 2:
+        return None
+    return (
+        np.full(new.shape[0], new.shape[1]),
+        new.reshape((new.shape[0] * new.shape[1],) + new.shape[2:]),
+    )
+
+
+def _create_extendable_dataset(store, name, data):
+    """
+    Create a chunked dataset with an unlimited first dimension as h5io ndarray.
+
+    Args:
+        store (h5py.File/h5py.Group): parent of the new dataset
+        name (str): name of the dataset
+        data (numpy.ndarray): initial data
+    """
+    row_size = max(1, data[0].nbytes if data.ndim > 1 else data.itemsize)
+    chunk_rows = max(1, 2**16 // row_size)
+    dataset = store.create_dataset(
+        name,
+        data=data,
+        maxshape=(None,) + data.shape[1:],
+        chunks=(chunk_rows,) + data.shape[1:],
+        compression="gzip",
+        compression_opts=4,
+    )
+    dataset.attrs["TITLE"] = "ndarray"
+
+
+def _create_extendable(store, title, new):
+    """
+    Write data returned by :func:`_to_extendable` to the HDF5 file.
+
+    Args:
+        store (h5py.File): HDF5 file opened in a writable mode
+        title (str): path of the data inside the HDF5 file
+        new (numpy.ndarray/tuple): output of :func:`_to_extendable`
+    """
+    if isinstance(new, np.ndarray):
+        _create_extendable_dataset(store, title, new)
+    else:
+        lengths, data = new
+        group = store.create_group(title)
+        group.attrs["TITLE"] = "multiarray"
+        _create_extendable_dataset(group, "index", np.cumsum(lengths))
+        _create_extendable_dataset(group, "data", data)
+
+
+def _append_to_dataset(dataset, data):
+    """
+    Append data to a dataset created by :func:`_create_extendable_dataset`.
+
+    Args:
+        dataset (h5py.Dataset): extendable dataset
+        data (numpy.ndarray): data to append
+
+    Returns:
+        bool: False if the dataset can not be extended with data
+    """
+    if (
+        dataset.maxshape[0] is not None
+        or dataset.shape[1:] != data.shape[1:]
+        or not np.can_cast(data.dtype, dataset.dtype, "safe")
+    ):
+        return False
+    length = dataset.shape[0]
+    dataset.resize(length + data.shape[0], axis=0)
+    dataset[length:] = data
+    return True
+
+
+def _extend_in_place(node, new):
+    """
+    Append data to the HDF5 node, if it was written by :func:`_create_extendable` and is compatible with the new data.
+
+    Args:
+        node (h5py.Dataset/h5py.Group): existing HDF5 node
+        new (numpy.ndarray/tuple): output of :func:`_to_extendable`
+
+    Returns:
+        bool: True if the data was appended
+    """
+    title = node.attrs.get("TITLE", "")
+    if isinstance(title, bytes):
+        title = title.decode()
+    if isinstance(node, h5py.Dataset):
+        return (
+            title == "ndarray"
+            and isinstance(new, np.ndarray)
+            and _append_to_dataset(node, new)
+        )
+    elif title == "multiarray":
+        new = _as_ragged(new)
+        if new is None or "index" not in node or "data" not in node:
+            return False
+        lengths, data = new
+        index, concatenated = node["index"], node["data"]
+        if (
+            index.maxshape[0] is None
+            and index.shape[0] > 0
+            and concatenated.maxshape[0] is None
+            and concatenated.shape[1:] == data.shape[1:]
+            and np.can_cast(data.dtype, concatenated.dtype, "safe")
+        ):
+            _append_to_dataset(index, index[-1] + np.cumsum(lengths))
+            _append_to_dataset(concatenated, data)
+            return True
+    return False
+
+
 class FileHDFio(HasGroups, MutableMapping):
     """
     Class that provides all info to access a h5 file. This class is based on h5io.py, which allows to
@@ -113,6 +349,7 @@ class FileHDFio(HasGroups, MutableMapping):
         self.history = []
         self.h5_path = h5_path
         self._filter = ["groups", "nodes", "objects"]
+        self._session = None
 
     # MutableMapping Impl
     def __contains__(self, item):
@@ -149,7 +386,7 @@ class FileHDFio(HasGroups, MutableMapping):
                 # underlying file once, this reduces the number of file opens in the most-likely case from 2 to 1 (1 to
                 # check whether the data is there and 1 to read it) and increases in the worst case from 1 to 2 (1 to
                 # try to read it here and one more time to verify it's not a group below).
-                obj = read_hdf5(self.file_name, title=self._get_h5_path(item))
+                obj = self._read(item)
                 if self._is_convertable_dtype_object_array(obj):
                     obj = self._convert_dtype_obj_array(obj.copy())
                 return obj
@@ -260,6 +497,19 @@ class FileHDFio(HasGroups, MutableMapping):
             use_json = False
         elif isinstance(value, tuple):
             value = list(value)
+        store = self._get_session_store(write=True)
+        if store is not None:
+            try:
+                write_to_store(
+                    store,
+                    value,
+                    title=self._get_h5_path(key),
+                    use_json=use_json,
+                )
+                return
+            except H5ioFallback:
+                # pandas objects are written through pytables, which can not share the file with the h5py handle
+                self._session.release()
         write_hdf5(
             self.file_name,
             value,
@@ -277,7 +527,7 @@ class FileHDFio(HasGroups, MutableMapping):
         """
         if self.file_exists:
             try:
-                with open_hdf5(self.file_name, mode="a") as store:
+                with self._open_store(mode="a") as store:
                     del store[self._get_h5_path(key)]
             except (AttributeError, KeyError):
                 pass
@@ -391,7 +641,7 @@ class FileHDFio(HasGroups, MutableMapping):
             bool: [True/False]
         """
         if self.file_exists:
-            with open_hdf5(self.file_name) as h:
+            with self._open_store() as h:
                 return len(h.keys()) == 0
         else:
             return True
@@ -433,6 +683,7 @@ class FileHDFio(HasGroups, MutableMapping):
         """
         new_h5 = FileHDFio(file_name=self.file_name, h5_path=self.h5_path)
         new_h5._filter = self._filter
+        new_h5._session = self._session
         return new_h5
 
     def copy_to(self, destination, file_name=None, maintain_name=True):
@@ -500,7 +751,7 @@ class FileHDFio(HasGroups, MutableMapping):
                 else destination.h5_path
             )
             if self.file_name != file_name:
-                with open_hdf5(self.file_name, mode="r") as f_source:
+                with self._open_store() as f_source:
                     with open_hdf5(file_name, mode="a") as f_target:
                         _internal_copy(
                             source=f_source,
@@ -510,7 +761,7 @@ class FileHDFio(HasGroups, MutableMapping):
                             maintain_flag=maintain_name,
                         )
             else:
-                with open_hdf5(file_name, mode="a") as f_target:
+                with self._open_store(mode="a") as f_target:
                     _internal_copy(
                         source=f_target,
                         source_path=self._h5_path,
@@ -535,7 +786,7 @@ class FileHDFio(HasGroups, MutableMapping):
             FileHDFio: FileHDFio object pointing to the new group
         """
         full_name = self._get_h5_path(name)
-        with open_hdf5(self.file_name, mode="a") as h:
+        with self._open_store(mode="a") as h:
             try:
                 h.create_group(full_name, track_order=track_order)
             except ValueError:
@@ -548,7 +799,7 @@ class FileHDFio(HasGroups, MutableMapping):
         Remove an HDF5 group - if it exists. If the group does not exist no error message is raised.
         """
         try:
-            with open_hdf5(self.file_name, mode="a") as hdf_file:
+            with self._open_store(mode="a") as hdf_file:
                 del hdf_file[self.h5_path]
         except KeyError:
             pass
@@ -602,6 +853,8 @@ class FileHDFio(HasGroups, MutableMapping):
         Remove the HDF5 file with all the related content
         """
         if self.file_exists:
+            if self._session is not None:
+                self._session.release()
             os.remove(self.file_name)
 
     def get_from_table(self, path, name):
@@ -666,6 +919,44 @@ class FileHDFio(HasGroups, MutableMapping):
         """
         self.__setitem__(key=key, value=value)
 
+    def extend(self, key, value):
+        """
+        Append data along the first axis of the array stored at key.
+
+        Numeric arrays are stored as chunked datasets with an unlimited first dimension and ragged data, i.e. a list of
+        arrays which only differ in their first dimension, in the same index/data layout h5io uses for object arrays.
+        As long as the layout of the new steps matches the stored layout they are written in place, so the cost of
+        extending only depends on the amount of new data.  If the layout changes, e.g. the first steps were rectangular
+        and a later step is ragged, or the data was written by :meth:`.__setitem__`, the stored data is read and
+        rewritten once in the extendable layout, which costs time proportional to the data already stored.  Data which
+        can not be stored in an extendable layout at all is concatenated and rewritten on every call.
+
+        Args:
+            key (str): key of the data
+            value (list, numpy.ndarray): new data, one entry per step
+        """
+        new = _to_extendable(value)
+        title = self._get_h5_path(key)
+        with self._open_store(mode="a") as store:
+            exists = title in store
+            if new is not None:
+                if not exists:
+                    _create_extendable(store, title, new)
+                    return
+                elif _extend_in_place(store[title], new):
+                    return
+        if not exists:
+            self[key] = value
+            return
+        old = self[key]
+        combined = _to_extendable(list(old) + list(value))
+        if combined is not None:
+            with self._open_store(mode="a") as store:
+                del store[title]
+                _create_extendable(store, title, combined)
+        else:
+            self[key] = np.array(list(old) + list(value))
+
     def _list_all(self):
         """
         List all groups and nodes of the HDF5 file - where groups are equivalent to directories and nodes to files.
@@ -676,17 +967,20 @@ class FileHDFio(HasGroups, MutableMapping):
         if self.file_exists:
             groups = set()
             nodes = set()
-            with open_hdf5(self.file_name) as h:
+            iopy_nodes = set()
+            with self._open_store() as h:
                 try:
                     h = h[self.h5_path]
                     for k in h.keys():
-                        if isinstance(h[k], h5py.Group):
+                        # getclass avoids opening every dataset only to check its type
+                        if issubclass(h.get(k, getclass=True), h5py.Group):
                             groups.add(k)
+                            if _is_h5io_object(h[k]):
+                                iopy_nodes.add(k)
                         else:
                             nodes.add(k)
                 except KeyError:
                     pass
-            iopy_nodes = self._filter_io_objects(groups)
             return {
                 "groups": sorted(list(groups - iopy_nodes)),
                 "nodes": sorted(list((nodes - groups).union(iopy_nodes))),
@@ -878,6 +1172,12 @@ class FileHDFio(HasGroups, MutableMapping):
         del self.history
         del self._h5_path
 
+    def __getstate__(self):
+        # the file handle of an active session can not be pickled or copied
+        state_dict = self.__dict__.copy()
+        state_dict["_session"] = None
+        return state_dict
+
     def __enter__(self):
         """
         Compatibility function for the with statement
@@ -904,8 +1204,88 @@ class FileHDFio(HasGroups, MutableMapping):
         Returns:
             dict, list, float, int: data or data object
         """
+        store = self._get_session_store()
+        if store is not None:
+            try:
+                return read_from_store(store, title=self._get_h5_path(item))
+            except H5ioFallback:
+                # pandas objects are read through pytables, which can not share the file with the h5py handle
+                self._session.release()
         return read_hdf5(self.file_name, title=self._get_h5_path(item))
 
+    @contextlib.contextmanager
+    def session(self, mode="a"):
+        """
+        Keep the HDF5 file open while inside the with statement.
+
+        By default every read and write opens and closes the HDF5 file again, inside a session all reads, writes and
+        listings of this object and all objects derived from it via :meth:`.open` or :meth:`.copy` share a single
+        file handle.  Nested sessions reuse the outer one.  In a read-only session the handle is closed before
+        writing and the write opens the file on its own.  Changes are only guaranteed to be visible to other processes
+        after the session is closed.
+
+        Args:
+            mode (str): mode to open the HDF5 file with {'a', 'r', 'r+'}, default 'a'
+
+        Yields:
+            FileHDFio: self
+
+        Example:
+
+        >>> with job.project_hdf5.session():
+        ...     job.to_hdf()
+        """
+        if self._session is not None and self._session.is_active:
+            yield self
+            return
+        session = _HDFSession(file_name=self.file_name, mode=mode)
+        self._session = session
+        try:
+            yield self
+        finally:
+            session.close()
+            self._session = None
+
+    def _get_session_store(self, write=False):
+        """
+        Internal function to get the file handle of the currently active session.
+
+        Args:
+            write (bool): the handle is used to write, so the file may be created
+
+        Returns:
+            h5py.File/None: open file handle or None if no session is active for this file
+        """
+        session = self._session
+        if (
+            session is None
+            or not session.is_active
+            or session.file_name != self.file_name
+        ):
+            return None
+        if write and session.mode == "r":
+            # a read-only handle can not be used to write and blocks opening the file for writing, so release it
+            session.release()
+            return None
+        if not write and not session.is_open and not os.path.isfile(self.file_name):
+            return None
+        return session.store
+
+    @contextlib.contextmanager
+    def _open_store(self, mode="r"):
+        """
+        Internal function to open the HDF5 file, reusing the handle of an active session.
+
+        Args:
+            mode (str): mode to open the HDF5 file with if no session is active
+        """
+        store = self._get_session_store(write=mode != "r")
+        if store is not None:
+            yield store
+        else:
+            with open_hdf5(self.file_name, mode=mode) as store:
+                yield store
+
     # def _open_store(self, mode="r"):
     #     """
     #     Internal function to open the HDF5 file
@@ -952,43 +1332,6 @@ class FileHDFio(HasGroups, MutableMapping):
         """
         return posixpath.join(self.h5_path, name)
 
-    def _get_h5io_type(self, name):
-        """
-        Internal function to get h5io type
-
-        Args:
-            name (str): HDF5 key
-
-        Returns:
-            str: h5io type
-        """
-        with open_hdf5(self.file_name) as store:
-            return str(store[self.h5_path][name].attrs.get("TITLE", ""))
-
-    def _filter_io_objects(self, groups):
-        """
-        Internal function to extract h5io objects (which have the same type as normal groups)
-
-        Args:
-            groups (list, set): list of groups (as obtained e.g. from listdirs
-
-        Returns:
-            set: h5io objects
-        """
-        h5io_types = (
-            "dict",
-            "list",
-            "tuple",
-            "pd_dataframe",
-            "pd_series",
-            "multiarray",
-            "json",
-        )
-        group_h5io = set(
-            [group for group in groups if self._get_h5io_type(group) in h5io_types]
-        )
-        return group_h5io
-
     def _walk(self, level=0):
         """
         Internal helper function for show_hdf() - iterating over the HDF5 datastructure and generating a human readable
@@ -1277,6 +1620,7 @@ class ProjectHDFio(FileHDFio):
             project=self._project, file_name=self._file_name, h5_path=self._h5_path
         )
         new_h5._filter = self._filter
+        new_h5._session = self._session
         return new_h5
 
     def create_hdf(self, path, job_name):
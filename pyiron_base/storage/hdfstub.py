@@ -56,7 +56,7 @@ class HDFStub:
 
     _load_functions = {}
 
-    def __init__(self, hdf, group_name):
+    def __init__(self, hdf, group_name, is_node=None, copy_hdf=True):
         """
         Create new stub.
 
@@ -66,9 +66,14 @@ class HDFStub:
         Args:
             hdf (:class:`.ProjectHDFio`): hdf object to load from
             group_name (str): node or group name to load from the hdf object
+            is_node (bool, optional): whether `group_name` is a node or a group in hdf, if not given this is looked up
+                                      on :meth:`.load`
+            copy_hdf (bool): copy the hdf object; stubs for many values of the same group may pass False and share a
+                             copy that is not opened or closed by anybody else
         """
-        self._hdf = hdf.copy()
+        self._hdf = hdf.copy() if copy_hdf else hdf
         self._group_name = group_name
+        self._is_node = is_node
 
     @classmethod
     def register(cls, type, load):
@@ -91,15 +96,17 @@ class HDFStub:
         node matches any of the types registered with :method:`.register`, it will be loaded with the provided callback.
         Otherwise it will be loaded with :method:`.ProjectHDFio.to_object()`.
         """
-        if (
-            self._group_name in self._hdf.list_nodes()
-            or "TYPE" not in self._hdf[self._group_name].list_nodes()
-        ):
+        is_node = self._is_node
+        if is_node is None:
+            is_node = self._group_name in self._hdf.list_nodes()
+        if is_node:
             return self._hdf[self._group_name]
 
-        load = self._load_functions.get(
-            self._hdf[self._group_name]["TYPE"], lambda h, g: h[g].to_object()
-        )
+        group = self._hdf.open(self._group_name)
+        if "TYPE" not in group.list_nodes():
+            return group
+
+        load = self._load_functions.get(group["TYPE"], lambda h, g: h[g].to_object())
         return load(self._hdf, self._group_name)
 
     def __repr__(self):
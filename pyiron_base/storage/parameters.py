@@ -97,7 +97,6 @@ class GenericParameters:
         self._block_dict = None
         self._bool_dict = {True: "True", False: "False"}
         self._dataset = OrderedDict()
-        self._block_line_dict = {}
         self.end_value_char = end_value_char
         self.file_name = input_file_name
         self.table_name = table_name
@@ -111,6 +110,27 @@ class GenericParameters:
         else:
             self.read_input(self.file_name)
 
+    @property
+    def _dataset(self):
+        """
+        Get the table of the GenericParameters with the columns "Parameter", "Value" and "Comment"
+
+        Returns:
+            OrderedDict: dictionary of lists
+        """
+        return self._data
+
+    @_dataset.setter
+    def _dataset(self, new_dataset):
+        """
+        Set the table of the GenericParameters and reset the line index
+
+        Args:
+            new_dataset (OrderedDict): dictionary of lists with the columns "Parameter", "Value" and "Comment"
+        """
+        self._data = new_dataset
+        self._line_index = None
+
     @property
     def file_name(self):
         """
@@ -364,14 +384,7 @@ class GenericParameters:
         """
         i_line = self._find_line(parameter_name)
         if i_line > -1:
-            val = self._dataset["Value"][i_line]
-            try:
-                val_v = literal_eval(val)
-            except (ValueError, SyntaxError):
-                val_v = val
-            if callable(val_v):
-                val_v = val
-            return val_v
+            return self._parse_value(self._dataset["Value"][i_line])
         elif default_value is not None:
             return default_value
         else:
@@ -476,17 +489,21 @@ class GenericParameters:
         Args:
             key_list (list): list of keys to be removed
         """
-        if self.read_only and any([k in self._dataset["Parameter"] for k in key_list]):
+        line_index = self._get_line_index()
+        i_key_lst = sorted(
+            set(
+                i_key for key in key_list for i_key in line_index.line_dict.get(key, [])
+            )
+        )
+        if len(i_key_lst) == 0:
+            return
+        if self.read_only:
             self._read_only_error()
-        for key in key_list:
-            params = np.array(self._dataset["Parameter"])
-            i_keys = np.where(params == key)[0]
-            if len(i_keys) == 0:
-                continue
-            if i_keys[0] == -1:
-                continue
-            for i_key in i_keys[::-1]:
-                self._delete_line(i_key)
+        for key in self._dataset:
+            val = self._get_column(key)
+            for i_key in i_key_lst[::-1]:
+                del val[i_key]
+        self._line_index = None
 
     def define_blocks(self, block_dict):
         """
@@ -498,6 +515,7 @@ class GenericParameters:
         if not isinstance(block_dict, OrderedDict):
             raise AssertionError()
         self._block_dict = block_dict
+        self._line_index = None
 
     def to_hdf(self, hdf, group_name=None):
         """
@@ -544,13 +562,10 @@ class GenericParameters:
             tab_dict["Parameter"] = ["" for _ in tab_dict["Value"]]
 
         string_lst = []
-        if self.val_only:
+        if self.val_only or self._get_line_index().has_duplicates():
             value_lst = tab_dict["Value"]
         else:
-            try:
-                value_lst = [self[p] for p in tab_dict["Parameter"]]
-            except ValueError:
-                value_lst = tab_dict["Value"]
+            value_lst = [self._parse_value(v) for v in tab_dict["Value"]]
         for par, v, c in zip(tab_dict["Parameter"], value_lst, tab_dict["Comment"]):
             # special treatment for values that are bool or str
             if isinstance(v, bool):
@@ -602,8 +617,7 @@ class GenericParameters:
             file_name = posixpath.join(cwd, file_name)
 
         with open(file_name, "w") as f:
-            for line in self.get_string_lst():
-                f.write(line)
+            f.writelines(self.get_string_lst())
 
     def __repr__(self):
         """
@@ -650,7 +664,7 @@ class GenericParameters:
         """
         if isinstance(item, int):
             return self._dataset["Value"][item]
-        elif item in self._dataset["Parameter"]:
+        elif item in self._get_line_index().line_dict:
             return self.get(item)
 
     def __delitem__(self, key):
@@ -756,11 +770,9 @@ class GenericParameters:
         """
         if self.read_only:
             self._read_only_error()
-        for key, val in self._dataset.items():
-            if "numpy" in str(type(val)):
-                val = val.tolist()
-            del val[line_number]
-            self._dataset[key] = val
+        for key in self._dataset:
+            del self._get_column(key)[line_number]
+        self._line_index = None
 
     def _insert(self, line_number, data_dict, shift=0):
         """
@@ -773,34 +785,56 @@ class GenericParameters:
         """
         if self.read_only:
             self._read_only_error()
+        line_index = self._get_line_index()
         for key, val in data_dict.items():
-            lst = self._dataset[key]
-            val = np.array(val).tolist()
-            lst = np.array(lst).tolist()
-            self._dataset[key] = lst[: line_number - shift] + val + lst[line_number:]
+            self._get_column(key)[line_number - shift : line_number] = np.array(
+                val
+            ).tolist()
+        if shift == 0 and "Parameter" in data_dict:
+            line_index.insert(
+                line_number=line_number,
+                parameter_lst=self._dataset["Parameter"],
+                new_parameter_lst=data_dict["Parameter"],
+            )
+        else:
+            self._line_index = None
 
-    def _refresh_block_line_hash_table(self):
+    def _get_column(self, key):
         """
-        Internal helper function to refresh the block dictionary hash table
+        Internal helper function to get a column of the table as list, columns stored as numpy arrays are converted.
+
+        Args:
+            key (str): column name
+
+        Returns:
+            list: column
         """
-        self._block_line_dict = {}
-        for i_line, par in enumerate(self._dataset["Parameter"]):
-            if par.strip() == "":
-                continue
-            for key, val in self._block_dict.items():
-                par_single = par.split()[0].split(self.multi_word_separator)[0]
-                if par_single in val:
-                    if key in self._block_line_dict:
-                        self._block_line_dict[key].append(i_line)
-                    else:
-                        self._block_line_dict[key] = [i_line]
-                    break
-        i_line_old = 0
-        for key in self._block_dict:
-            if key in self._block_line_dict:
-                i_line_old = np.max(self._block_line_dict[key])
-            else:
-                self._block_line_dict[key] = [i_line_old]
+        column = self._dataset[key]
+        if not isinstance(column, list):
+            column = np.array(column, dtype=object).tolist()
+            self._dataset[key] = column
+        return column
+
+    def _get_line_index(self):
+        """
+        Internal helper function to get the index of the parameter lines, it is rebuilt if the parameter column was
+        changed without updating the index.
+
+        Returns:
+            _LineIndex: line index
+        """
+        parameter_lst = self._get_column("Parameter")
+        if self._line_index is None or not self._line_index.is_valid(
+            parameter_lst=parameter_lst,
+            block_dict=self._block_dict,
+            multi_word_separator=self.multi_word_separator,
+        ):
+            self._line_index = _LineIndex(
+                parameter_lst=parameter_lst,
+                block_dict=self._block_dict,
+                multi_word_separator=self.multi_word_separator,
+            )
+        return self._line_index
 
     def _append_line_in_block(self, parameter_name, value):
         """
@@ -813,25 +847,23 @@ class GenericParameters:
         Returns:
             bool: [True/False]
         """
-        for key, val in self._block_dict.items():
-            par_first = parameter_name.split()[0].split(self.multi_word_separator)[0]
-            if par_first in val:
-                i_last_block_line = max(self._block_line_dict[key])
-                self._insert(
-                    line_number=i_last_block_line + 1,
-                    data_dict={
-                        "Parameter": [parameter_name],
-                        "Value": [str(value)],
-                        "Comment": [""],
-                    },
-                )
-                return True
-        else:
-            state.logger.warning(
-                "Unknown parameter (does not exist in block_dict): {}".format(
-                    parameter_name
-                )
+        line_index = self._get_line_index()
+        block_name = line_index.get_block(parameter_name)
+        if block_name is not None:
+            self._insert(
+                line_number=line_index.get_block_end(block_name),
+                data_dict={
+                    "Parameter": [parameter_name],
+                    "Value": [str(value)],
+                    "Comment": [""],
+                },
             )
+            return True
+        state.logger.warning(
+            "Unknown parameter (does not exist in block_dict): {}".format(
+                parameter_name
+            )
+        )
         return False
 
     def _append(self, **qwargs):
@@ -844,23 +876,26 @@ class GenericParameters:
         if self.read_only:
             self._read_only_error()
         for par, val in qwargs.items():
-            if par in self._dataset["Parameter"]:
+            line_index = self._get_line_index()
+            if par in line_index.line_dict:
                 raise ValueError("Parameter exists already: " + par)
 
             if self._block_dict is not None:
-                self._refresh_block_line_hash_table()
                 if self._append_line_in_block(par, val):
                     continue
 
-            for col in self._dataset:
-                self._dataset[col] = np.array(self._dataset[col], dtype=object).tolist()
-
             comment = ""
             if isinstance(val, tuple):
                 val, comment = val
-            self._dataset["Parameter"].append(par)
-            self._dataset["Value"].append(val)
-            self._dataset["Comment"].append(comment)
+            self._get_column("Value").append(val)
+            self._get_column("Comment").append(comment)
+            parameter_lst = self._get_column("Parameter")
+            parameter_lst.append(par)
+            line_index.insert(
+                line_number=len(parameter_lst) - 1,
+                parameter_lst=parameter_lst,
+                new_parameter_lst=[par],
+            )
 
     def _is_multi_word_parameter(self, key):
         """
@@ -958,11 +993,7 @@ class GenericParameters:
         Returns:
             list: [line index, line]
         """
-        params = self._dataset["Parameter"]
-        if len(params) > 0:
-            i_line_lst = np.where(np.array(params) == key_name)[0]
-        else:
-            i_line_lst = []
+        i_line_lst = self._get_line_index().line_dict.get(key_name, [])
         if len(i_line_lst) == 0:
             return -1
         elif len(i_line_lst) == 1:
@@ -996,3 +1027,146 @@ class GenericParameters:
             if val == value:
                 return key
         return val
+
+    @staticmethod
+    def _parse_value(val):
+        """
+        Internal helper function to convert a value string to the corresponding python object, see get()
+
+        Args:
+            val (str): value
+
+        Returns:
+            object: python literal or val if it can not be converted
+        """
+        try:
+            val_v = literal_eval(val)
+        except (ValueError, SyntaxError):
+            val_v = val
+        if callable(val_v):
+            val_v = val
+        return val_v
+
+
+class _LineIndex:
+    """
+    Index of the parameter lines of GenericParameters, which maps every parameter to its line numbers and every block
+    to its last line. The index is updated when lines are inserted with GenericParameters._insert() or
+    GenericParameters._append(), any other change of the length or the identity of the parameter list invalidates it.
+
+    Args:
+        parameter_lst (list): parameter column of the GenericParameters table
+        block_dict (OrderedDict/None): block definition, see GenericParameters.define_blocks()
+        multi_word_separator (str): multi word separator of the GenericParameters
+    """
+
+    def __init__(self, parameter_lst, block_dict, multi_word_separator):
+        self._parameter_lst = parameter_lst
+        self._length = len(parameter_lst)
+        self._block_dict = block_dict
+        self._multi_word_separator = multi_word_separator
+        self._block_lookup = {}
+        if block_dict is not None:
+            for block_name, block_parameters in reversed(block_dict.items()):
+                for par in block_parameters:
+                    self._block_lookup[par] = block_name
+        self.line_dict = {}
+        self._block_last_line = {}
+        for i_line, par in enumerate(parameter_lst):
+            self._add_line(i_line=i_line, par=par)
+
+    def is_valid(self, parameter_lst, block_dict, multi_word_separator):
+        """
+        Check if the index still describes the given parameter list.
+
+        Args:
+            parameter_lst (list): parameter column of the GenericParameters table
+            block_dict (OrderedDict/None): block definition
+            multi_word_separator (str): multi word separator
+
+        Returns:
+            bool: [True/False]
+        """
+        return (
+            parameter_lst is self._parameter_lst
+            and len(parameter_lst) == self._length
+            and block_dict is self._block_dict
+            and multi_word_separator == self._multi_word_separator
+        )
+
+    def has_duplicates(self):
+        """
+        Check if any parameter occurs in more than one line.
+
+        Returns:
+            bool: [True/False]
+        """
+        return any(len(i_line_lst) > 1 for i_line_lst in self.line_dict.values())
+
+    def get_block(self, par):
+        """
+        Get the block a parameter belongs to.
+
+        Args:
+            par (str): parameter name
+
+        Returns:
+            str/None: block name or None if the parameter does not belong to any block
+        """
+        if len(self._block_lookup) == 0 or par.strip() == "":
+            return None
+        return self._block_lookup.get(
+            par.split()[0].split(self._multi_word_separator)[0], None
+        )
+
+    def get_block_end(self, block_name):
+        """
+        Get the line number after the last line of a block. For an empty block this is the line after the last line
+        of the closest previous block which is not empty.
+
+        Args:
+            block_name (str): block name
+
+        Returns:
+            int: line number
+        """
+        i_line_end = 0
+        for name in self._block_dict:
+            if name in self._block_last_line:
+                i_line_end = self._block_last_line[name]
+            if name == block_name:
+                break
+        return i_line_end + 1
+
+    def insert(self, line_number, parameter_lst, new_parameter_lst):
+        """
+        Update the index after new lines were inserted in the parameter list.
+
+        Args:
+            line_number (int): line number of the first inserted line
+            parameter_lst (list): parameter column of the GenericParameters table after the insert
+            new_parameter_lst (list): inserted parameters
+        """
+        shift = len(new_parameter_lst)
+        if line_number < self._length:
+            for i_line_lst in self.line_dict.values():
+                for i, i_line in enumerate(i_line_lst):
+                    if i_line >= line_number:
+                        i_line_lst[i] = i_line + shift
+            for name, i_line in self._block_last_line.items():
+                if i_line >= line_number:
+                    self._block_last_line[name] = i_line + shift
+        for i, par in enumerate(new_parameter_lst):
+            self._add_line(i_line=line_number + i, par=par)
+        self._parameter_lst = parameter_lst
+        self._length = len(parameter_lst)
+
+    def _add_line(self, i_line, par):
+        i_line_lst = self.line_dict.setdefault(par, [])
+        i_line_lst.append(i_line)
+        i_line_lst.sort()
+        block_name = self.get_block(par)
+        if block_name is not None:
+            self._block_last_line[block_name] = max(
+                i_line, self._block_last_line.get(block_name, i_line)
+            )
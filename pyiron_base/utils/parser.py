@@ -70,8 +70,30 @@ def extract_data_from_file(file_name, tag, num_args=1):
         list: List of arguments extracted as strings
     """
     with open(file_name) as infile:
-        content = infile.readlines()
-    return extract_data_from_str_lst(str_lst=content, tag=tag, num_args=num_args)
+        return extract_data_from_str_lst(str_lst=infile, tag=tag, num_args=num_args)
+
+
+def _rows_to_array(row_lst):
+    """
+    Convert the lines of a data block to an array with one row per line.
+
+    The block is converted at once to an integer or a float array, only if neither is possible every entry is
+    evaluated as python literal.
+
+    Args:
+        row_lst (list): list of lines
+
+    Returns:
+        numpy.ndarray: two dimensional array
+    """
+    value_lst = [line.split() for line in row_lst]
+    if len(set(len(values) for values in value_lst)) == 1:
+        for dtype in (int, float):
+            try:
+                return np.array(value_lst, dtype=dtype)
+            except (ValueError, OverflowError):
+                pass
+    return np.array([[ast.literal_eval(v) for v in values] for values in value_lst])
 
 
 class Logstatus(object):
@@ -300,7 +322,7 @@ class Logstatus(object):
         Main function of the LogStatus class to extract data from an output file by searching for the tag dictionary
 
         Args:
-            file_name (str): absolute path to the output file
+            list_of_lines (list/iterable): lines of the output file, any iterable over the lines like an open file
             tag_dict (dict): Dictionary with tags/patterns as key and an additional dictionary to describe the data
                              structure. The data structure dictionary can contain the following keys:
                              - "arg": position of the argument - or dimension (":", ":,:")
@@ -333,8 +355,8 @@ class Logstatus(object):
                     else:
                         for _ in range(tag.line_skip()):
                             line_read = next(iterate_over_lines)
+                        row_lst = []
                         if isinstance(tag.rows(), str):
-                            i_line = 0
                             while True:
                                 try:
                                     line_read = next(iterate_over_lines)
@@ -344,32 +366,17 @@ class Logstatus(object):
                                     break
                                 if "WARNING:" in line_read:
                                     break
-                                val_line = [
-                                    [ast.literal_eval(l) for l in line_read.split()]
-                                ]
-                                if i_line == 0:
-                                    val_array = np.array(val_line)
-                                else:
-                                    val_array = np.append(
-                                        arr=val_array, values=val_line, axis=0
-                                    )
-                                i_line += 1
-
+                                row_lst.append(line_read)
                         else:
-                            for i_line in range(tag.rows()):
+                            for _ in range(tag.rows()):
                                 try:
                                     line_read = next(iterate_over_lines)
                                 except StopIteration:
                                     break
-                                val_line = [
-                                    [ast.literal_eval(l) for l in line_read.split()]
-                                ]
-                                if i_line == 0:
-                                    val_array = np.array(val_line)
-                                else:
-                                    val_array = np.append(
-                                        arr=val_array, values=val_line, axis=0
-                                    )
+                                row_lst.append(line_read)
+                        if len(row_lst) == 0:
+                            continue
+                        val_array = _rows_to_array(row_lst)
 
                         if tag.is_func():
                             val_array = tag.apply_func(val_array)
@@ -421,10 +428,9 @@ class Logstatus(object):
             key_dict (dict): Translation dictionary of python internal tags as keys to the output tags as values.
         """
         with open(file_name, "r") as f:
-            content = f.readlines()
-        self.extract_from_list(
-            list_of_lines=content, tag_dict=tag_dict, h5_dict=h5_dict, key_dict=key_dict
-        )
+            self.extract_from_list(
+                list_of_lines=f, tag_dict=tag_dict, h5_dict=h5_dict, key_dict=key_dict
+            )
 
 
 class LogTag(object):
@@ -65,6 +65,7 @@ class TestPack(PyironTestCase):
         self.pr.pack(destination_path=self.arch_dir_comp, compress=True)
         file_path = self.arch_dir_comp + ".tar.gz"
         self.assertTrue(os.path.exists(file_path))
+        self.assertFalse(os.path.exists(self.arch_dir_comp), "Files should be streamed into the archive")
         os.remove(file_path)
 
     def test_content(self):
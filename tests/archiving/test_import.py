@@ -66,6 +66,7 @@ class TestUnpacking(PyironTestCase):
         path_import = getdir(path_import)
         compare_obj = dircmp(path_original, path_import)
         self.assertEqual(len(compare_obj.diff_files), 0)
+        self.assertFalse(os.path.exists(self.arch_dir_comp), "Files should be streamed out of the archive")
 
     def test_unpack_to_nested_project(self):
         pr = self.pr.open("nested")
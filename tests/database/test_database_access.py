@@ -181,6 +181,124 @@ class TestDatabaseAccess(PyironTestCase):
                 "Unexpectedly, item_update raises an Error with types of ids which should be usable"
             )
 
+    def test_add_items(self):
+        """
+        Tests add_items function
+        Returns:
+        """
+        par_dict_lst = [
+            {"job": "bulk_1", "project": "bulk/", "status": "initialized"},
+            {"job": "bulk_2", "project": "bulk/", "ChemicalFormula": "BO"},
+        ]
+        key_lst = self.database.add_items(par_dict_lst)
+        self.assertEqual(len(key_lst), 2)
+        self.assertEqual(key_lst[1], key_lst[0] + 1)
+        self.assertEqual(self.database.get_item_by_id(key_lst[0])["job"], "bulk_1")
+        self.assertIsNone(self.database.get_item_by_id(key_lst[0])["chemicalformula"])
+        self.assertEqual(self.database.get_item_by_id(key_lst[1])["job"], "bulk_2")
+        self.assertEqual(
+            self.database.get_item_by_id(key_lst[1])["chemicalformula"], "BO"
+        )
+        self.assertEqual(self.database.add_items([]), [])
+
+    def test_items_update(self):
+        """
+        Tests items_update and set_job_status_many function
+        Returns:
+        """
+        key_lst = [self.add_items("BO")["id"] for _ in range(3)]
+        self.database.items_update(
+            [
+                (key_lst[0], {"job": "bulk_update_0"}),
+                (key_lst[1], {"job": "bulk_update_1", "masterid": key_lst[0]}),
+                (key_lst[2], {"Status": "finished"}),
+            ]
+        )
+        self.assertEqual(self.database.get_item_by_id(key_lst[0])["job"], "bulk_update_0")
+        self.assertEqual(self.database.get_item_by_id(key_lst[1])["job"], "bulk_update_1")
+        self.assertEqual(self.database.get_item_by_id(key_lst[1])["masterid"], key_lst[0])
+        self.assertEqual(self.database.get_item_by_id(key_lst[2])["job"], "testing")
+        self.assertEqual(self.database.get_item_by_id(key_lst[2])["status"], "finished")
+        self.database.set_job_status_many(
+            {key_lst[0]: "aborted", key_lst[1]: "aborted", key_lst[2]: "running"}
+        )
+        self.assertEqual(
+            [self.database.get_job_status(key) for key in key_lst],
+            ["aborted", "aborted", "running"],
+        )
+        self.database.set_job_status(status="finished", job_id=key_lst[:2])
+        self.assertEqual(
+            [self.database.get_job_status(key) for key in key_lst],
+            ["finished", "finished", "running"],
+        )
+
+    def test_get_child_status_counts(self):
+        """
+        Tests get_child_status_counts function
+        Returns:
+        """
+        master_id = self.database.add_item_dict({"job": "master", "status": "running"})
+        self.database.add_items(
+            [
+                {"job": "child_0", "masterid": master_id, "status": "finished"},
+                {"job": "child_1", "masterid": master_id, "status": "finished"},
+                {"job": "child_2", "masterid": master_id, "status": "aborted"},
+                {"job": "other", "masterid": master_id + 10, "status": "running"},
+            ]
+        )
+        self.assertEqual(
+            self.database.get_child_status_counts(master_id=master_id),
+            {"finished": 2, "aborted": 1},
+        )
+        self.assertEqual(
+            self.database.get_child_status_counts(master_id=master_id + 1), {}
+        )
+
+    def test_job_table_filter_limit(self):
+        """
+        Tests job_table with filters, sorting, limit and offset applied by the database
+        Returns:
+        """
+        self.database.add_items(
+            [
+                {
+                    "job": "job_{}".format(i),
+                    "project": "filter/",
+                    "projectpath": "/tmp/",
+                    "status": "finished" if i % 2 == 0 else "aborted",
+                    "hamilton": "Toy_Job" if i < 3 else None,
+                }
+                for i in range(6)
+            ]
+        )
+        kwargs = {
+            "sql_query": None,
+            "user": None,
+            "project_path": "filter/",
+            "columns": ["job", "status"],
+        }
+        df = self.database.job_table(status="finished", **kwargs)
+        self.assertEqual(list(df.job), ["job_0", "job_2", "job_4"])
+        self.assertEqual(list(df.columns), ["job", "status", "id"])
+        df = self.database.job_table(status="!finished", limit=2, **kwargs)
+        self.assertEqual(list(df.job), ["job_1", "job_3"])
+        df = self.database.job_table(limit=2, offset=3, **kwargs)
+        self.assertEqual(list(df.job), ["job_3", "job_4"])
+        df = self.database.job_table(hamilton="!Toy_Job", **kwargs)
+        self.assertEqual(list(df.job), ["job_3", "job_4", "job_5"])
+        df = self.database.job_table(hamilton=None, status="finished", **kwargs)
+        self.assertEqual(list(df.job), ["job_4"])
+        df = self.database.job_table(hamilton="*_J*", limit=1, offset=1, **kwargs)
+        self.assertEqual(list(df.job), ["job_1"])
+        df = self.database.job_table(job="*_3", **kwargs)
+        self.assertEqual(list(df.job), ["job_3"])
+        df = self.database.job_table(hamilton="toy*", **kwargs)
+        self.assertEqual(len(df), 0)
+        df = self.database.job_table(hamilton="!*Job", **kwargs)
+        self.assertEqual(list(df.job), ["job_3", "job_4", "job_5"])
+        with self.assertRaises(ValueError):
+            self.database.job_table(no_such_column="value", **kwargs)
+
     def test_delete_item(self):
         """
         Tests delete_item function
@@ -12,8 +12,10 @@ Murat Han Celik
 """
 import unittest
 import os
+import shutil
 from datetime import datetime
 from pyiron_base.database.filetable import FileTable
+from pyiron_base.storage.hdfio import FileHDFio
 from pyiron_base._tests import PyironTestCase
 
 
@@ -170,6 +172,47 @@ class TestDatabaseAccess(PyironTestCase):
         self.assertRaises(TypeError, self.database.get_items_dict, item_dict)
 
     # NOT A TEST #
+    def test_extract_cache(self):
+        """
+        Tests that the HDF5 files are only read again when they were modified
+        Returns:
+        """
+        project = self.database._project
+        cache_project = os.path.join(project, "filetable_cache")
+        os.makedirs(cache_project, exist_ok=True)
+        file_name = os.path.join(cache_project, "job.h5")
+        hdf = FileHDFio(file_name=file_name).open("job")
+        hdf["TYPE"] = "<class 'pyiron_base.jobs.script.ScriptJob'>"
+        hdf["VERSION"] = "0.1"
+        hdf["status"] = "finished"
+        FileHDFio(file_name=os.path.join(cache_project, "other.h5"))["data"] = 1
+        extract_calls = []
+
+        def get_extract(path, mtime):
+            extract_calls.append(path)
+            return FileTable.get_extract(path, mtime)
+
+        try:
+            self.database._project = cache_project
+            self.database.force_reset()
+            self.assertTrue(os.path.exists(self.database._cache_file_name))
+            self.database.get_extract = get_extract
+            self.database.force_reset()
+            self.assertEqual(extract_calls, [])
+            self.assertEqual(len(self.database._job_table), 1)
+            self.assertEqual(self.database._job_table.status.values[0], "finished")
+            self.assertEqual(self.database._job_table.hamilton.values[0], "ScriptJob")
+            hdf["status"] = "aborted"
+            os.utime(file_name, (0, 0))
+            self.database.force_reset()
+            self.assertEqual(extract_calls, [file_name])
+            self.assertEqual(self.database._job_table.status.values[0], "aborted")
+        finally:
+            del self.database.get_extract
+            self.database._project = project
+            shutil.rmtree(cache_project)
+            self.database.force_reset()
+
     def add_items(self, formula):
         """
         Simple generic helper function to add items to DB
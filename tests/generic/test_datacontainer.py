@@ -9,6 +9,7 @@ from collections.abc import Iterator
 import copy
 import os
 import unittest
+import unittest.mock
 import warnings
 import h5py
 import numpy as np
@@ -684,6 +685,44 @@ class TestDataContainer(TestWithCleanProject):
         self.assertEqual(len(d), len(items),
                          "Number of items in HDF does not match length of container!")
 
+    def test_overwrite_lazy_diff(self):
+        """Writing a lazily loaded container should only write changed values, but give the same result in HDF."""
+        d = DataContainer({"a": 1, "b": [1, 2], "c": {"d": 3}, "e": "foo"}, table_name="diff")
+        d.to_hdf(self.hdf)
+        ll = self.hdf["diff"].to_object(lazy=True)
+        ll.e = "bar"
+        written = []
+        setitem = type(self.hdf).__setitem__
+        def record(hdf, key, value):
+            written.append(key)
+            setitem(hdf, key, value)
+        with unittest.mock.patch.object(type(self.hdf), "__setitem__", record):
+            ll.to_hdf(self.hdf, "diff")
+        self.assertEqual(sorted(k for k in written if "__index_" in k), ["e__index_3"],
+                         "Unchanged values written again!")
+        self.assertEqual(self.hdf["diff"].to_object().to_builtin(), {"a": 1, "b": [1, 2], "c": {"d": 3}, "e": "bar"},
+                         "Container not correctly written!")
+
+        written.clear()
+        with unittest.mock.patch.object(type(self.hdf), "__setitem__", record):
+            ll.to_hdf(self.hdf, "diff")
+        self.assertEqual([k for k in written if "__index_" in k], [], "Unchanged values written again!")
+
+        ll = self.hdf["diff"].to_object(lazy=True)
+        ll.insert(0, "first", key="z")
+        del ll["c"]
+        ll.to_hdf(self.hdf, "diff")
+        self.assertEqual(self.hdf["diff"].to_object().to_builtin(),
+                         {"z": "first", "a": 1, "b": [1, 2], "e": "bar"},
+                         "Container not correctly written after moving values!")
+
+        d = self.hdf["diff"].to_object()
+        del self.hdf["diff"]
+        d.to_hdf(self.hdf, "diff")
+        self.assertEqual(self.hdf["diff"].to_object().to_builtin(),
+                         {"z": "first", "a": 1, "b": [1, 2], "e": "bar"},
+                         "Container not correctly written after removing the group!")
+
 
 class TestInputList(PyironTestCase):
 
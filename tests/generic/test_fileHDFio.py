@@ -1,11 +1,14 @@
 # coding: utf-8
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
+import copy
 import os
+import pickle
 import sys
 import warnings
 from io import StringIO
 import numpy as np
+import pandas
 from pyiron_base.storage.hdfio import FileHDFio, _is_ragged_in_1st_dim_only, state
 from pyiron_base._tests import PyironTestCase, TestWithProject, ToyJob as BaseToyJob
 from pyiron_base import GenericJob, JobType
@@ -300,8 +303,9 @@ class TestFileHDFio(PyironTestCase):
         with self.full_hdf5.open("content") as opened_hdf:
             opened_hdf["dummy"] = 42
             del opened_hdf["dummy"]
-            self.assertNotIn("dummy", opened_hdf.list_nodes(), msg="Entry still in HDF after del!")
-
+            self.assertNotIn(
+                "dummy", opened_hdf.list_nodes(), msg="Entry still in HDF after del!"
+            )
 
     def test_get_from_table(self):
         pass
@@ -555,6 +559,80 @@ class TestFileHDFio(PyironTestCase):
         # This should not raise an error, albeit the group of hdf is removed
         hdf.remove_group()
 
+    def test_session(self):
+        hdf = FileHDFio(file_name=self.current_dir + "/filehdfio_session.h5")
+        with hdf.session():
+            with hdf.open("content") as grp:
+                _write_full_hdf_content(hdf=grp)
+                self.assertTrue(grp._session.is_open, msg="Session handle not used.")
+                grp["dataframe"] = pandas.DataFrame({"a": [1, 2]})
+                self.assertEqual(grp["dataframe"]["a"].tolist(), [1, 2])
+            _check_full_hdf_values(self, hdf)
+            self.assertEqual(hdf["content"].list_groups(), ["group"])
+            self.assertIn("dataframe", hdf["content"].list_nodes())
+            session = hdf._session
+            with hdf.session(mode="r"):
+                self.assertIs(
+                    hdf._session, session, msg="Nested session should be reused."
+                )
+        self.assertIsNone(hdf._session)
+        self.assertFalse(session.is_open)
+        _check_full_hdf_values(self, hdf)
+        with hdf.session(mode="r"):
+            self.assertEqual(hdf["content/group/some_entry"], "present")
+        hdf.remove_file()
+
+    def test_session_read_only(self):
+        hdf = FileHDFio(file_name=self.current_dir + "/filehdfio_session_r.h5")
+        hdf["x"] = 1
+        with hdf.session(mode="r"):
+            self.assertEqual(hdf["x"], 1)
+            hdf["y"] = 2
+            self.assertEqual(hdf["y"], 2)
+            with hdf.session(mode="a"):
+                hdf["z"] = 3
+            hdf.create_group("group")["value"] = 4
+            del hdf["x"]
+            self.assertEqual(hdf.list_nodes(), ["y", "z"])
+        self.assertEqual(hdf["group/value"], 4)
+        hdf.remove_file()
+
+    def test_session_copy(self):
+        hdf = FileHDFio(file_name=self.current_dir + "/filehdfio_session_copy.h5")
+        with hdf.session():
+            hdf["x"] = 1
+            sub = hdf.open("group")
+            for copied in (copy.deepcopy(sub), pickle.loads(pickle.dumps(sub))):
+                self.assertIsNone(copied._session)
+                self.assertEqual(copied.h5_path, "/group")
+            self.assertTrue(hdf._session.is_open)
+        hdf.remove_file()
+
+    def test_extend(self):
+        hdf = FileHDFio(file_name=self.current_dir + "/filehdfio_extend.h5")
+        hdf.extend("content/energy", np.array([1.0, 2.0]))
+        hdf.extend("content/energy", np.array([3.0]))
+        self.assertTrue(np.array_equal(hdf["content/energy"], [1.0, 2.0, 3.0]))
+        hdf.extend("content/energy", np.array([4]))
+        self.assertEqual(hdf["content/energy"].dtype, np.dtype(float))
+        hdf.extend("content/positions", np.zeros((2, 2, 3)))
+        hdf.extend("content/positions", np.ones((1, 2, 3)))
+        self.assertEqual(hdf["content/positions"].shape, (3, 2, 3))
+        with self.subTest("ragged"):
+            hdf.extend("content/positions", [np.ones((3, 3))])
+            hdf.extend("content/positions", [np.ones((1, 3)), np.ones((2, 3))])
+            positions = hdf["content/positions"]
+            self.assertEqual(positions.dtype, np.dtype(object))
+            self.assertEqual(
+                [p.shape for p in positions],
+                [(2, 3), (2, 3), (2, 3), (3, 3), (1, 3), (2, 3)],
+            )
+        with self.subTest("not extendable"):
+            hdf["content/indices"] = np.array([1, 2])
+            hdf.extend("content/indices", np.array([3.5]))
+            self.assertTrue(np.array_equal(hdf["content/indices"], [1, 2, 3.5]))
+        hdf.remove_file()
+
     def test_ragged_array(self):
         """Should correctly identify ragged arrays/lists."""
         self.assertTrue(
@@ -648,7 +726,6 @@ class TestProjectHDFio(TestWithProject):
         #    _check_full_hdf_values(self, new_hdf, group='job_sibling')
 
     def test_import_class(self):
-
         with self.subTest("import ToyJob without interfering:"):
             toy_job_cls = self.empty_hdf5.import_class(str(BaseToyJob))
             self.assertIs(
@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
 import numpy as np
 
 from pyiron_base._tests import TestWithProject
-from pyiron_base.storage.flattenedstorage import FlattenedStorage
+from pyiron_base.storage.flattenedstorage import FlattenedStorage, _HDFArray
+from pyiron_base.storage.hdfio import open_hdf5
 
 class TestFlattenedStorage(TestWithProject):
 
@@ -146,6 +149,41 @@ class TestFlattenedStorage(TestWithProject):
         with self.assertRaises(KeyError, msg="No KeyError raised on non-existing identifier!"):
             store.find_chunk("asdf")
 
+    def test_find_chunks(self):
+        """find_chunks() should return the same indices as find_chunk() and follow changes to identifiers."""
+
+        store = FlattenedStorage()
+        store.add_chunk(2, "first", integers=[1, 2])
+        store.add_chunk(3, integers=[3, 4, 5])
+        store.add_chunk(1, "first", integers=[5])
+
+        self.assertEqual(store.find_chunks(["1", "first"]).tolist(), [1, 0],
+                         "Incorrect chunk indices returned!")
+        self.assertEqual(store.find_chunks([]).tolist(), [], "Incorrect chunk indices returned for no identifiers!")
+        with self.assertRaises(KeyError, msg="No KeyError raised on non-existing identifier!"):
+            store.find_chunks(["first", "asdf"])
+
+        store.add_chunk(2, "fourth", integers=[6, 7])
+        self.assertEqual(store.find_chunk("fourth"), 3, "Index not updated by add_chunk!")
+        store.set_array("identifier", 0, "zeroth")
+        self.assertEqual(store.find_chunks(["first", "zeroth"]).tolist(), [2, 0],
+                         "Index not updated by set_array!")
+        store._per_chunk_arrays["identifier"][1] = "second"
+        self.assertEqual(store.find_chunk("second"), 1, "Index not updated after in place change!")
+
+        other = FlattenedStorage()
+        other.add_chunk(1, "fifth", integers=[8])
+        store.extend(other)
+        self.assertEqual(store.find_chunk("fifth"), 4, "Index not updated by extend!")
+        self.assertEqual(store.split(["integers"]).find_chunk("fourth"), 3, "Index not correct after split!")
+
+        hdf = self.project.create_hdf(self.project.path, "test_find_chunks")
+        store.to_hdf(hdf)
+        read = FlattenedStorage()
+        read.from_hdf(hdf)
+        self.assertEqual(read.find_chunks(["second", "fifth"]).tolist(), [1, 4],
+                         "Index not correct after reading from HDF!")
+
     def test_add_chunk_add_array(self):
         """Adding arrays via add_chunk and add_array should be equivalent."""
 
@@ -448,6 +486,50 @@ class TestFlattenedStorage(TestWithProject):
             self.assertEqual(store.get_array("bar", i), read.get_array("bar", i),
                              "per chunk values not equal after reading from HDF!")
 
+    def test_hdf_lazy(self):
+        """Reading lazily should only read the requested chunks of per element arrays from HDF."""
+        store = FlattenedStorage(even=self.even, odd=self.odd, even_sum=self.even_sum)
+        store.add_array("label", dtype="U5", fill="none", per="element")
+        store.set_array("label", 2, ["a", "bb", "ccc"])
+        hdf = self.project.create_hdf(self.project.path, "test_lazy")
+        store.to_hdf(hdf)
+
+        read = FlattenedStorage()
+        with patch("pyiron_base.storage.flattenedstorage.open_hdf5", wraps=open_hdf5) as open_mock:
+            read.from_hdf(hdf, lazy=True)
+            self.assertIsInstance(read._get_hdf_array("even"), _HDFArray,
+                                  "Per element array read when reading lazily!")
+            self.assertTrue(np.array_equal(read.get_array("even_sum"), store.get_array("even_sum")),
+                            "Per chunk array not read correctly!")
+            self.assertEqual(read.has_array("label"), store.has_array("label"),
+                             "Array metadata not correct before reading!")
+            for i in range(len(store)):
+                self.assertTrue(np.array_equal(read["odd", i], store["odd", i]),
+                                "Per element chunk not read correctly!")
+            self.assertEqual(read["label", 2].tolist(), ["a", "bb", "ccc"],
+                             "String chunk not read correctly!")
+            sample = read.sample(lambda s, i: i != 1)
+            self.assertEqual(open_mock.call_count, 1 + len(store) + 1 + 3,
+                             "Number of file accesses not as expected!")
+        self.assertIsInstance(read._get_hdf_array("even"), _HDFArray,
+                              "Per element array loaded by sample!")
+        self.assertTrue(np.array_equal(sample["even"], [0, 6, 8, 10]),
+                        "Sample not read correctly!")
+
+        odd = read.split(["odd"])
+        self.assertFalse(odd.has_array("even"), "Array present after split!")
+        self.assertTrue(read.has_array("even"), "Array removed from original after split!")
+        self.assertIsInstance(odd._get_hdf_array("odd"), _HDFArray, "Per element array loaded by split!")
+
+        read["even", 1] = [20, 40]
+        self.assertIsNone(read._get_hdf_array("even"), "Per element array not loaded when modified!")
+        self.assertTrue(np.array_equal(read["even"], [0, 20, 40, 6, 8, 10]),
+                        "Per element array not correctly loaded!")
+        self.assertTrue(np.array_equal(read["odd"], store["odd"]),
+                        "Per element array not correctly loaded!")
+        self.assertTrue(np.array_equal(odd["odd", 2], store["odd", 2]),
+                        "Split array not read correctly!")
+
     def test_fill_value(self):
         """Test if fill values are correctly assigned when resizing an array and if self._fill_value is correctly read from hdf."""
         # Test for per chunk arrays
@@ -523,6 +605,52 @@ class TestFlattenedStorage(TestWithProject):
             self.assertEqual(store["identifier", i - 1], "i" * i * 3,
                              "Chunk identifiers not correctly resized!")
 
+    def test_add_chunks(self):
+        """add_chunks() should give the same storage as repeated calls to add_chunk()."""
+        lengths = [1, 3, 2]
+        store = FlattenedStorage()
+        for i, n in enumerate(lengths):
+            store.add_chunk(n, identifier=None if i == 1 else f"chunk{i}", energy=float(i),
+                            forces=np.full((n, 3), i), label=["x" * (i + 1)] * n)
+
+        bulk = FlattenedStorage()
+        bulk.add_chunks(lengths, identifiers=["chunk0", "1", "chunk2"], energy=[0.0, 1.0, 2.0],
+                        forces=np.concatenate([np.full((n, 3), i) for i, n in enumerate(lengths)]),
+                        label=sum((["x" * (i + 1)] * n for i, n in enumerate(lengths)), []))
+        iterated = FlattenedStorage()
+        iterated.add_chunks(
+            (dict(chunk_length=n, identifier=None if i == 1 else f"chunk{i}", energy=float(i),
+                  forces=np.full((n, 3), i), label=["x" * (i + 1)] * n) for i, n in enumerate(lengths)),
+            batch_size=2
+        )
+        for other in (bulk, iterated):
+            self.assertEqual(len(other), len(store), "Number of chunks not correct!")
+            self.assertEqual(sorted(other.list_arrays()), sorted(store.list_arrays()), "Arrays not correct!")
+            for name in store.list_arrays():
+                self.assertEqual(other.has_array(name)["per"], store.has_array(name)["per"],
+                                 f"Array {name} added with wrong per!")
+                self.assertTrue(np.array_equal(other[name], store[name]), f"Array {name} not correct!")
+            self.assertEqual(other.find_chunk("chunk2"), 2, "Identifier not found!")
+
+        bulk.add_chunk(2, energy=3.0, forces=np.zeros((2, 3)), label=["y", "y"])
+        bulk.add_chunks([1], energy=[4.0], forces=np.ones((1, 3)), label=["z"])
+        self.assertEqual(bulk["identifier"].tolist(), ["chunk0", "1", "chunk2", "3", "4"],
+                         "Default identifiers not correct!")
+        self.assertTrue(np.array_equal(bulk["forces", 4], np.ones((1, 3))), "Chunk not added after add_chunk!")
+
+        store = FlattenedStorage()
+        store.add_array("bar", fill=-1, per="element")
+        store.add_chunks([{"chunk_length": 1, "foo": 1}, {"chunk_length": 2, "foo": 2, "bar": [1, 2]}])
+        self.assertEqual(store["bar"].tolist(), [-1, 1, 2], "Fill value not used for chunk without array!")
+        self.assertEqual(store["foo"].tolist(), [1, 2], "Per chunk array not added!")
+
+        with self.assertRaises(ValueError, msg="No error on wrong array length!"):
+            store.add_chunks([1, 1], foo=[1, 2, 3])
+        with self.assertRaises(ValueError, msg="No error on wrong number of identifiers!"):
+            store.add_chunks([1, 1], identifiers=["a"])
+        with self.assertRaises(ValueError, msg="No error on arrays given outside of chunk dictionaries!"):
+            store.add_chunks([{"chunk_length": 1}], foo=[1])
+
     def test_extend(self):
         store = FlattenedStorage()
         store.add_array("foo", fill=np.nan, per="chunk")
@@ -2,6 +2,7 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+from collections import OrderedDict
 from copy import deepcopy
 import pandas
 import os
@@ -99,6 +100,51 @@ class TestGenericParameters(PyironTestCase):
             str(data_frame_all_entries.get_pandas()),
         )
 
+    def test_blocks(self):
+        gp = GenericParameters(table_name="blocks")
+        gp.load_string("units metal\nfix 1 all nve\n")
+        gp.define_blocks(
+            OrderedDict(
+                [("units", ["units"]), ("force", ["pair_style"]), ("fix", ["fix", "run"])]
+            )
+        )
+        gp.set(pair_style="eam")
+        gp.set(run=10)
+        gp.set(units___2="real")
+        gp.set(pair_coeff="* *")
+        self.assertEqual(
+            gp.keys(),
+            ["units", "units___2", "pair_style", "fix", "run", "pair_coeff"],
+        )
+        self.assertEqual(gp["run"], 10)
+        gp.remove_keys(["units___2", "fix"])
+        gp.set(fix___2="1 all nvt")
+        self.assertEqual(gp.keys(), ["units", "pair_style", "run", "fix___2", "pair_coeff"])
+        self.assertEqual(
+            gp.get_string_lst(),
+            [
+                "units metal\n",
+                "pair_style eam\n",
+                "run 10\n",
+                "fix 2 1 all nvt\n",
+                "pair_coeff * *\n",
+            ],
+        )
+
+    def test_duplicate_keys(self):
+        gp = GenericParameters(table_name="duplicates")
+        gp.load_string("a 1\na 2\nb 1e-3\n")
+        self.assertEqual(gp.get("b"), 0.001)
+        with self.assertRaises(ValueError):
+            gp.get("a")
+        self.assertEqual(gp.get_string_lst(), ["a 1\n", "a 2\n", "b 1e-3\n"])
+        gp.remove_keys(["a"])
+        self.assertEqual(gp.get_string_lst(), ["b 0.001\n"])
+        gp._dataset["Parameter"].append("c")
+        gp._dataset["Value"].append("3")
+        gp._dataset["Comment"].append("")
+        self.assertEqual(gp.get("c"), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,141 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import datetime
+import os
+import unittest
+import h5io
+import h5py
+import numpy as np
+import pandas
+from pyiron_base.storage.h5io_codec import (
+    H5ioFallback,
+    read_from_store,
+    write_to_store,
+)
+from pyiron_base._tests import PyironTestCase
+
+
+def _assert_equal(test, a, b):
+    test.assertEqual(type(a), type(b))
+    if isinstance(a, dict):
+        test.assertEqual(a.keys(), b.keys())
+        for k in a:
+            _assert_equal(test, a[k], b[k])
+    elif isinstance(a, (list, tuple)):
+        test.assertEqual(len(a), len(b))
+        for x, y in zip(a, b):
+            _assert_equal(test, x, y)
+    elif isinstance(a, np.ndarray):
+        test.assertEqual(a.dtype, b.dtype)
+        test.assertEqual(a.shape, b.shape)
+        for x, y in zip(a.ravel(), b.ravel()):
+            test.assertTrue(np.array_equal(x, y))
+    else:
+        test.assertEqual(a, b)
+
+
+class TestH5ioCodec(PyironTestCase):
+    """
+    The codec has to produce and understand exactly the layout of the h5io version pinned in setup.py, so every
+    supported type is written by one implementation and read by the other.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.file_name = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "h5io_codec.h5"
+        )
+        cls.data = {
+            "int": 1,
+            "float": 1.5,
+            "none": None,
+            "str": "hällo",
+            "datetime": datetime.datetime(2020, 1, 2, 3, 4, 5),
+            "timezone": datetime.timezone.utc,
+            "np_int64": np.int64(3),
+            "np_float32": np.float32(2.5),
+            "ndarray": np.arange(6).reshape(2, 3),
+            "multiarray": np.array([np.ones((2, 3)), np.zeros((1, 3))], dtype=object),
+            "dict": {"a": 1, "b": {"c": [1, "x"]}},
+            "list": [1, 2.0, [3, None]],
+            "tuple": (1, "a"),
+            "nested": {"list": [{"array": np.ones(3)}, (np.int64(1),)]},
+        }
+
+    def tearDown(self):
+        if os.path.exists(self.file_name):
+            os.remove(self.file_name)
+
+    def test_h5io_version(self):
+        self.assertEqual(
+            h5io.__version__,
+            "0.1.7",
+            msg="h5io was updated, check that its layout still matches pyiron_base.storage.h5io_codec",
+        )
+
+    def test_write_read_by_h5io(self):
+        for use_json in (False, True):
+            for key, value in self.data.items():
+                with self.subTest(key=key, use_json=use_json):
+                    with h5py.File(self.file_name, "a") as store:
+                        write_to_store(store, value, title="/" + key, use_json=use_json)
+                    _assert_equal(
+                        self, h5io.read_hdf5(self.file_name, title="/" + key), value
+                    )
+
+    def test_read_written_by_h5io(self):
+        for use_json in (False, True):
+            for key, value in self.data.items():
+                with self.subTest(key=key, use_json=use_json):
+                    h5io.write_hdf5(
+                        self.file_name,
+                        value,
+                        title="/" + key,
+                        overwrite="update",
+                        use_json=use_json,
+                    )
+                    with h5py.File(self.file_name, "r") as store:
+                        _assert_equal(
+                            self, read_from_store(store, title="/" + key), value
+                        )
+
+    def test_overwrite(self):
+        with h5py.File(self.file_name, "a") as store:
+            write_to_store(store, {"a": 1}, title="/value")
+            write_to_store(store, [1, 2], title="/value")
+            self.assertEqual(read_from_store(store, title="/value"), [1, 2])
+
+    def test_errors(self):
+        with h5py.File(self.file_name, "a") as store:
+            store.create_group("plain")
+            with self.assertRaises(ValueError):
+                read_from_store(store, title="/missing")
+            with self.assertRaises(ValueError):
+                read_from_store(store, title="/plain")
+            with self.assertRaises(ValueError):
+                write_to_store(store, {"a/b": 1}, title="/slash")
+            with self.assertRaises(TypeError):
+                write_to_store(store, {1: 1}, title="/key")
+            with self.assertRaises(TypeError):
+                write_to_store(store, object(), title="/object")
+
+    def test_pandas_fallback(self):
+        df = pandas.DataFrame({"a": [1, 2]})
+        for value in (df, {"table": df}, [1, {"table": df}]):
+            with self.subTest(value=type(value)):
+                with h5py.File(self.file_name, "a") as store:
+                    with self.assertRaises(H5ioFallback):
+                        write_to_store(store, value, title="/pandas")
+                h5io.write_hdf5(
+                    self.file_name, value, title="/pandas", overwrite="update"
+                )
+                with h5py.File(self.file_name, "r") as store:
+                    with self.assertRaises(H5ioFallback):
+                        read_from_store(store, title="/pandas")
+
+
+if __name__ == "__main__":
+    unittest.main()
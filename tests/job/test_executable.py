@@ -2,7 +2,12 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+import os
+import tempfile
 import unittest
+import unittest.mock
+
+from pyiron_base.jobs.job.extension.executable import Executable, resource_index
 
 # class TestExecutable(PyironTestCase):
 #     def setUp(self):
@@ -67,5 +72,60 @@ import unittest
 #                          '../../../../static/bin_cmmc/vasp/run_vasp_5.4_mpi.sh')
 
 
+
+class TestResourceIndex(unittest.TestCase):
+    def setUp(self):
+        self.resource_path = tempfile.mkdtemp()
+        self.bin_path = os.path.join(self.resource_path, "toy", "bin")
+        os.makedirs(self.bin_path)
+        for version in ["1.0", "2.0_default", "2.0_mpi"]:
+            self._add_run_script(version)
+        resource_index.refresh()
+
+    def tearDown(self):
+        for file_name in os.listdir(self.bin_path):
+            os.remove(os.path.join(self.bin_path, file_name))
+        os.removedirs(self.bin_path)
+
+    def _add_run_script(self, version):
+        with open(os.path.join(self.bin_path, "run_toy_" + version + ".sh"), "w") as f:
+            f.write("#!/bin/bash\n")
+
+    def _create_executable(self):
+        return Executable(
+            codename="Toy",
+            module="toy",
+            path_binary_codes=[self.resource_path],
+            overwrite_nt_flag=True,
+        )
+
+    def test_listing_is_cached(self):
+        exe = self._create_executable()
+        self.assertEqual(exe.available_versions, ["1.0", "2.0_default", "2.0_mpi"])
+        self.assertEqual(exe.version, "2.0_default")
+        with unittest.mock.patch("os.listdir", wraps=os.listdir) as listdir_mock:
+            for _ in range(10):
+                exe = self._create_executable()
+            self.assertEqual(listdir_mock.call_count, 0)
+            self.assertEqual(
+                exe.executable_path,
+                os.path.join(self.bin_path, "run_toy_2.0_default.sh"),
+            )
+
+    def test_update(self):
+        self._create_executable()
+        self._add_run_script("3.0")
+        # make sure the modification time changes on file systems with a coarse resolution
+        os.utime(self.bin_path, ns=(0, 0))
+        self.assertIn("3.0", self._create_executable().available_versions)
+        with unittest.mock.patch.object(
+            resource_index, "_get_mtime", return_value=0
+        ):
+            self._add_run_script("4.0")
+            self.assertNotIn("4.0", self._create_executable().available_versions)
+            resource_index.refresh()
+            self.assertIn("4.0", self._create_executable().available_versions)
+
+
 if __name__ == "__main__":
     unittest.main()
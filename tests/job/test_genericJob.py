@@ -3,9 +3,11 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import unittest
+import unittest.mock
 import os
 from pyiron_base.storage.parameters import GenericParameters
 from pyiron_base.jobs.job.generic import GenericJob
+from pyiron_base.storage.hdfio import open_hdf5
 from pyiron_base._tests import TestWithFilledProject, ToyJob
 
 
@@ -443,6 +445,30 @@ class TestGenericJob(TestWithFilledProject):
         self.assertEqual(len(wd_files), 1, "Only one zipped file should be present in the working directory")
         self.assertEqual(wd_files[0], f"{job.name}.tar.bz2", "Inconsistent name for the zipped file")
 
+    def test_metadata_cache(self):
+        job = self.project.inspect(self.project.get_job_ids()[0])
+        with unittest.mock.patch(
+            "pyiron_base.jobs.job.core.open_hdf5", wraps=open_hdf5
+        ) as open_mock:
+            self.assertEqual(job["status"], "finished")
+            self.assertEqual(job["storage/input__index_0/data_in"], 100)
+            self.assertIsNone(job["no/such/node"])
+            self.assertEqual(open_mock.call_count, 1, "HDF5 node tree should be read once")
+            job["user/cache"] = 1
+            self.assertEqual(job["user/cache"], 1)
+            self.assertEqual(open_mock.call_count, 2, "HDF5 node tree should be read again after writing")
+        with unittest.mock.patch("os.listdir", wraps=os.listdir) as listdir_mock:
+            file_lst = job.list_files()
+            self.assertEqual(job.list_files(), file_lst)
+            self.assertEqual(listdir_mock.call_count, 0, "Listing should be cached by the item access above")
+            with open(os.path.join(job.working_directory, "cache.txt"), "w") as f:
+                f.write("cache")
+            self.assertEqual(sorted(job.list_files()), sorted(file_lst + ["cache.txt"]))
+            self.assertEqual(job["cache.txt"], ["cache"])
+            self.assertEqual(listdir_mock.call_count, 1)
+        os.remove(os.path.join(job.working_directory, "cache.txt"))
+        del job["user/cache"]
+
     def test_restart(self):
         wd_warn_key = "write_work_dir_warnings"
         previous_wd_warn_setting = self.project.state.settings.configuration[
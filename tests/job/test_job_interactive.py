@@ -3,6 +3,7 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import unittest
+import numpy as np
 from pyiron_base.jobs.job.interactive import InteractiveBase
 from pyiron_base._tests import TestWithProject
 
@@ -20,3 +21,16 @@ class TestJobInteractive(TestWithProject):
         with job.interactive_open() as job_int:
             job_int.to_hdf()
         self.assertTrue(job.server.run_mode.interactive)
+
+    def test_interactive_flush(self):
+        job = self.project.create_job(InteractiveBase, "job_flush")
+        job.interactive_cache = {"energy": [1.0, 2.0], "positions": [np.zeros((2, 3))]}
+        job.interactive_flush()
+        job.interactive_cache = {"energy": [3.0], "positions": [np.ones((3, 3))]}
+        job.interactive_flush()
+        self.assertTrue(
+            np.array_equal(job["output/interactive/energy"], [1.0, 2.0, 3.0])
+        )
+        self.assertEqual(
+            [p.shape for p in job["output/interactive/positions"]], [(2, 3), (3, 3)]
+        )
@@ -9,7 +9,7 @@ class TestWorker(TestWithCleanProject):
         super().setUpClass()
         cls.script_path = os.path.join(cls.project.path, "funct.py")
         with open(cls.script_path, "w") as f:
-            f.write("print(\"Hello\")")
+            f.write('print("Hello")')
         cls.project.remove_jobs(recursive=True, silently=True)
         cls.sub_project = cls.project.open("sub")
 
@@ -28,3 +28,46 @@ class TestWorker(TestWithCleanProject):
         df = self.sub_project.job_table()
         self.assertEqual(len(df[df.status == "finished"]), 1)
         time.sleep(10)  # Wait for the worker process to finish
+
+    def test_executor(self):
+        worker = self.project.create.job.WorkerJob("runner_executor")
+        self.assertEqual(worker.executor, "fork")
+        worker.executor = "subprocess"
+        self.assertEqual(worker.input.executor, "subprocess")
+        with self.assertRaises(ValueError):
+            worker.executor = "thread"
+        del worker.input["executor"]
+        self.assertEqual(worker.executor, "subprocess", "Workers without executor start a new interpreter")
+
+    def test_get_child_table(self):
+        worker = self.project.create.job.WorkerJob("runner_table")
+        worker.save()
+        job_lst = []
+        for i, pr in enumerate([self.sub_project, self.project.open("other")]):
+            job = pr.create.job.ScriptJob("script_table_" + str(i))
+            job.script_path = self.script_path
+            job.master_id = worker.job_id
+            job.save()
+            job.status.submitted = True
+            job_lst.append(job)
+        df = worker._get_child_table(
+            pr=self.sub_project, master_id=worker.job_id, status="submitted"
+        )
+        self.assertEqual(df.id.values.tolist(), [job_lst[0].job_id])
+        self.assertEqual(df.project.values.tolist(), [self.sub_project.project_path])
+        self.assertEqual(
+            len(
+                worker._get_child_table(
+                    pr=self.project, master_id=worker.job_id, status="submitted"
+                )
+            ),
+            2,
+        )
+        self.assertEqual(
+            len(
+                worker._get_child_table(
+                    pr=self.project, master_id=worker.job_id, status="running"
+                )
+            ),
+            0,
+        )
@@ -2,7 +2,9 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+import multiprocessing
 import unittest
+import unittest.mock
 from pyiron_base import JobGenerator, ParallelMaster
 from pyiron_base._tests import TestWithProject, ToyJob
 
@@ -77,6 +79,156 @@ class TestParallelMaster(TestWithProject):
         self.assertFalse(self.master_toy.convergence_check())
         self.assertTrue(self.master_toy.status.not_converged)
 
+    def test_modal_master_non_modal_children(self):
+        master = self.project.create_job(TestMaster, "master_forked")
+        master.ref_job = self.project.create_job(ToyJob, "ref")
+        master.ref_job.server.run_mode.non_modal = True
+        master.server.cores = 2
+        if "fork" in multiprocessing.get_all_start_methods():
+            with unittest.mock.patch.object(
+                TestMaster, "_run_child_jobs_pool", side_effect=AssertionError
+            ):
+                master.run()
+        else:
+            master.run()
+        self.assertTrue(master.status.finished)
+        self.assertEqual(len(master.child_ids), TestGenerator.test_length)
+        for job_id in master.child_ids:
+            self.assertEqual(self.project.db.get_job_status(job_id), "finished")
+        child_id_dict = master._get_child_job_ids()
+        self.assertEqual(sorted(child_id_dict.values()), sorted(master.child_ids))
+        self.assertEqual(child_id_dict["test_3"], master["test_3"].job_id)
+        self.assertEqual(master["test_3"].output.data_out, 101)
+
+    def test_modal_master_non_modal_children_pool(self):
+        master = self.project.create_job(TestMaster, "master_pool")
+        master.ref_job = self.project.create_job(ToyJob, "ref")
+        master.ref_job.server.run_mode.non_modal = True
+        master.server.cores = 2
+        with unittest.mock.patch.object(
+            TestMaster, "_run_child_jobs_pipelined", side_effect=AssertionError
+        ), unittest.mock.patch(
+            "multiprocessing.get_all_start_methods", return_value=["spawn"]
+        ):
+            master.run()
+        self.assertTrue(master.status.finished)
+        self.assertEqual(
+            master.get_child_status_counts(), {"finished": TestGenerator.test_length}
+        )
+        self.assertEqual(master["test_3"].output.data_out, 101)
+
+    def test_is_finished(self):
+        master = self.project.create_job(TestMaster, "master_is_finished")
+        master.ref_job = self.project.create_job(ToyJob, "ref")
+        master.run()
+        self.assertEqual(
+            master.get_child_status_counts(), {"finished": TestGenerator.test_length}
+        )
+        master.status.collect = True
+        child_ids = master.child_ids
+        with unittest.mock.patch.object(
+            master.project.db, "get_job_status", wraps=master.project.db.get_job_status
+        ) as status_mock:
+            self.assertTrue(master.is_finished())
+            self.project.db.set_job_status(status="submitted", job_id=child_ids[0])
+            self.assertFalse(master.is_finished())
+            self.assertEqual(
+                master.get_child_status_counts(),
+                {"finished": TestGenerator.test_length - 1, "submitted": 1},
+            )
+            self.assertEqual(
+                [
+                    c
+                    for c in status_mock.call_args_list
+                    if master.job_id not in c.args + tuple(c.kwargs.values())
+                ],
+                [],
+                "Child states are counted in bulk",
+            )
+
+    def test_child_index(self):
+        master = self.project.create_job(TestMaster, "master_index")
+        master.ref_job = self.project.create_job(ToyJob, "ref")
+        master.run()
+        child_index = master.project_hdf5["child_index"]
+        self.assertEqual(len(child_index), TestGenerator.test_length)
+        self.assertEqual(
+            sorted(job_id for job_id, _ in child_index.values()),
+            sorted(master.child_ids),
+        )
+        self.assertEqual(child_index["test_3"][1], 3)
+        reloaded = self.project.create_job(TestMaster, "master_index")
+        reloaded.from_hdf()
+        with unittest.mock.patch.object(
+            reloaded.project.db, "get_items_dict", wraps=reloaded.project.db.get_items_dict
+        ) as query_mock, unittest.mock.patch.object(
+            reloaded.project.db, "get_item_by_id", wraps=reloaded.project.db.get_item_by_id
+        ) as item_mock:
+            self.assertEqual(
+                reloaded._get_jobs_sorted(),
+                ["test_" + str(i) for i in range(TestGenerator.test_length)],
+            )
+            self.assertEqual(reloaded["test_3"].job_id, child_index["test_3"][0])
+            self.assertEqual(reloaded["test_3/status"], "finished")
+            self.assertEqual(
+                [
+                    c
+                    for c in query_mock.call_args_list
+                    if c.args[0].get("job") != "test_3"
+                ],
+                [],
+                "Child jobs are found by the index",
+            )
+            self.assertEqual(
+                [
+                    c
+                    for c in item_mock.call_args_list
+                    if child_index["test_3"][0] not in c.args + tuple(c.kwargs.values())
+                ],
+                [],
+                "Only the requested child job is loaded",
+            )
+        self.assertEqual(
+            [job.job_name for job in reloaded.iter_jobs(convert_to_object=False)],
+            ["test_" + str(i) for i in range(TestGenerator.test_length)],
+        )
+        reloaded._child_index = {}
+        self.assertEqual(reloaded._get_child_index(), child_index)
+
+    def test_create_child_jobs_batch(self):
+        master = self.project.create_job(TestMaster, "master_batch")
+        master.ref_job = self.project.create_job(ToyJob, "ref")
+        master.save()
+        with unittest.mock.patch.object(
+            master.project.db, "get_items_dict", wraps=master.project.db.get_items_dict
+        ) as query_mock, unittest.mock.patch.object(
+            ToyJob, "to_hdf", autospec=True, side_effect=ToyJob.to_hdf
+        ) as to_hdf_mock:
+            with master._create_child_jobs_batch():
+                job_lst = [master.create_child_job("batch_" + str(i)) for i in range(5)]
+            self.assertEqual(
+                [
+                    c
+                    for c in query_mock.call_args_list
+                    if c.args[0].get("job", "").startswith("batch_")
+                ],
+                [],
+                "Existing children are queried once for all children",
+            )
+            self.assertEqual(to_hdf_mock.call_count, 1, "The reference job is stored once")
+        self.assertIsNone(master._child_id_dict)
+        for i, job in enumerate(job_lst):
+            self.assertEqual(job.job_name, "batch_" + str(i))
+            self.assertEqual(job.input["data_in"], 100)
+            self.assertEqual(job.master_id, master.job_id)
+            job.input["data_in"] = i
+        master._save_child_jobs(job_lst=job_lst)
+        for i, job in enumerate(job_lst):
+            self.assertEqual(self.project.db.get_job_status(job.job_id), "created")
+            self.assertEqual(self.project.load(job.job_id).input["data_in"], i)
+        with master._create_child_jobs_batch():
+            self.assertEqual(master.create_child_job("batch_2").job_id, job_lst[2].job_id)
+
 
 if __name__ == "__main__":
     unittest.main()
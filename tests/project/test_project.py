@@ -3,13 +3,16 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import unittest
+import unittest.mock
 from os.path import dirname, join, abspath, exists, islink
 import os
 import tempfile
 import pint
-from pyiron_base.project.generic import Project
+import pandas
+from pyiron_base.project.generic import Project, _prefetch
 from pyiron_base._tests import PyironTestCase, TestWithProject, TestWithFilledProject, ToyJob
 from pyiron_base.jobs.job.toolkit import BaseTools
+from pyiron_base.state import state
 
 
 class TestProjectData(PyironTestCase):
@@ -123,6 +126,35 @@ class TestProjectOperations(TestWithFilledProject):
         self.assertIsInstance([val for val in self.project.iter_jobs(recursive=True, status="suspended",
                                                                      convert_to_object=True)][0], ToyJob)
 
+    def test_iter_jobs_prefetch(self):
+        df = self.project.job_table(recursive=True)
+        job_id_lst = list(df.id)
+        with unittest.mock.patch.object(
+            self.project.db, "get_item_by_id", side_effect=AssertionError("No single job queries expected.")
+        ):
+            job_lst = list(self.project.iter_jobs(recursive=True, convert_to_object=False, progress=False))
+            self.assertEqual([job.id for job in job_lst], job_id_lst)
+            self.assertEqual([job.job_name for job in job_lst], list(df.job))
+            self.assertEqual([str(job.status) for job in job_lst], list(df.status))
+            self.assertEqual(
+                list(self.project.iter_jobs(recursive=True, path="status", prefetch=2, progress=False)),
+                [job["status"] for job in job_lst]
+            )
+        job_lst = list(self.project.iter_jobs(recursive=True, prefetch=1, progress=False))
+        self.assertEqual([job.job_id for job in job_lst], job_id_lst)
+        self.assertTrue(all(isinstance(job, ToyJob) for job in job_lst))
+
+        def raise_after_two():
+            yield 1
+            yield 2
+            raise ValueError()
+
+        item_lst = []
+        with self.assertRaises(ValueError):
+            for item in _prefetch(iterable=raise_after_two(), size=1):
+                item_lst.append(item)
+        self.assertEqual(item_lst, [1, 2])
+
     def test_maintenance_get_repository_status(self):
         df = self.project.maintenance.get_repository_status()
         self.assertIn('pyiron_base', df.Module.values)
@@ -181,6 +213,71 @@ class TestProjectSymlink(TestWithFilledProject):
             self.fail(f"unlinking twice should have no effect, but raised {e}!")
 
 
+class TestRefreshJobStatus(TestWithProject):
+    def test_refresh_job_status(self):
+        job_lst = []
+        for i, run_mode in enumerate(["queue", "queue", "queue", "non_modal", "queue"]):
+            job = self.project.create_job(ToyJob, f"refresh_{i}")
+            job.server.run_mode = run_mode if run_mode != "queue" else "manual"
+            job.save()
+            if run_mode == "queue":
+                job.server.run_mode.queue = True
+                job.server.queue_id = 100 + i
+                job.server.to_hdf(job.project_hdf5)
+            job_lst.append(job)
+        for job in job_lst:
+            self.project.db.set_job_status(job_id=job.job_id, status="running")
+        queue_adapter = unittest.mock.MagicMock()
+        queue_adapter.get_status_of_my_jobs.return_value = pandas.DataFrame(
+            {
+                "jobid": [100, 101, 102],
+                "user": ["pyiron"] * 3,
+                "jobname": [f"pi_{job_lst[0].job_id}", "other", "other"],
+                "status": ["running", "pending", "error"],
+                "working_directory": ["/", "/", job_lst[2].working_directory],
+            }
+        )
+        with unittest.mock.patch.object(
+            type(state), "queue_adapter", new_callable=unittest.mock.PropertyMock, return_value=queue_adapter
+        ):
+            self.project.refresh_job_status()
+        queue_adapter.get_status_of_my_jobs.assert_called_once()
+        self.assertEqual(
+            [self.project.db.get_job_status(job.job_id) for job in job_lst],
+            ["running", "running", "aborted", "running", "aborted"],
+        )
+        self.project.remove_jobs(recursive=True, silently=True)
+
+
+class TestCompressJobs(TestWithProject):
+    def test_compress_jobs(self):
+        job_lst = []
+        for i in range(3):
+            job = self.project.create_job(ToyJob, f"compress_{i}")
+            job.run()
+            job_lst.append(job)
+        self.project.db.set_job_status(job_id=job_lst[2].job_id, status="aborted")
+        self.project.decompress_jobs(cores=2)
+        for job in job_lst:
+            self.assertFalse(job.is_compressed())
+            self.assertIn("input.yml", os.listdir(job.working_directory))
+        self.project.compress_jobs(codec="gzip", cores=2)
+        for job in job_lst[:2]:
+            self.assertTrue(job.is_compressed())
+            self.assertEqual(os.listdir(job.working_directory), [job.job_name + ".tar.gz"])
+        self.assertFalse(job_lst[2].is_compressed(), "Only finished jobs are compressed")
+        job_lst[2].compress(codec="xz")
+        self.assertEqual(
+            os.listdir(job_lst[2].working_directory), [job_lst[2].job_name + ".tar.xz"]
+        )
+        self.project.decompress_jobs(cores=1)
+        for job in job_lst:
+            self.assertFalse(job.is_compressed())
+            self.assertIn("input.yml", os.listdir(job.working_directory))
+        self.assertRaises(ValueError, job_lst[2].compress, codec="lzma")
+        self.project.remove_jobs(recursive=True, silently=True)
+
+
 class TestToolRegistration(TestWithProject):
     def setUp(self) -> None:
         self.tools = BaseTools(self.project)
@@ -52,6 +52,52 @@ class TestProjectData(TestWithProject):
         self.assertTrue(isinstance(df.array[0], np.ndarray),
                         "Numpy values not read correctly.")
 
+    def test_parallel(self):
+        """Tables computed in a process pool should match the serial result."""
+        table = self.project.create.table('test_table_parallel')
+        table.server.cores = 2
+        table.filter_function = lambda j: j.name in ["test_a", "test_b", "test_c"]
+        table.add['name'] = lambda j: j.name
+        table.add['status'] = lambda j: str(j.status)
+        table.run()
+        df = table.get_dataframe()
+        self.assertEqual(["test_a", "test_b", "test_c"], df.name.to_list())
+        self.assertEqual(["finished"] * 3, df.status.to_list())
+        table.add['hex'] = lambda j: int(j.name[-1] if j.name != "test_b" else "x", 16)
+        table.add['upper'] = lambda j: j.name.upper()
+        table.update_table()
+        df = table.get_dataframe()
+        self.assertEqual(["TEST_A", "TEST_B", "TEST_C"], df.upper.to_list())
+        self.assertEqual([False, True, False], df.hex.isnull().to_list(), "Failed functions should map to None.")
+        self.project.remove_job(table.name)
+
+    def test_from_hdf(self):
+        """Columns read directly from HDF5 should match the values accessed through the jobs."""
+        table = self.project.create.table('test_table_hdf')
+        table.db_filter_function = lambda df: df.hamilton == "ToyJob"
+        table.add.from_hdf('status', 'status')
+        table.add.from_hdf('name_length', 'NAME', reduce='len')
+        table.add.from_hdf('missing', 'output/does_not_exist', reduce='last')
+        self.assertTrue(table.pyiron_table._is_hdf_only(table.add._function_lst))
+        table.run()
+        df = table.get_dataframe()
+        self.assertEqual(4, len(df))
+        self.assertEqual(["finished"] * 4, df.status.to_list())
+        self.assertEqual([len("ToyJob")] * 4, df.name_length.to_list())
+        self.assertTrue(df.missing.isnull().all())
+        self.assertEqual(
+            [self.project.inspect(f"test_{c}").job_id for c in "abcd"], df.job_id.to_list()
+        )
+        table.add.from_hdf('job_id_max', 'job_id', reduce='max')
+        table.add['name'] = lambda j: j.name
+        table.update_table()
+        df = table.get_dataframe()
+        self.assertEqual(df.job_id.to_list(), df.job_id_max.to_list())
+        self.assertEqual([f"test_{c}" for c in "abcd"], df.name.to_list())
+        with self.assertRaises(ValueError):
+            table.add.from_hdf('energy', 'output/energy', reduce='median')
+        self.project.remove_job(table.name)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pyiron_base.utils.parser import Logstatus, extract_data_from_file
+
+
+DUMP = """ITEM: TIMESTEP
+0
+ITEM: NUMBER OF ATOMS
+2
+ITEM: ATOMS id type x y z
+1 1 0.0 0.0 0.0
+2 1 1.5 1.5 1.5
+ITEM: TIMESTEP
+10
+ITEM: NUMBER OF ATOMS
+2
+ITEM: ATOMS id type x y z
+1 1 0.1 0.0 0.0
+2 1 1.5 1.6 1.5
+ITEM: ENERGY
+-1.0 -2
+3 4
+END
+"""
+
+TAG_DICT = {
+    "ITEM: TIMESTEP": {"arg": "0", "rows": 1, "h5": "steps"},
+    "ITEM: NUMBER OF ATOMS": {"arg": "0", "rows": 1, "h5": "num_atoms"},
+    "ITEM: ATOMS": {"arg": ":,:", "rows": 2, "splitArg": True},
+    "ITEM: ENERGY": {"arg": ":,:", "rows": "END", "h5": "energy"},
+}
+
+H5_DICT = {"id": "id", "type": "type", "x": "x", "y": "y", "z": "z"}
+
+
+class TestLogstatus(unittest.TestCase):
+    def setUp(self):
+        self.file_name = os.path.join(tempfile.mkdtemp(), "dump.out")
+        with open(self.file_name, "w") as f:
+            f.write(DUMP)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+        os.rmdir(os.path.dirname(self.file_name))
+
+    def test_extract_file(self):
+        log = Logstatus()
+        log.extract_file(
+            file_name=self.file_name, tag_dict=TAG_DICT.copy(), h5_dict=H5_DICT
+        )
+        self.assertEqual([val for _, val in log.status_dict["steps"]], [0, 10])
+        self.assertEqual([val for _, val in log.status_dict["num_atoms"]], [2, 2])
+        self.assertEqual(log.status_dict["id"][0][1].tolist(), [1, 2])
+        self.assertEqual(log.status_dict["x"][1][1].dtype, np.dtype(float))
+        self.assertEqual(log.status_dict["x"][1][1].tolist(), [0.1, 1.5])
+        energy = log.status_dict["energy"][0][1]
+        self.assertEqual(energy.dtype, np.dtype(float))
+        self.assertEqual(energy.tolist(), [[-1.0, -2.0], [3.0, 4.0]])
+
+    def test_extract_from_list(self):
+        log_file = Logstatus()
+        log_file.extract_file(
+            file_name=self.file_name, tag_dict=TAG_DICT.copy(), h5_dict=H5_DICT
+        )
+        log_lst = Logstatus()
+        log_lst.extract_from_list(
+            list_of_lines=DUMP.splitlines(keepends=True),
+            tag_dict=TAG_DICT.copy(),
+            h5_dict=H5_DICT,
+        )
+        self.assertEqual(log_file.status_dict.keys(), log_lst.status_dict.keys())
+        for key in log_file.status_dict.keys():
+            for (_, val_file), (_, val_lst) in zip(
+                log_file.status_dict[key], log_lst.status_dict[key]
+            ):
+                self.assertTrue(np.array_equal(val_file, val_lst))
+
+    def test_literal_fallback(self):
+        log = Logstatus()
+        log.extract_from_list(
+            list_of_lines=["ITEM: FLAGS\n", "True False\n", "END\n"],
+            tag_dict={"ITEM: FLAGS": {"arg": ":,:", "rows": "END", "h5": "flags"}},
+        )
+        self.assertEqual(log.status_dict["flags"][0][1].tolist(), [[True, False]])
+        log.extract_from_list(
+            list_of_lines=["ITEM: STEPS\n", "1 2\n", "3 4\n", "END\n"],
+            tag_dict={"ITEM: STEPS": {"arg": ":,:", "rows": "END", "h5": "steps"}},
+        )
+        self.assertEqual(log.status_dict["steps"][0][1].dtype, np.dtype(int))
+
+    def test_extract_data_from_file(self):
+        self.assertEqual(
+            extract_data_from_file(file_name=self.file_name, tag="ITEM: ATOMS", num_args=2),
+            [["id", "type"]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()